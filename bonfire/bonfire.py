@@ -5,11 +5,8 @@ import logging
 import sys
 import warnings
 from functools import wraps
-import truststore
 
 import click
-from ocviapy import apply_config, get_current_namespace, StatusError
-from wait_for import TimedOutError
 
 from bonfire.output import (
     configure_logging,
@@ -28,34 +25,6 @@ import bonfire.config as conf
 from bonfire.elastic_logging import ElasticLogger
 from bonfire.local import get_local_apps, get_appsfile_apps
 from bonfire.utils import AppOrComponentSelector, RepoFile, SYNTAX_ERR
-from bonfire.namespaces import (
-    Namespace,
-    extend_namespace,
-    get_namespaces,
-    release_reservation,
-    reserve_namespace,
-    describe_namespace,
-)
-from bonfire.openshift import (
-    check_for_existing_reservation,
-    find_clowd_env_for_ns,
-    get_namespace_pools,
-    get_reservation,
-    has_clowder,
-    has_ns_operator,
-    wait_for_all_resources,
-    wait_for_clowd_env_target_ns,
-    wait_for_db_resources,
-    wait_on_cji,
-    whoami,
-    get_pool_size_limit,
-    get_reserved_namespace_quantity,
-    log_namespace_events,
-)
-from bonfire.processor import TemplateProcessor, process_clowd_env, process_iqe_cji
-from bonfire.qontract import get_apps_for_env, get_base_namespace_for_env, sub_refs
-from bonfire.secrets import import_secrets_from_dir
-from bonfire.configmaps import import_configmaps_from_dir
 from bonfire.utils import (
     FatalError,
     check_pypi,
@@ -64,8 +33,15 @@ from bonfire.utils import (
     split_equals,
     validate_time_string,
     merge_app_configs,
+    preflight_url_connections,
+    GH_API_URL,
+    GH_RAW_URL,
+    GL_RAW_URL,
 )
 
+# ocviapy, kubernetes, gql and friends are slow to import and most commands only need a few
+# of them, so command implementations import what they use from bonfire.namespaces,
+# bonfire.openshift, bonfire.processor and bonfire.qontract when they run.
 
 log = logging.getLogger(__name__)
 es_telemetry = ElasticLogger()
@@ -100,6 +76,8 @@ def _error(msg):
 
 
 def current_namespace_or_error():
+    from ocviapy import get_current_namespace
+
     log.info("attempting to use current namespace from oc/kubectl context...")
     namespace = get_current_namespace()
     if not namespace:
@@ -119,9 +97,14 @@ def click_exception_wrapper(command):
                 return result
             except KeyboardInterrupt:
                 _error(f"{command}: aborted by keyboard interrupt")
-            except (TimedOutError, FatalError, StatusError) as err:
+            except FatalError as err:
                 _error(f"{command}: hit error: {err}")
             except Exception as err:
+                from ocviapy import StatusError
+                from wait_for import TimedOutError
+
+                if isinstance(err, (TimedOutError, StatusError)):
+                    _error(f"{command}: hit error: {err}")
                 log.exception("hit unexpected error")
                 _error(f"{command}: hit unexpected error: {err}")
 
@@ -191,6 +174,12 @@ def pool():
     pass
 
 
+@main.group()
+def daemon():
+    """Serve bonfire commands from a warm background process"""
+    pass
+
+
 def _confirm_or_abort(msg):
     if conf.BONFIRE_BOT:
         # these types of warnings shouldn't occur in automated runs, error out immediately
@@ -228,6 +217,8 @@ def _warn_of_existing(requester):
 
 
 def _get_requester():
+    from bonfire.openshift import whoami
+
     if conf.BONFIRE_NS_REQUESTER:
         requester = conf.BONFIRE_NS_REQUESTER
     else:
@@ -240,6 +231,8 @@ def _get_requester():
 
 
 def _wait_on_namespace_resources(namespace, timeout, db_only=False, defer_status_errors=False):
+    from bonfire.namespaces import wait_for_all_resources, wait_for_db_resources
+
     if db_only:
         wait_for_db_resources(namespace, timeout, defer_status_errors)
     else:
@@ -341,7 +334,10 @@ _timeout_options = [
         "--defer-status-errors",
         is_flag=True,
         default=False,
-        help="do not exit immediately if status errors seen (e.g. ImagePullBackOff). Default: false",
+        help=(
+            "do not exit early if terminal status errors seen (e.g. ImagePullBackOff,"
+            " CrashLoopBackOff). Default: false"
+        ),
     ),
 ]
 
@@ -844,6 +840,9 @@ _iqe_cji_process_options = [
 @click.pass_context
 def _list_namespaces(ctx, available, mine, output):
     """Get list of ephemeral namespaces"""
+    from bonfire.namespaces import get_namespaces
+    from bonfire.openshift import has_ns_operator
+
     if not has_ns_operator():
         _error(NO_RESERVATION_SYS)
 
@@ -872,6 +871,22 @@ def _list_namespaces(ctx, available, mine, output):
 
 @namespace.command("reserve")
 @options(_ns_reserve_options)
+@click.option(
+    "--count",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of namespaces to reserve, e.g. one per test shard (all or none are reserved)",
+)
+@click.option(
+    "--pools",
+    type=str,
+    default=None,
+    help=(
+        "Comma-separated pools to choose from, reserves from the one expected to assign a"
+        " namespace soonest (overrides --pool)"
+    ),
+)
 @options([_local_option])
 @options(_timeout_options)
 @click.pass_context
@@ -883,6 +898,8 @@ def _cmd_namespace_reserve(
     team,
     duration,
     pool,
+    count,
+    pools,
     timeout,
     local,
     force,
@@ -890,6 +907,28 @@ def _cmd_namespace_reserve(
     defer_status_errors,
 ):
     """Reserve an ephemeral namespace"""
+    from bonfire.namespaces import choose_pool
+
+    if pools:
+        pool = choose_pool([p.strip() for p in pools.split(",") if p.strip()], count=count)
+
+    if count > 1:
+        if name:
+            _error("--name can not be used with --count")
+        namespaces = _check_and_reserve_namespaces(
+            count,
+            requester,
+            team,
+            duration,
+            pool,
+            timeout,
+            force,
+            secrets_src_namespace=secrets_src_namespace,
+        )
+        for ns_name in namespaces:
+            click.echo(ns_name)
+        return
+
     ns = _check_and_reserve_namespace(
         name,
         requester,
@@ -917,6 +956,9 @@ def _cmd_namespace_reserve(
 @click_exception_wrapper("namespace release")
 def _cmd_namespace_release(namespace, force, local):
     """Remove reservation from an ephemeral namespace"""
+    from bonfire.namespaces import Namespace, release_reservation
+    from bonfire.openshift import has_ns_operator
+
     if not has_ns_operator():
         _error(NO_RESERVATION_SYS)
 
@@ -946,6 +988,9 @@ def _cmd_namespace_release(namespace, force, local):
 @click_exception_wrapper("namespace extend")
 def _cmd_namespace_extend(namespace, duration, local):
     """Extend a reservation of an ephemeral namespace"""
+    from bonfire.namespaces import extend_namespace
+    from bonfire.openshift import has_ns_operator
+
     if not has_ns_operator():
         _error(NO_RESERVATION_SYS)
 
@@ -966,6 +1011,9 @@ def _cmd_namespace_extend(namespace, duration, local):
 @options(_timeout_options)
 def _cmd_namespace_wait_on_resources(namespace, timeout, db_only, defer_status_errors):
     """Wait for rolled out resources to be ready in namespace"""
+    from ocviapy import StatusError
+    from wait_for import TimedOutError
+
     if not namespace:
         namespace = current_namespace_or_error()
     try:
@@ -992,6 +1040,8 @@ def _cmd_namespace_wait_on_resources(namespace, timeout, db_only, defer_status_e
 @click.pass_context
 def _describe_namespace(ctx, namespace, output):
     """Get current namespace info"""
+    from bonfire.namespaces import describe_namespace
+
     _namespace = get_namespace_from_context(ctx, namespace)
     if not _namespace:
         _namespace = current_namespace_or_error()
@@ -1010,6 +1060,8 @@ def _get_apps_config(
     local_config_method,
     preferred_params,
 ):
+    from bonfire.qontract import get_apps_for_env, sub_refs
+
     config = conf.load_config(local_config_path)
 
     if source == APP_SRE_SRC:
@@ -1057,6 +1109,8 @@ def _log_and_return(env_name):
 
 
 def _get_env_name(ns=None, env_name=None):
+    from bonfire.openshift import find_clowd_env_for_ns
+
     if env_name:
         return _log_and_return(env_name)
 
@@ -1107,6 +1161,25 @@ def _resolve_alias(ctx, app_names, local_config_path):
     return new_app_names, overrides
 
 
+def _preflight_template_connections(source):
+    """Start connectivity checks for every host used when fetching app configs and templates"""
+    urls = [GH_API_URL, GH_RAW_URL]
+    if source == APP_SRE_SRC:
+        urls.append(conf.QONTRACT_BASE_URL)
+    preflight_url_connections(urls)
+
+
+def _preflight_gitlab_connection(apps_config, app_names):
+    """Start the GitLab check (and CA cert download) if a requested app has templates there"""
+    components = [
+        component
+        for app_name in app_names
+        for component in apps_config.get(app_name, {}).get("components", [])
+    ]
+    if any(component.get("host") == "gitlab" for component in components):
+        preflight_url_connections([], cert_urls=[GL_RAW_URL])
+
+
 def _process(
     app_names,
     source,
@@ -1133,6 +1206,10 @@ def _process(
     namespace,
     exclude_components,
 ):
+    from bonfire.processor import TemplateProcessor
+
+    _preflight_template_connections(source)
+
     apps_config = _get_apps_config(
         source,
         target_env,
@@ -1142,6 +1219,7 @@ def _process(
         local_config_method,
         preferred_params,
     )
+    _preflight_gitlab_connection(apps_config, app_names)
 
     processor = TemplateProcessor(
         apps_config,
@@ -1169,6 +1247,8 @@ def _process(
 @pool.command("list")
 def _cmd_pool_types():
     """List all pool types"""
+    from bonfire.openshift import get_namespace_pools
+
     render_pool_list(get_namespace_pools())
 
 
@@ -1289,6 +1369,9 @@ def _get_namespace(
     using_current=False,
     secrets_src_namespace=None,
 ):
+    from bonfire.namespaces import Namespace
+    from bonfire.openshift import has_ns_operator
+
     if not has_ns_operator():
         if requested_ns_name:
             ns = Namespace(name=requested_ns_name)
@@ -1324,6 +1407,9 @@ def _get_namespace(
 
 
 def _check_and_use_namespace(requested_ns_name, using_current, requester):
+    from bonfire.namespaces import Namespace, get_namespace_reservation
+    from bonfire.openshift import has_ns_operator
+
     if using_current:
         log.info("attempting to use current namespace from oc/kubectl context...")
 
@@ -1331,7 +1417,7 @@ def _check_and_use_namespace(requested_ns_name, using_current, requester):
         _error(f"{NO_RESERVATION_SYS}")
 
     log.debug("checking if namespace '%s' has been reserved via ns operator...", requested_ns_name)
-    operator_reservation = get_reservation(namespace=requested_ns_name)
+    operator_reservation = get_namespace_reservation(requested_ns_name)
     ns = None
     if operator_reservation:
         log.debug("found existing ns operator reservation")
@@ -1363,29 +1449,40 @@ def _check_and_use_namespace(requested_ns_name, using_current, requester):
     return ns
 
 
-def _check_and_reserve_namespace(
-    name, requester, team, duration, pool, timeout, local, force, secrets_src_namespace=None
-):
-    if not has_ns_operator():
+def _check_reservation_preflight(requester, pool, force, count=1):
+    from bonfire.namespaces import get_reservation_preflight
+
+    preflight = get_reservation_preflight(requester, pool, check_existing=not force)
+
+    if not preflight.operator_installed:
         _error(f"{NO_RESERVATION_SYS}")
 
-    if pool not in get_namespace_pools():
+    if not preflight.pool_exists:
         _error(f"namespace pool '{pool}' does not exist on this cluster")
 
-    log.debug("checking if requester already has another namespace reserved...")
-    requester = requester if requester else _get_requester()
-    if not force and check_for_existing_reservation(requester):
+    if preflight.has_existing_reservation:
         _warn_of_existing(requester)
 
-    log.info("checking for available namespaces to reserve...")
-
-    pool_size_limit = get_pool_size_limit(pool)
-    log.info("pool size limit is defined as %d in '%s' pool", pool_size_limit, pool)
-    if pool_size_limit > 0 and get_reserved_namespace_quantity(pool) >= pool_size_limit:
+    log.info("pool size limit is defined as %d in '%s' pool", preflight.size_limit, pool)
+    if preflight.pool_full:
         _error(
-            f"Maximum number of namespaces for pool `{pool}` (limit: {pool_size_limit})"
+            f"Maximum number of namespaces for pool `{pool}` (limit: {preflight.size_limit})"
             " have been reserved"
         )
+    if not preflight.has_room_for(count):
+        _error(
+            f"Reserving {count} namespaces would exceed the limit of pool `{pool}`"
+            f" ({preflight.reserved}/{preflight.size_limit} reserved)"
+        )
+
+
+def _check_and_reserve_namespace(
+    name, requester, team, duration, pool, timeout, local, force, secrets_src_namespace=None
+):
+    from bonfire.namespaces import reserve_namespace
+
+    requester = requester if requester else _get_requester()
+    _check_reservation_preflight(requester, pool, force)
 
     with status_spinner(f"Reserving namespace from pool '{pool}'..."):
         ns = reserve_namespace(
@@ -1402,7 +1499,34 @@ def _check_and_reserve_namespace(
     return ns
 
 
+def _check_and_reserve_namespaces(
+    count, requester, team, duration, pool, timeout, force, secrets_src_namespace=None
+):
+    from bonfire.namespaces import reserve_namespaces
+
+    requester = requester if requester else _get_requester()
+    _check_reservation_preflight(requester, pool, force, count=count)
+
+    with status_spinner(f"Reserving {count} namespaces from pool '{pool}'..."):
+        namespaces = reserve_namespaces(
+            count,
+            requester,
+            duration,
+            pool,
+            timeout,
+            team,
+            secrets_src_namespace=secrets_src_namespace,
+        )
+    echo_success(f"Namespaces {', '.join(namespaces)} reserved")
+    return namespaces
+
+
 def _deploy_err_handler(err, no_release_on_fail, reserved_new_ns, reserve, ns):
+    from ocviapy import StatusError
+    from wait_for import TimedOutError
+    from bonfire.namespaces import release_reservation
+    from bonfire.openshift import log_namespace_events
+
     if isinstance(err, KeyboardInterrupt):
         msg = "keyboard interrupt"
     else:
@@ -1523,6 +1647,12 @@ def _cmd_config_deploy(
     defer_status_errors,
 ):
     """Process app templates and deploy them to a cluster"""
+    from ocviapy import apply_config, get_current_namespace
+    from bonfire.configmaps import import_configmaps_from_dir
+    from bonfire.openshift import has_clowder
+    from bonfire.qontract import get_base_namespace_for_env
+    from bonfire.secrets import import_secrets_from_dir
+
     app_names, _ov = _resolve_alias(ctx, app_names, local_config_path)
     target_env = _ov.get("target_env", target_env)
     component_filter = _ov.get("component_filter", component_filter)
@@ -1549,6 +1679,9 @@ def _cmd_config_deploy(
     duration = _ov.get("duration", duration)
     timeout = _ov.get("timeout", timeout)
 
+    # check remote hosts in the background while the cluster-side preflight runs
+    _preflight_template_connections(source)
+
     clowder_available = has_clowder()
 
     # resolve base namespace from target env if not explicitly provided
@@ -1656,6 +1789,8 @@ def _cmd_config_deploy(
 
 
 def _process_clowdenv(namespace, quay_user, clowd_env, template_file, local):
+    from bonfire.processor import process_clowd_env
+
     if not clowd_env:
         clowd_env = f"env-{namespace}"
     return process_clowd_env(namespace, quay_user, clowd_env, template_file, local)
@@ -1728,6 +1863,11 @@ def _cmd_deploy_clowdenv(
     defer_status_errors,
 ):
     """Process ClowdEnv template and deploy to a cluster"""
+    from ocviapy import apply_config
+    from bonfire.configmaps import import_configmaps_from_dir
+    from bonfire.openshift import find_clowd_env_for_ns, has_clowder, wait_for_clowd_env_target_ns
+    from bonfire.secrets import import_secrets_from_dir
+
     if not has_clowder():
         _error("cluster does not have clowder operator installed")
 
@@ -1798,6 +1938,8 @@ def _cmd_process_iqe_cji(
     custom_env_vars,
 ):
     """Process IQE ClowdJobInvocation template and print output"""
+    from bonfire.processor import process_iqe_cji
+
     cji_config = process_iqe_cji(
         clowd_app_name,
         debug,
@@ -1869,6 +2011,11 @@ def _cmd_deploy_iqe_cji(
     defer_status_errors,
 ):
     """Process IQE CJI template, apply it, and wait for it to start running."""
+    from ocviapy import apply_config
+    from bonfire.namespaces import wait_on_cji
+    from bonfire.openshift import has_clowder
+    from bonfire.processor import process_iqe_cji
+
     if not has_clowder():
         _error("cluster does not have clowder operator installed")
 
@@ -1962,6 +2109,63 @@ def _cmd_list_aliases(local_config_path):
     render_aliases(aliases)
 
 
+@daemon.command("start")
+@click.option(
+    "--idle-timeout",
+    type=click.IntRange(min=0),
+    default=3600,
+    show_default=True,
+    help="Exit after this many seconds without a command (0 to never exit)",
+)
+def _cmd_daemon_start(idle_timeout):
+    """Serve commands for the current kubeconfig context until stopped (runs in foreground)"""
+    import importlib
+
+    from bonfire.daemon import serve
+    from bonfire.utils import use_truststore
+
+    # import everything the commands use once, up front
+    for module in (
+        "bonfire.namespaces",
+        "bonfire.openshift",
+        "bonfire.processor",
+        "bonfire.qontract",
+    ):
+        importlib.import_module(module)
+    use_truststore()
+
+    def run():
+        # each command reports its own arguments and start time
+        es_telemetry.reset()
+        _run_cli()
+
+    serve(run, idle_timeout)
+
+
+@daemon.command("stop")
+def _cmd_daemon_stop():
+    """Stop the daemon serving the current kubeconfig context"""
+    from bonfire.daemon import stop_daemon
+
+    if not stop_daemon():
+        echo_warning("no bonfire daemon is serving the current kubeconfig context")
+        return
+    echo_success("bonfire daemon stopped")
+
+
+@daemon.command("status")
+def _cmd_daemon_status():
+    """Show the daemon serving the current kubeconfig context, exit 1 if there is none"""
+    from bonfire.daemon import daemon_status
+
+    status = daemon_status()
+    if not status:
+        click.echo("no bonfire daemon is serving the current kubeconfig context")
+        sys.exit(1)
+    for field in ("pid", "context", "socket", "uptime", "commands"):
+        click.echo(f"{field}: {status[field]}")
+
+
 @options(_app_source_options)
 @click.option(
     "--components/--no-components",
@@ -2018,12 +2222,27 @@ def get_namespace_from_context(ctx, namespace, required=False):
     return _namespace
 
 
-def main_with_handler():
-    truststore.inject_into_ssl()
+def _run_cli():
+    """Run the command line in sys.argv in this process."""
     try:
         main()
-    except (StatusError, FatalError) as err:
+    except FatalError as err:
         _error(str(err))
+    except Exception as err:
+        from ocviapy import StatusError
+
+        if not isinstance(err, StatusError):
+            raise
+        _error(str(err))
+
+
+def main_with_handler():
+    from bonfire.daemon import run_in_daemon
+
+    exit_code = run_in_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    _run_cli()
 
 
 if __name__ == "__main__":
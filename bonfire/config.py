@@ -5,7 +5,6 @@ import subprocess
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
 from bonfire.utils import FatalError, get_config_path, load_file
 
 if sys.version_info < (3, 9):
@@ -44,7 +43,10 @@ DEFAULT_ENABLE_TELEMETRY = "false"
 DEFAULT_CLIENT_ID = "bonfire"
 
 ENV_FILE = str(DEFAULT_ENV_PATH.absolute()) if DEFAULT_ENV_PATH.exists() else ""
-load_dotenv(ENV_FILE)
+if ENV_FILE:
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
 
 # used in app-sre jenkins jobs
 APP_INTERFACE_BASE_URL = os.getenv("APP_INTERFACE_BASE_URL")
@@ -57,6 +59,8 @@ QONTRACT_BASE_URL = os.getenv(
 QONTRACT_USERNAME = os.getenv("QONTRACT_USERNAME", APP_INTERFACE_USERNAME or None)
 QONTRACT_PASSWORD = os.getenv("QONTRACT_PASSWORD", APP_INTERFACE_PASSWORD or None)
 QONTRACT_TOKEN = os.getenv("QONTRACT_TOKEN")
+# seconds a qontract query result is reused, app-interface data changes slowly
+QONTRACT_CACHE_TTL = float(os.getenv("BONFIRE_QONTRACT_CACHE_TTL", "300"))
 
 BASE_NAMESPACE_PATH = os.getenv(
     "BASE_NAMESPACE_PATH",
@@ -110,6 +114,8 @@ ELASTICSEARCH_APIKEY = os.getenv("ELASTICSEARCH_APIKEY")
 if ELASTICSEARCH_APIKEY:
     ELASTICSEARCH_APIKEY = f"ApiKey {ELASTICSEARCH_APIKEY}"
 ENABLE_TELEMETRY = os.getenv("ENABLE_TELEMETRY", DEFAULT_ENABLE_TELEMETRY).lower() == "true"
+# seconds bonfire waits at exit for queued telemetry to be sent
+TELEMETRY_FLUSH_TIMEOUT = float(os.getenv("BONFIRE_TELEMETRY_FLUSH_TIMEOUT", "2"))
 
 CLIENT_ID = os.getenv("CLIENT_ID", DEFAULT_CLIENT_ID)
 
@@ -0,0 +1,535 @@
+"""Serve bonfire commands from a long-running process over a Unix domain socket.
+
+Every bonfire invocation re-imports ocviapy/kubernetes/gql, reloads the kubeconfig, and
+rebuilds its API clients, qontract client and connection checks. `bonfire daemon start`
+keeps one process with all of that warm; main_with_handler() hands each command line to it
+and only runs the command in-process when no daemon is serving the caller's setup.
+
+A daemon serves a single kubeconfig context and bonfire configuration: its socket path is
+derived from the kubeconfig files, their current context and the env vars bonfire reads its
+configuration from at import time, so a caller only ever reaches a daemon holding state for
+its own cluster and settings.
+
+Protocol: newline-delimited JSON over the socket. A 'run' request carries the caller's
+argv, cwd and environment, and passes its stdin/stdout/stderr file descriptors along
+(SCM_RIGHTS), so output and prompts go straight to the caller's terminal. The daemon runs
+one command at a time and replies with its exit code. An 'interrupt' message, sent when the
+caller hits Ctrl-C (or its connection drops), raises KeyboardInterrupt in the command.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from bonfire.output import reset_console
+from bonfire.utils import FatalError
+
+log = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+DEFAULT_IDLE_TIMEOUT = 3600  # seconds
+KUBECONFIG_DEFAULT_PATH = "~/.kube/config"
+
+# env vars bonfire.config and bonfire_lib read at import time, a daemon only serves callers
+# that agree on all of them
+_CONFIG_ENV_PREFIXES = ("BONFIRE_", "QONTRACT_", "APP_INTERFACE_", "ELASTICSEARCH_")
+_CONFIG_ENV_VARS = (
+    "BASE_NAMESPACE_PATH",
+    "CLIENT_ID",
+    "DEFAULT_BASE_NAMESPACE",
+    "ENABLE_TELEMETRY",
+    "EPHEMERAL_ENV_NAME",
+    "GITHUB_API_URL",
+    "GITHUB_TOKEN",
+    "KUBECONFIG",
+    "XDG_CACHE_HOME",
+    "XDG_CONFIG_HOME",
+)
+# switches for the daemon itself
+_DAEMON_ENV_VARS = ("BONFIRE_USE_DAEMON",)
+
+_STD_FDS = (0, 1, 2)
+_BUFSIZE = 65536
+
+
+def _use_daemon():
+    return os.getenv("BONFIRE_USE_DAEMON", "true").lower() == "true"
+
+
+def _kubeconfig_paths():
+    paths = os.environ.get("KUBECONFIG") or KUBECONFIG_DEFAULT_PATH
+    return [str(Path(p).expanduser()) for p in paths.split(os.pathsep) if p]
+
+
+def _current_context(paths):
+    """The current-context of the merged kubeconfig: the first file that sets one wins."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for path in paths:
+        try:
+            with open(path) as f:
+                context = (yaml.load(f, Loader=loader) or {}).get("current-context")
+        except (OSError, yaml.YAMLError, AttributeError) as err:
+            log.debug("unable to read kubeconfig '%s': %s", path, err)
+            continue
+        if context:
+            return context
+    return None
+
+
+def _config_fingerprint():
+    config_env = {
+        name: value
+        for name, value in os.environ.items()
+        if (name.startswith(_CONFIG_ENV_PREFIXES) or name in _CONFIG_ENV_VARS)
+        and name not in _DAEMON_ENV_VARS
+    }
+    return hashlib.sha256(json.dumps(config_env, sort_keys=True).encode()).hexdigest()
+
+
+def daemon_key():
+    """Identify the state a daemon holds: kubeconfig files, their context and bonfire config."""
+    paths = _kubeconfig_paths()
+    return {
+        "kubeconfig": paths,
+        "context": _current_context(paths),
+        "config": _config_fingerprint(),
+    }
+
+
+def _socket_dir():
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir).joinpath("bonfire")
+    return Path(tempfile.gettempdir()).joinpath(f"bonfire-{os.getuid()}")
+
+
+def _check_socket_dir(path):
+    """Refuse a socket dir others can write to, a socket in it could be anyone's daemon."""
+    st = path.stat()
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise FatalError(f"daemon socket dir '{path}' must be private to the current user")
+
+
+def socket_path(key=None):
+    """Return the socket path of the daemon serving 'key' (default: the caller's daemon_key())."""
+    key = key or daemon_key()
+    key_id = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+    return _socket_dir().joinpath(f"daemon-{key_id}.sock")
+
+
+class _Channel:
+    """Newline-delimited JSON messages over a connected Unix socket."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self._buffer = b""
+
+    def send(self, message, fds=()):
+        data = json.dumps(message).encode() + b"\n"
+        sent = socket.send_fds(self.sock, [data], list(fds)) if fds else 0
+        if sent < len(data):
+            self.sock.sendall(data[sent:])
+
+    def receive(self):
+        """Return (message, file descriptors), message is None once the peer has gone away."""
+        fds = []
+        while b"\n" not in self._buffer:
+            try:
+                data, new_fds, _, _ = socket.recv_fds(self.sock, _BUFSIZE, len(_STD_FDS))
+            except OSError:
+                data, new_fds = b"", []
+            fds.extend(new_fds)
+            if not data:
+                return None, fds
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line), fds
+
+    def close(self):
+        """Shut the connection down, waking up a thread blocked in receive()."""
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _connect(path):
+    if not path.exists():
+        return None
+    _check_socket_dir(path.parent)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        # stale socket left by a daemon that was killed
+        sock.close()
+        return None
+    return sock
+
+
+def _request(message, path=None):
+    """Send a control request to the daemon, returns its reply or None if it isn't running."""
+    sock = _connect(path or socket_path())
+    if not sock:
+        return None
+    with sock:
+        channel = _Channel(sock)
+        channel.send({"version": PROTOCOL_VERSION, **message})
+        reply, _ = channel.receive()
+    return reply
+
+
+def daemon_status(path=None):
+    """Return the status of the daemon serving the caller, or None if none is running."""
+    return _request({"op": "status"}, path)
+
+
+def stop_daemon(path=None):
+    """Ask the daemon serving the caller to exit, returns False if none was running."""
+    return _request({"op": "stop"}, path) is not None
+
+
+def _is_daemon_command(args):
+    """Whether 'args' run a 'bonfire daemon ...' command, those always run in-process."""
+    args = iter(args)
+    for arg in args:
+        if arg in ("-n", "--namespace"):
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg == "daemon"
+    return False
+
+
+def run_in_daemon(args):
+    """Run a bonfire command line in the daemon serving the caller.
+
+    Returns the command's exit code, or None if no daemon is running (or it is disabled with
+    BONFIRE_USE_DAEMON=false) and the command should run in-process.
+    """
+    if not _use_daemon() or _is_daemon_command(args) or not hasattr(socket, "send_fds"):
+        return None
+    # skip reading the kubeconfig unless some daemon is running
+    socket_dir = _socket_dir()
+    if not socket_dir.is_dir() or not any(socket_dir.glob("daemon-*.sock")):
+        return None
+
+    try:
+        sock = _connect(socket_path())
+    except FatalError as err:
+        sys.stderr.write(f"WARNING: not using bonfire daemon: {err}\n")
+        return None
+    if not sock:
+        return None
+
+    with sock:
+        channel = _Channel(sock)
+        fds = [fd for fd in _STD_FDS if _is_open(fd)]
+        request = {
+            "version": PROTOCOL_VERSION,
+            "op": "run",
+            "args": list(args),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "fds": fds,
+        }
+        channel.send(request, fds=fds)
+        while True:
+            try:
+                reply, _ = channel.receive()
+            except KeyboardInterrupt:
+                channel.send({"op": "interrupt"})
+                continue
+            if reply is None:
+                sys.stderr.write("ERROR: bonfire daemon exited before the command finished\n")
+                return 1
+            if "error" in reply:
+                sys.stderr.write(f"ERROR: bonfire daemon: {reply['error']}\n")
+                return 1
+            return reply["exit_code"]
+
+
+def _is_open(fd):
+    try:
+        os.fstat(fd)
+    except OSError:
+        return False
+    return True
+
+
+def _exit_code(code):
+    """Exit status for SystemExit(code), the way the interpreter computes it."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
+
+
+def _kubeconfig_mtimes(paths):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _reset_cluster_state():
+    """Drop clients and cached cluster lookups, e.g. after 'oc login' rewrote the kubeconfig."""
+    from bonfire import namespaces, openshift
+    from bonfire_lib.k8s_client import clear_clients
+
+    clear_clients()
+    namespaces.has_api_resource.cache_clear()
+    for func in (
+        openshift.has_ns_operator,
+        openshift.has_clowder,
+        openshift.get_console_url,
+        openshift.get_kube_api_server,
+        openshift.whoami,
+    ):
+        func.cache_clear()
+
+
+def _reset_command_state():
+    """Drop results the CLI only expects to be reused within one command."""
+    from bonfire import openshift
+    from bonfire.utils import reset_connection_checks
+
+    reset_connection_checks()
+    openshift.get_namespace_pools.cache_clear()
+
+
+class DaemonServer:
+    """Accepts connections on 'path' and runs each command with 'run'.
+
+    'run' runs the command line in sys.argv in-process. Commands run one at a time in the
+    calling thread, which has the caller's environment, cwd and stdio fds while they run.
+    """
+
+    def __init__(self, path, run, key=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.path = Path(path)
+        self.run = run
+        self.key = key or daemon_key()
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.commands = 0
+        self._kubeconfig_mtimes = _kubeconfig_mtimes(self.key["kubeconfig"])
+        self._running = False
+        self._stopping = False
+        self._interruptible = False
+
+    def _bind(self):
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_socket_dir(self.path.parent)
+        if self.path.exists():
+            status = daemon_status(self.path)
+            if status:
+                raise FatalError(
+                    f"a bonfire daemon (pid {status['pid']}) is already serving context "
+                    f"'{status['context']}'"
+                )
+            self.path.unlink()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        sock.listen()
+        sock.settimeout(self.idle_timeout or None)
+        return sock
+
+    def serve(self):
+        server = self._bind()
+        # forwarding Ctrl-C needs a signal handler, which only the main thread can install
+        self._interruptible = threading.current_thread() is threading.main_thread()
+        if self._interruptible:
+            previous_handler = signal.signal(signal.SIGUSR1, self._on_interrupt)
+        log.info(
+            "bonfire daemon serving context '%s' on %s (pid %d)",
+            self.key["context"],
+            self.path,
+            os.getpid(),
+        )
+        try:
+            while not self._stopping:
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    log.info("no commands for %ds, exiting", self.idle_timeout)
+                    break
+                with conn:
+                    conn.settimeout(None)
+                    self._handle(_Channel(conn))
+        finally:
+            server.close()
+            if self.path.exists():
+                self.path.unlink()
+            if self._interruptible:
+                signal.signal(signal.SIGUSR1, previous_handler)
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "context": self.key["context"],
+            "kubeconfig": self.key["kubeconfig"],
+            "socket": str(self.path),
+            "uptime": int(time.time() - self.started),
+            "commands": self.commands,
+        }
+
+    def _handle(self, channel):
+        try:
+            request, fds = channel.receive()
+        except ValueError as err:
+            log.warning("ignoring malformed request: %s", err)
+            return
+        if request is None:
+            return
+        try:
+            if request.get("version") != PROTOCOL_VERSION:
+                channel.send({"error": f"unsupported protocol version {request.get('version')}"})
+            elif request.get("op") == "status":
+                channel.send(self.status())
+            elif request.get("op") == "stop":
+                log.info("stop requested, exiting")
+                self._stopping = True
+                channel.send({"stopping": True})
+            elif request.get("op") == "run":
+                watcher = threading.Thread(
+                    target=self._watch_for_interrupt,
+                    args=(channel,),
+                    name="daemon-interrupt",
+                    daemon=True,
+                )
+                watcher.start()
+                try:
+                    exit_code = self._run_request(request, fds)
+                    channel.send({"exit_code": exit_code})
+                finally:
+                    channel.close()
+                    watcher.join()
+            else:
+                channel.send({"error": f"unknown op '{request.get('op')}'"})
+        except OSError as err:
+            log.warning("lost connection to caller: %s", err)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _on_interrupt(self, signum, frame):
+        # only the command is interrupted, never the accept loop
+        if self._running:
+            raise KeyboardInterrupt
+
+    def _watch_for_interrupt(self, channel):
+        # the caller sends 'interrupt' on Ctrl-C, a caller that went away is interrupted too
+        while True:
+            try:
+                message, _ = channel.receive()
+            except ValueError:
+                continue
+            interrupted = message is None or message.get("op") == "interrupt"
+            if interrupted and self._running and self._interruptible:
+                os.kill(os.getpid(), signal.SIGUSR1)
+            if message is None:
+                return
+
+    def _run_request(self, request, fds):
+        args = request["args"]
+        log.info("running 'bonfire %s'", " ".join(args))
+
+        mtimes = _kubeconfig_mtimes(self.key["kubeconfig"])
+        if mtimes != self._kubeconfig_mtimes:
+            log.info("kubeconfig changed, dropping cluster clients and caches")
+            _reset_cluster_state()
+            self._kubeconfig_mtimes = mtimes
+        _reset_command_state()
+
+        stdio = dict(zip(request["fds"], fds))
+        if 0 not in stdio:
+            stdio[0] = os.open(os.devnull, os.O_RDONLY)
+            fds.append(stdio[0])
+
+        saved_fds = {fd: os.dup(fd) if _is_open(fd) else None for fd in _STD_FDS}
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        saved_argv = sys.argv
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+
+        try:
+            _flush_stdio()
+            for target, fd in stdio.items():
+                os.dup2(fd, target)
+            os.environ.clear()
+            os.environ.update(request["env"])
+            os.chdir(request["cwd"])
+            sys.argv = ["bonfire", *args]
+            # let the command configure logging and detect the caller's terminal
+            for handler in saved_handlers:
+                root.removeHandler(handler)
+            reset_console()
+
+            self._running = True
+            try:
+                self.run()
+                exit_code = 0
+            except SystemExit as err:
+                exit_code = _exit_code(err.code)
+            except KeyboardInterrupt:
+                exit_code = 130
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                self._running = False
+        finally:
+            _flush_stdio()
+            for target, fd in saved_fds.items():
+                if fd is None:
+                    os.close(target)
+                else:
+                    os.dup2(fd, target)
+                    os.close(fd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+            for handler in saved_handlers:
+                root.addHandler(handler)
+            root.setLevel(saved_level)
+            reset_console()
+
+        self.commands += 1
+        log.info("'bonfire %s' exited with %d", " ".join(args), exit_code)
+        return exit_code
+
+
+def _flush_stdio():
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def serve(run, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Serve commands for the caller's kubeconfig context until stopped or idle."""
+    if not hasattr(socket, "send_fds"):
+        raise FatalError("bonfire daemon requires Unix domain socket support")
+    key = daemon_key()
+    DaemonServer(socket_path(key), run, key=key, idle_timeout=idle_timeout).serve()
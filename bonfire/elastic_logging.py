@@ -1,31 +1,60 @@
 from datetime import datetime as dt
 import logging
 import json
-import requests
+import queue
 import sys
+import threading
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 
 import bonfire.config as conf
+from bonfire.utils import use_truststore
 
 
 log = logging.getLogger(__name__)
 
+# records waiting to be sent, more are dropped (and counted) instead of blocking the CLI
+QUEUE_SIZE = 1000
+# records sent per _bulk request
+BATCH_SIZE = 100
+# (connect, read) timeout of a _bulk request
+REQUEST_TIMEOUT = (1, 2)
+
+_STOP = object()
+
 
 class ElasticLogger:
     def __init__(self):
         self.es_telemetry = logging.getLogger("elasicsearch")
         self.es_telemetry.propagate = False
+        self._es_handler = None
+        # the handler is created at the end of a command, elapsed time counts from here
+        self.start_time = dt.now()
 
-        # prevent duplicate handlers
-        self.es_handler = next(
-            (h for h in self.es_telemetry.handlers if type(h) is AsyncElasticsearchHandler), None
-        )
-        if not self.es_handler:
-            self.es_handler = AsyncElasticsearchHandler(
-                f"{conf.ELASTICSEARCH_HOST}/{conf.ELASTICSEARCH_INDEX}/_doc/"
+    @property
+    def es_handler(self):
+        # created on first use so that importing the CLI does not start a thread
+        if not self._es_handler:
+            # prevent duplicate handlers
+            self._es_handler = next(
+                (h for h in self.es_telemetry.handlers if type(h) is AsyncElasticsearchHandler),
+                None,
+            )
+        if not self._es_handler:
+            self._es_handler = AsyncElasticsearchHandler(
+                f"{conf.ELASTICSEARCH_HOST.rstrip('/')}/{conf.ELASTICSEARCH_INDEX}/_bulk",
+                start_time=self.start_time,
             )
-            self.es_telemetry.addHandler(self.es_handler)
+            self.es_telemetry.addHandler(self._es_handler)
+        return self._es_handler
+
+    def reset(self):
+        """Flush and drop the handler so the next command gets its own metadata, e.g. in a daemon."""
+        if self._es_handler:
+            self.es_telemetry.removeHandler(self._es_handler)
+            self._es_handler.close()
+            self._es_handler = None
+        self.start_time = dt.now()
 
     def send_telemetry(self, log_message, success=True):
         self.es_handler.set_success_status(success)
@@ -34,11 +63,17 @@ class ElasticLogger:
 
 
 class AsyncElasticsearchHandler(logging.Handler):
-    def __init__(self, es_url):
+    """Queues log records and sends them to Elasticsearch's _bulk API from one worker thread.
+
+    emit() never blocks: records that don't fit in the queue are dropped and counted in
+    'dropped', as are records Elasticsearch rejects or that are still unsent when close()
+    (called by logging at interpreter exit) runs out of conf.TELEMETRY_FLUSH_TIMEOUT.
+    """
+
+    def __init__(self, es_url, start_time=None):
         super().__init__()
         self.es_url = es_url
-        self.executor = ThreadPoolExecutor(max_workers=10)
-        self.start_time = dt.now()
+        self.start_time = start_time or dt.now()
         self.metadata = {
             "uuid": str(uuid.uuid4()),
             "start_time": self.start_time.isoformat(),
@@ -46,39 +81,120 @@ class AsyncElasticsearchHandler(logging.Handler):
             "client_id": conf.CLIENT_ID,
             "command": self._mask_parameter_values(sys.argv[1:]),
         }
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._in_flight = 0
+        self._worker = None
+        self._closed = False
+        self._lock = threading.Lock()
 
     def emit(self, record):
-        self.metadata["@timestamp"] = dt.now().isoformat()
-        self.metadata["elapsed_sec"] = (dt.now() - self.start_time).total_seconds()
-
-        log_entry = {"log": self.format(record), "metadata": self.metadata}
+        if not conf.ENABLE_TELEMETRY:
+            return
+        if not conf.ELASTICSEARCH_APIKEY or not conf.ELASTICSEARCH_HOST:
+            log.error("Bonfire telemetry secret(s) not set")
+            return
+
+        now = dt.now()
+        # a snapshot, later set_success_status() calls must not change queued records
+        metadata = {
+            **self.metadata,
+            "@timestamp": now.isoformat(),
+            "elapsed_sec": (now - self.start_time).total_seconds(),
+            "dropped_records": self.dropped,
+        }
+        log_entry = {"log": self.format(record), "metadata": metadata}
 
-        if conf.ENABLE_TELEMETRY:
-            if not conf.ELASTICSEARCH_APIKEY or not conf.ELASTICSEARCH_HOST:
-                log.error("Bonfire telemetry secret(s) not set")
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
                 return
-
-            self.executor.submit(self.send_to_es, json.dumps(log_entry))
+            if not self._worker:
+                self._worker = threading.Thread(
+                    target=self._run, name="bonfire-telemetry", daemon=True
+                )
+                self._worker.start()
+        try:
+            self._queue.put_nowait(log_entry)
+        except queue.Full:
+            self._count_dropped(1)
 
     def set_success_status(self, run_status):
         self.metadata["succeeded"] = run_status
 
-    def send_to_es(self, log_entry):
-        # Convert log_entry to JSON and send to Elasticsearch
-        log.info("Sending telemetry data...")
+    def _count_dropped(self, count):
+        with self._lock:
+            self.dropped += count
 
-        try:
-            headers = {
-                "Authorization": conf.ELASTICSEARCH_APIKEY,
-                "Content-Type": "application/json",
-            }
+    def _run(self):
+        use_truststore()
+        import requests
 
-            response = requests.post(self.es_url, headers=headers, data=log_entry, timeout=0.1)
+        # one session, the connection is reused for every batch
+        session = requests.Session()
+        session.headers.update(
+            {"Authorization": conf.ELASTICSEARCH_APIKEY, "Content-Type": "application/x-ndjson"}
+        )
+        stopping = False
+        while not stopping:
+            # whatever was queued while the previous request was in flight goes out together
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            log_entries = [entry for entry in batch if entry is not _STOP]
+            stopping = len(log_entries) < len(batch)
+            if log_entries:
+                self._in_flight = len(log_entries)
+                self.send_to_es(session, log_entries)
+                self._in_flight = 0
+
+    def send_to_es(self, session, log_entries):
+        log.info("Sending telemetry data (%d record(s))...", len(log_entries))
+
+        body = "".join(f'{{"index":{{}}}}\n{json.dumps(entry)}\n' for entry in log_entries)
+        try:
+            response = session.post(self.es_url, data=body, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            log.info("Successfully sent telemetry data")
+            items = response.json().get("items", [])
         except Exception as e:
             # Handle exceptions (e.g., network issues, Elasticsearch down)
             log.error("Error sending data to elasticsearch: %s", e)
+            self._count_dropped(len(log_entries))
+            return
+
+        rejected = sum(1 for item in items if item.get("index", {}).get("status", 500) >= 300)
+        if rejected:
+            log.error("Elasticsearch rejected %d telemetry record(s)", rejected)
+            self._count_dropped(rejected)
+        else:
+            log.info("Successfully sent telemetry data")
+
+    def close(self):
+        """Send the queued records, waiting at most conf.TELEMETRY_FLUSH_TIMEOUT seconds."""
+        with self._lock:
+            worker, self._closed = self._worker, True
+        if worker and worker.is_alive():
+            deadline = time.monotonic() + conf.TELEMETRY_FLUSH_TIMEOUT
+            try:
+                self._queue.put(_STOP, timeout=conf.TELEMETRY_FLUSH_TIMEOUT)
+            except queue.Full:
+                pass
+            worker.join(max(0, deadline - time.monotonic()))
+            if worker.is_alive():
+                unsent = self._in_flight
+                while True:
+                    try:
+                        unsent += self._queue.get_nowait() is not _STOP
+                    except queue.Empty:
+                        break
+                self._count_dropped(unsent)
+                log.debug("telemetry flush timed out, %d record(s) not sent", unsent)
+        if self.dropped:
+            log.debug("%d telemetry record(s) dropped", self.dropped)
+        super().close()
 
     @staticmethod
     def _mask_parameter_values(cli_args):
@@ -1,31 +1,42 @@
 import base64
 import copy
 import datetime
+import functools
 import json
 import logging
+from contextlib import contextmanager
 
-from ocviapy import get_all_namespaces, get_json, on_k8s, set_current_namespace
+from ocviapy import StatusError, get_json, on_k8s, set_current_namespace
 from wait_for import TimedOutError
 
 import bonfire.config as conf
 from bonfire.openshift import (
-    get_all_reservations,
     get_console_url,
-    get_reservation,
+    has_ns_operator,
     whoami,
 )
-from bonfire.utils import FatalError
+from bonfire.utils import FatalError, use_truststore
 
+import bonfire_lib.pools as _lib_pools
+import bonfire_lib.readiness as _lib_readiness
 import bonfire_lib.reservations as _lib_reservations
+import bonfire_lib.snapshot as _lib_snapshot
 import bonfire_lib.status as _lib_status
-from bonfire_lib.k8s_client import EphemeralK8sClient
+from bonfire_lib.k8s_client import EphemeralK8sClient, get_client
 
 log = logging.getLogger(__name__)
 
 
 def _get_lib_client() -> EphemeralK8sClient:
-    """Create an EphemeralK8sClient from the current kubeconfig context."""
-    return EphemeralK8sClient()
+    """Return the shared EphemeralK8sClient for the current kubeconfig context."""
+    use_truststore()
+    return get_client()
+
+
+@functools.lru_cache(maxsize=None, typed=False)
+def has_api_resource(api_version, kind):
+    """Check whether the cluster serves a kind, using the on-disk API discovery cache."""
+    return _get_lib_client().has_api_resource(api_version, kind)
 
 
 TIME_FMT = "%Y-%m-%dT%H:%M:%SZ"
@@ -76,9 +87,14 @@ def _duration_fmt(seconds):
         return "%ds" % (seconds,)
 
 
+CAPI_CLUSTER_TYPE = "cluster.cluster.x-k8s.io"
+
+
 class Namespace:
     PHASE_ACTIVE = "Active"
     PHASE_TERMINATING = "Terminating"
+    # passed as 'clusters_data' when CAPI clusters could not be listed
+    CLUSTERS_UNAVAILABLE = "n/a"
 
     @property
     def annotations(self):
@@ -140,7 +156,9 @@ class Namespace:
     def available(self):
         return not self.reserved and self.ready
 
-    def refresh(self, namespace_data=None, reservation_data=None, clowdapps_data=None):
+    def refresh(
+        self, namespace_data=None, reservation_data=None, clowdapps_data=None, clusters_data=None
+    ):
         if namespace_data is None:
             self._data = get_json("namespace", self.name)
             if not self._data:
@@ -150,8 +168,10 @@ class Namespace:
         else:
             self._data = copy.deepcopy(namespace_data)
 
-        self._reservation = copy.deepcopy(reservation_data) if reservation_data else None
-        self._clowdapps = copy.deepcopy(clowdapps_data) if clowdapps_data else None
+        # pre-fetched empty values mean "none found", only None triggers a fetch later on
+        self._reservation = copy.deepcopy(reservation_data)
+        self._clowdapps = copy.deepcopy(clowdapps_data)
+        self._clusters = copy.deepcopy(clusters_data)
 
         self.name = self._data.get("metadata", {}).get("name")
 
@@ -170,11 +190,19 @@ class Namespace:
             self.requester = None
             self.expires = None
 
-    def __init__(self, name=None, namespace_data=None, reservation_data=None, clowdapps_data=None):
+    def __init__(
+        self,
+        name=None,
+        namespace_data=None,
+        reservation_data=None,
+        clowdapps_data=None,
+        clusters_data=None,
+    ):
         self.name = name
         self._data = namespace_data  # if None, we will fetch data
         self._reservation = reservation_data  # if None, we will fetch data
         self._clowdapps = clowdapps_data  # if None, we will fetch data
+        self._clusters = clusters_data  # if None, we will fetch data
         self.requester = None
         self.expires = None
 
@@ -184,7 +212,7 @@ class Namespace:
         # if __init__ was called with only 'name', we will fetch the ns data,
         # otherwise we will use the data passed to __init__ to populate
         # this instance's properties
-        self.refresh(namespace_data, reservation_data, clowdapps_data)
+        self.refresh(namespace_data, reservation_data, clowdapps_data, clusters_data)
 
     def __str__(self):
         return (
@@ -196,11 +224,11 @@ class Namespace:
     def reservation(self):
         if self._reservation is None:
             log.debug("fetching reservation for ns '%s'", self.name)
-            self._reservation = get_reservation(namespace=self.name)
+            self._reservation = get_namespace_reservation(self.name)
 
         if not self._reservation or not self._reservation.get("status"):
-            self._reservation = None
             log.warning("could not retrieve reservation details for ns: %s", self.name)
+            return None
 
         return self._reservation
 
@@ -233,18 +261,22 @@ class Namespace:
         if not self.reserved or not self.ready:
             return "none"
 
-        try:
-            cluster_data = get_json("cluster.cluster.x-k8s.io", namespace=self.name)
-            items = cluster_data.get("items", [])
-        except Exception:
+        if self._clusters is None:
+            log.debug("fetching clusters for ns %s", self.name)
+            try:
+                self._clusters = get_json(CAPI_CLUSTER_TYPE, namespace=self.name).get("items", [])
+            except Exception:
+                self._clusters = self.CLUSTERS_UNAVAILABLE
+
+        if self._clusters == self.CLUSTERS_UNAVAILABLE:
             return "n/a"
 
-        if not items:
+        if not self._clusters:
             return "none"
 
-        total = len(items)
+        total = len(self._clusters)
         ready = 0
-        for cluster in items:
+        for cluster in self._clusters:
             conditions = cluster.get("status", {}).get("conditions", [])
             for cond in conditions:
                 if cond.get("type") in ("Ready", "Available") and cond.get("status") == "True":
@@ -266,6 +298,72 @@ class Namespace:
         return self.phase == self.PHASE_ACTIVE
 
 
+def _load_snapshot(*kinds):
+    try:
+        return _lib_snapshot.load_snapshot(_get_lib_client(), kinds)
+    except _lib_snapshot.FatalError as exc:
+        raise FatalError(str(exc))
+
+
+def _load_namespace_snapshot():
+    """
+    Fetch everything 'namespace list' needs with one concurrent list call per resource type.
+
+    Namespaces, ClowdApps, reservations and CAPI clusters are each listed once across all
+    namespaces and indexed by namespace, returns a list of Namespace kwargs.
+    """
+    kinds = ["namespaces", "clowdapps", "clusters"]
+    # without the namespace operator there are no reservations to list
+    if has_ns_operator():
+        kinds.append("reservations")
+    snapshot = _load_snapshot(*kinds)
+
+    # ensure a non-None value is passed in for these kwargs since we have already
+    # pre-fetched the data
+    all_ns_kwargs = []
+    for ns in snapshot.namespaces:
+        ns_name = ns["metadata"]["name"]
+        if snapshot.clusters is None:
+            clusters_data = Namespace.CLUSTERS_UNAVAILABLE
+        else:
+            clusters_data = snapshot.clusters_by_namespace.get(ns_name, [])
+        all_ns_kwargs.append(
+            {
+                "namespace_data": ns,
+                "clowdapps_data": snapshot.clowdapps_by_namespace.get(ns_name, []),
+                "reservation_data": snapshot.reservation_by_namespace.get(ns_name, {}),
+                "clusters_data": clusters_data,
+            }
+        )
+    return all_ns_kwargs
+
+
+def get_reservation_preflight(requester, pool, check_existing=True):
+    """Check operator, pool, pool capacity and existing reservations in one concurrent lookup."""
+    try:
+        return _lib_reservations.check_reservation_preflight(
+            _get_lib_client(), requester, pool, check_existing=check_existing
+        )
+    except _lib_reservations.FatalError as exc:
+        raise FatalError(str(exc))
+
+
+def get_namespace_reservation(namespace):
+    """Return the reservation of a namespace, preferring its active one."""
+    if not has_ns_operator():
+        return None
+    return _lib_status.get_reservation(_get_lib_client(), namespace=namespace)
+
+
+def choose_pool(candidates, count=1):
+    """Return the name of the candidate pool expected to assign a namespace soonest."""
+    try:
+        choice = _lib_pools.choose_pool(_get_lib_client(), candidates, count=count)
+    except _lib_pools.FatalError as exc:
+        raise FatalError(str(exc))
+    return choice["name"]
+
+
 def get_namespaces(available=False, mine=False):
     """
     Look up reservable namespaces in the cluster.
@@ -274,37 +372,9 @@ def get_namespaces(available=False, mine=False):
     mine (bool) -- return only namespaces owned by current user
     """
     log.debug("get_namespaces(available=%s, mine=%s)", available, mine)
-    all_namespaces = get_all_namespaces(label="operator-ns")
-    try:
-        all_clowdapps = get_json("clowdapp", "--all-namespaces").get("items", [])
-    except ValueError:
-        log.debug("clowdapp resource type not found, skipping")
-        all_clowdapps = []
-    all_res = get_all_reservations()
-
-    # build a list containing the ns data, reservation data, and clowdapp
-    # data pertaining to each ns
-    all_ns_kwargs = []
-
-    for ns in all_namespaces:
-        ns_name = ns["metadata"]["name"]
-        clowdapps_data = [
-            app for app in all_clowdapps if app.get("metadata", {}).get("namespace") == ns_name
-        ]
-        reservation_data = [
-            res for res in all_res if res.get("status", {}).get("namespace") == ns_name
-        ]
-        # ensure a non-None value is passed in for these kwargs since we have already
-        # pre-fetched the data
-        kwargs = {
-            "namespace_data": ns,
-            "clowdapps_data": clowdapps_data,
-            "reservation_data": reservation_data[0] if reservation_data else {},
-        }
-        all_ns_kwargs.append(kwargs)
 
     ephemeral_namespaces = []
-    for ns_kwargs in all_ns_kwargs:
+    for ns_kwargs in _load_namespace_snapshot():
         ns = Namespace(**ns_kwargs)
         if ns.is_terminating:
             continue
@@ -351,6 +421,40 @@ def reserve_namespace(
     return Namespace(name=ns_name)
 
 
+def reserve_namespaces(
+    count, requester, duration, pool, timeout, team=None, secrets_src_namespace=None
+):
+    """Reserve 'count' namespaces at once, returns their names.
+
+    All are released again if any of them cannot be reserved.
+    """
+    try:
+        results = _lib_reservations.reserve_many(
+            _get_lib_client(),
+            count,
+            duration=duration,
+            requester=requester,
+            pool=pool,
+            team=team,
+            secrets_src_namespace=secrets_src_namespace,
+            timeout=timeout,
+        )
+    except _lib_reservations.FatalError as exc:
+        raise FatalError(str(exc))
+    except TimeoutError:
+        raise TimedOutError("timed out waiting for namespaces")
+
+    return [result["namespace"] for result in results]
+
+
+def wait_on_reservation(res_name, timeout):
+    client = _get_lib_client()
+    try:
+        return _lib_status.wait_on_reservation(client, res_name, timeout=timeout)
+    except TimeoutError as exc:
+        raise TimedOutError(str(exc))
+
+
 def release_reservation(name=None, namespace=None, local=True):
     client = _get_lib_client()
     try:
@@ -385,6 +489,43 @@ def describe_namespace(project_name: str, output: str):
     return render_describe(info, project_name)
 
 
+@contextmanager
+def _readiness_errors():
+    """Re-raise bonfire_lib readiness errors as the ones bonfire's CLI handles."""
+    try:
+        yield
+    except _lib_readiness.StatusError as exc:
+        raise StatusError(str(exc))
+    except _lib_readiness.FatalError as exc:
+        raise FatalError(str(exc))
+    except TimeoutError as exc:
+        raise TimedOutError(str(exc))
+
+
+def wait_for_all_resources(namespace, timeout=600, defer_status_errors=False):
+    client = _get_lib_client()
+    with _readiness_errors():
+        _lib_readiness.wait_for_all_resources(
+            client, namespace, timeout=timeout, defer_status_errors=defer_status_errors
+        )
+
+
+def wait_for_db_resources(namespace, timeout=600, defer_status_errors=False):
+    client = _get_lib_client()
+    with _readiness_errors():
+        _lib_readiness.wait_for_db_resources(
+            client, namespace, timeout=timeout, defer_status_errors=defer_status_errors
+        )
+
+
+def wait_on_cji(namespace, cji_name, timeout, defer_status_errors=False):
+    client = _get_lib_client()
+    with _readiness_errors():
+        return _lib_readiness.wait_on_cji(
+            client, namespace, cji_name, timeout=timeout, defer_status_errors=defer_status_errors
+        )
+
+
 def parse_fe_env(project_name):
     fe_env = get_json("frontendenvironment", f"env-{project_name}")
     fe_host = fe_env.get("spec", {}).get("hostname", "")
@@ -44,6 +44,16 @@ def get_console():
     return _console
 
 
+def reset_console():
+    """Forget the detected terminal, the next output detects it again.
+
+    A daemon serves each command on its caller's stdout/stderr.
+    """
+    global _interactive, _console
+    _interactive = None
+    _console = None
+
+
 def configure_logging(debug=False):
     level = logging.DEBUG if debug else logging.INFO
     logging.getLogger("sh").setLevel(logging.CRITICAL)
@@ -2,6 +2,7 @@ import copy
 import json
 import logging
 import re
+import time
 from urllib.parse import urlparse
 
 from gql import Client as GQLClient
@@ -10,7 +11,7 @@ from gql.transport.requests import RequestsHTTPTransport
 from requests.auth import HTTPBasicAuth
 
 import bonfire.config as conf
-from bonfire.utils import check_url_connection
+from bonfire.utils import check_url_connection, use_truststore
 
 log = logging.getLogger(__name__)
 
@@ -72,6 +73,8 @@ APPS_QUERY = gql(
 
 
 class Client:
+    _results = None
+
     def __init__(self):
         log.debug("using url: %s", conf.QONTRACT_BASE_URL)
 
@@ -86,15 +89,30 @@ class Client:
 
         check_url_connection(transport_kwargs["url"])
 
+        use_truststore()
         transport = RequestsHTTPTransport(**transport_kwargs)
         self.client = GQLClient(transport=transport, fetch_schema_from_transport=False)
 
         # info level is way too noisy for the gql client
         logging.getLogger("gql").setLevel(logging.ERROR)
 
+    def _execute(self, query):
+        """Run 'query', reusing its result for conf.QONTRACT_CACHE_TTL seconds.
+
+        One deploy queries the same catalog several times, and a daemon serves many commands
+        with the same client. Callers modify the result, each gets its own copy.
+        """
+        if self._results is None:
+            self._results = {}
+        expires, result = self._results.get(query, (0, None))
+        if expires <= time.monotonic():
+            result = self.client.execute(query)
+            self._results[query] = (time.monotonic() + conf.QONTRACT_CACHE_TTL, result)
+        return copy.deepcopy(result)
+
     def get_env(self, env):
         """Get insights env configuration."""
-        for env_data in self.client.execute(ENVS_QUERY)["envs"]:
+        for env_data in self._execute(ENVS_QUERY)["envs"]:
             if env_data["name"] == env:
                 raw_namespaces = env_data.get("namespaces", [])
                 env_data["namespaces"] = {ns["path"]: ns["name"] for ns in raw_namespaces}
@@ -108,7 +126,7 @@ class Client:
         return env_data
 
     def get_apps(self):
-        return self.client.execute(APPS_QUERY)["apps"]
+        return self._execute(APPS_QUERY)["apps"]
 
 
 _client = None
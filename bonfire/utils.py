@@ -10,8 +10,9 @@ import re
 import shlex
 import subprocess
 import tempfile
+import threading
 import time
-from urllib.request import urlretrieve
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 if sys.version_info >= (3, 8):
@@ -27,7 +28,6 @@ from typing import List, Set
 
 import sys
 
-import requests
 import yaml
 from cached_property import cached_property
 
@@ -54,6 +54,9 @@ PYPI_URL = f"https://pypi.python.org/pypi/{PKG_NAME}/json"
 VER_CHECK_PATH = get_config_path().joinpath("lastvercheck")
 VER_CHECK_TIME = 3600  # check every 1hr
 
+CONN_CHECK_PATH = get_config_path().joinpath("connectioncheck")
+CONN_CHECK_TIME = int(os.getenv("BONFIRE_CONNECTION_CHECK_TTL", "300"))  # re-check every 5min
+
 GH_RAW_URL = "https://raw.githubusercontent.com/{org}/{repo}/{ref}{path}"
 GL_RAW_URL = "https://gitlab.cee.redhat.com/{group}/{project}/-/raw/{ref}{path}"
 GH_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
@@ -71,6 +74,7 @@ log = logging.getLogger(__name__)
 
 # Cache for CA certificate file path
 _gl_ca_cert_path = None
+_gl_ca_cert_lock = threading.Lock()
 
 
 def _get_gl_ca_cert():
@@ -86,6 +90,12 @@ def _get_gl_ca_cert():
     Raises:
         FatalError: If certificate download fails
     """
+    # preflight checks may request the cert from a background thread, only download it once
+    with _gl_ca_cert_lock:
+        return _download_gl_ca_cert()
+
+
+def _download_gl_ca_cert():
     global _gl_ca_cert_path
 
     if _gl_ca_cert_path is not None:
@@ -104,6 +114,9 @@ def _get_gl_ca_cert():
     # Download the certificate
     try:
         log.debug("Downloading GitLab CA certificate from %s", GL_CA_CERT_URL)
+        from urllib.request import urlretrieve
+
+        use_truststore()
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pem") as fp:
             urlretrieve(GL_CA_CERT_URL, fp.name)
             _gl_ca_cert_path = fp.name
@@ -228,6 +241,31 @@ def validate_time_string(time):
     return time
 
 
+_truststore_injected = False
+
+
+def use_truststore():
+    """Verify TLS connections against the system trust store.
+
+    Called before bonfire's first HTTPS connection instead of at startup: injecting truststore
+    imports requests, which most commands never need.
+    """
+    global _truststore_injected
+
+    if not _truststore_injected:
+        import truststore
+
+        truststore.inject_into_ssl()
+        _truststore_injected = True
+
+
+def _new_session():
+    use_truststore()
+    import requests
+
+    return requests.Session()
+
+
 class RepoFile:
     def __init__(self, host, org, repo, path, ref="master"):
         if host not in ["local", "github", "gitlab"]:
@@ -244,7 +282,7 @@ class RepoFile:
         self._alternate_refs = {
             "master": ["main", "stable"],
         }
-        self._session = requests.Session()
+        self._session = _new_session()
 
     @classmethod
     def from_config(cls, d):
@@ -646,6 +684,9 @@ def check_pypi():
     if not _ver_check_needed():
         return
 
+    use_truststore()
+    import requests
+
     log.info("checking pypi for latest release...")
 
     pkg_data = {}
@@ -688,6 +729,81 @@ def hms_to_seconds(s):
 
 # Cache for successful connection checks
 _connection_check_cache = set()
+_connection_check_cache_loaded = False
+_connection_check_lock = threading.Lock()
+
+# In-flight preflight checks, keyed by (hostname, port)
+_connection_check_futures = {}
+_preflight_executor = None
+
+
+def reset_connection_checks():
+    """Forget in-process connection check results, e.g. between commands run by a daemon.
+
+    Successful checks are read from the connection check file again, so they still expire
+    after CONN_CHECK_TIME sec.
+    """
+    global _connection_check_cache_loaded
+
+    with _connection_check_lock:
+        _connection_check_cache.clear()
+        _connection_check_cache_loaded = False
+    _connection_check_futures.clear()
+
+
+def _load_connection_check_file():
+    """Return {"<hostname>:<port>": <timestamp>} for checks that succeeded within the TTL."""
+    conn_check_file = Path(CONN_CHECK_PATH)
+    if not conn_check_file.exists():
+        return {}
+
+    try:
+        with conn_check_file.open() as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        log.debug("failed to read connection check file at path: %s", conn_check_file)
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    now = time.time()
+    return {
+        key: checked_at
+        for key, checked_at in data.items()
+        if isinstance(checked_at, (int, float)) and now < checked_at + CONN_CHECK_TIME
+    }
+
+
+def _update_connection_check_file(cache_key):
+    conn_check_file = Path(CONN_CHECK_PATH)
+    try:
+        data = _load_connection_check_file()
+        data[f"{cache_key[0]}:{cache_key[1]}"] = time.time()
+        conn_check_file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temp file and rename so concurrent bonfire runs never see a partial file
+        tmp_file = conn_check_file.with_name(
+            f".{conn_check_file.name}.{os.getpid()}.{threading.get_ident()}"
+        )
+        with tmp_file.open(mode="w") as fp:
+            json.dump(data, fp)
+        os.replace(tmp_file, conn_check_file)
+    except OSError:
+        log.debug("failed to update connection check file at path: %s", conn_check_file)
+
+
+def _connection_check_cached(cache_key):
+    global _connection_check_cache_loaded
+
+    with _connection_check_lock:
+        if not _connection_check_cache_loaded:
+            for key in _load_connection_check_file():
+                hostname, _, port = key.rpartition(":")
+                if hostname and port.isdigit():
+                    _connection_check_cache.add((hostname, int(port)))
+            _connection_check_cache_loaded = True
+
+        return cache_key in _connection_check_cache
 
 
 def _perform_head_request(url, timeout, session=None, verify=None):
@@ -703,7 +819,9 @@ def _perform_head_request(url, timeout, session=None, verify=None):
     Raises:
         FatalError: With detailed error message if connection fails
     """
-    session = session or requests.Session()
+    import requests
+
+    session = session or _new_session()
     parsed_url = urlparse(url)
     hostname = parsed_url.hostname
     port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
@@ -743,18 +861,37 @@ def _check_connection(hostname, port=443, timeout=(1, 5), session=None, fetch_ce
     """
     Check connection makes sure a connection is available to a given hostname.
 
-    Successful checks are cached so we only check each hostname once.
+    Successful checks are cached (in memory and on disk for CONN_CHECK_TIME sec) so we only
+    check each hostname once. If a preflight check for this hostname is in flight, its result
+    is used instead of sending another request. A failed preflight check is raised once and
+    then forgotten, so the next call checks the host again.
     """
-    session = session or requests.Session()
-
     # Create cache key from arguments
     cache_key = (hostname, port)
 
     # If already verified, skip the check
-    if cache_key in _connection_check_cache:
+    if _connection_check_cached(cache_key):
         log.debug("skipping connection check for '%s', port %d (already verified)", hostname, port)
         return
 
+    future = _connection_check_futures.get(cache_key)
+    if future:
+        log.debug("waiting on preflight connection check for '%s', port %d", hostname, port)
+        try:
+            # re-raises the FatalError hit by the preflight check, if any
+            future.result()
+        except Exception:
+            _connection_check_futures.pop(cache_key, None)
+            raise
+        return
+
+    _run_connection_check(hostname, port, timeout, session=session, fetch_cert=fetch_cert)
+
+
+def _run_connection_check(hostname, port, timeout, session=None, fetch_cert=False):
+    cache_key = (hostname, port)
+    session = session or _new_session()
+
     log.debug("checking connection to '%s', port %d, timeout %s", hostname, port, timeout)
 
     # Construct the URL for the connection check
@@ -768,11 +905,12 @@ def _check_connection(hostname, port=443, timeout=(1, 5), session=None, fetch_ce
     _perform_head_request(url, timeout, session=session, verify=verify_cert)
 
     # Cache success
-    _connection_check_cache.add(cache_key)
+    with _connection_check_lock:
+        _connection_check_cache.add(cache_key)
+    _update_connection_check_file(cache_key)
 
 
-def check_url_connection(url, timeout=(1, 5), session=None, fetch_cert=False):
-    session = session or requests.Session()
+def _parse_url_for_connection_check(url):
     parsed_url = urlparse(url)
     scheme = parsed_url.scheme
     hostname = parsed_url.hostname
@@ -781,11 +919,71 @@ def check_url_connection(url, timeout=(1, 5), session=None, fetch_cert=False):
         raise ValueError(f"Invalid URL: '{url}'")
     if not port:
         port = 443 if scheme == "https" else 80
+    return hostname, port
+
+
+def check_url_connection(url, timeout=(1, 5), session=None, fetch_cert=False):
+    hostname, port = _parse_url_for_connection_check(url)
     _check_connection(
         hostname=hostname, port=port, timeout=timeout, session=session, fetch_cert=fetch_cert
     )
 
 
+def preflight_url_connections(urls, cert_urls=(), timeout=(1, 5)):
+    """
+    Start connectivity checks for all hosts an invocation will touch, concurrently.
+
+    'urls' are checked with default CA verification, 'cert_urls' are checked using the internal
+    GitLab CA cert (which gets downloaded as part of the check).
+
+    Returns immediately. Later calls to check_url_connection() for the same host wait on the
+    in-flight result instead of sending their own request. A failed preflight check is not
+    raised here, it is raised by the first check_url_connection() call that needs that host,
+    so hosts that turn out not to be needed never cause an error.
+    """
+    global _preflight_executor
+
+    checks = {}
+    for url, fetch_cert in [(u, False) for u in urls] + [(u, True) for u in cert_urls]:
+        try:
+            cache_key = _parse_url_for_connection_check(url)
+        except ValueError as err:
+            log.debug("skipping preflight connection check: %s", err)
+            continue
+        # a host checked with the internal CA cert covers a plain check as well
+        checks[cache_key] = checks.get(cache_key, False) or fetch_cert
+
+    for cache_key in checks:
+        future = _connection_check_futures.get(cache_key)
+        if future and future.done() and future.exception():
+            # check again rather than re-raise an earlier failure
+            del _connection_check_futures[cache_key]
+
+    pending = {
+        cache_key: fetch_cert
+        for cache_key, fetch_cert in checks.items()
+        if not _connection_check_cached(cache_key) and cache_key not in _connection_check_futures
+    }
+    if not pending:
+        return
+
+    if _preflight_executor is None:
+        _preflight_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="bonfire-preflight"
+        )
+
+    for (hostname, port), fetch_cert in pending.items():
+        log.debug("starting preflight connection check for '%s', port %d", hostname, port)
+        _connection_check_futures[(hostname, port)] = _preflight_executor.submit(
+            _run_connection_check,
+            hostname,
+            port,
+            timeout,
+            session=_new_session(),
+            fetch_cert=fetch_cert,
+        )
+
+
 def object_merge(old, new, merge_lists=True):
     """
     Recursively merge two data structures
@@ -0,0 +1,66 @@
+"""Awaitable front end for EphemeralK8sClient.
+
+The kubernetes Python client is synchronous. AsyncEphemeralK8sClient runs client methods, and
+bonfire_lib functions that take a client, on a bounded thread pool so an asyncio server (the
+MCP server) can serve several requests at once without a slow API call stalling the event loop.
+"""
+
+import asyncio
+import functools
+import os
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from bonfire_lib.k8s_client import EphemeralK8sClient
+
+# Max blocking calls in flight at once. Waits (reserve, wait_for_cluster) hold a worker for
+# as long as they wait, so this also bounds concurrent waits plus regular calls.
+ASYNC_MAX_WORKERS = int(os.getenv("BONFIRE_ASYNC_MAX_WORKERS", "16"))
+
+_DONE = object()
+
+
+class AsyncEphemeralK8sClient:
+    """Wrap an EphemeralK8sClient so its calls can be awaited.
+
+    Client methods are available as coroutines, e.g. 'await aclient.get_reservation(name)'.
+    Use run() for bonfire_lib functions taking the client as first argument and iterate()
+    for generators such as clusters.wait_for_cluster().
+    """
+
+    def __init__(self, client: EphemeralK8sClient, max_workers: int | None = None):
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or ASYNC_MAX_WORKERS, thread_name_prefix="bonfire-k8s"
+        )
+
+    async def _submit(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Await func(client, *args, **kwargs) run on the executor."""
+        return await self._submit(func, self.client, *args, **kwargs)
+
+    async def iterate(self, iterator: Iterator) -> AsyncIterator:
+        """Advance a blocking iterator on the executor, yielding each item."""
+        while True:
+            item = await self._submit(next, iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._submit(attr, *args, **kwargs)
+
+        return method
+
+    def close(self) -> None:
+        """Stop the executor once in-flight calls finish."""
+        self._executor.shutdown(wait=False)
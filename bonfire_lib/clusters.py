@@ -2,15 +2,19 @@
 
 Handles ROSA HCP cluster reservations via ClusterReservation CRDs.
 Unlike namespace reservations, cluster provisioning is async (20-40 min),
-so reserve returns immediately and the caller polls status.
+so reserve returns immediately and the caller follows provisioning with
+wait_for_cluster() or polls status.
 """
 
 import base64
 import logging
+import time
 import uuid
 
 from bonfire_lib.core_resources import render_cluster_reservation
-from bonfire_lib.k8s_client import EphemeralK8sClient
+from bonfire_lib.k8s_client import CRD_API_VERSION, EphemeralK8sClient
+from bonfire_lib.snapshot import load_snapshot
+from bonfire_lib.status import follow_object, get_reservation_summary
 from bonfire_lib.utils import FatalError, hms_to_seconds, duration_fmt
 
 log = logging.getLogger(__name__)
@@ -19,6 +23,7 @@ DEFAULT_CLUSTER_DURATION = "4h"
 DEFAULT_CLUSTER_POOL = "rosa-default"
 KUBECONFIG_SECRET_SUFFIX = "-kubeconfig"
 KUBECONFIG_SECRET_NAMESPACE = "ephemeral-cluster-operator"
+DEFAULT_CLUSTER_WAIT_TIMEOUT = 3600
 
 
 def reserve_cluster(
@@ -31,8 +36,8 @@ def reserve_cluster(
 ) -> dict:
     """Reserve a ROSA HCP cluster. Returns immediately (async provisioning).
 
-    Unlike namespace reservations, this does NOT poll for assignment.
-    The caller should use get_cluster_status() to poll.
+    Unlike namespace reservations, this does NOT wait for assignment.
+    The caller should use wait_for_cluster() or get_cluster_status().
 
     Args:
         client: K8s API client
@@ -137,7 +142,10 @@ def get_cluster_status(
     res = client.get_cluster_reservation(name)
     if not res:
         return None
+    return _cluster_summary(res)
 
+
+def _cluster_summary(res: dict) -> dict:
     status = res.get("status", {})
     spec = res.get("spec", {})
     creation = res.get("metadata", {}).get("creationTimestamp", "")
@@ -156,6 +164,69 @@ def get_cluster_status(
     }
 
 
+def wait_for_cluster(
+    client: EphemeralK8sClient,
+    name: str,
+    timeout: int = DEFAULT_CLUSTER_WAIT_TIMEOUT,
+):
+    """Follow a cluster reservation until its cluster is active and its kubeconfig exists.
+
+    Watches the ClusterReservation and yields a status dict (see get_cluster_status(), plus
+    'kubeconfig_ready') each time its state changes, e.g. waiting -> provisioning -> active.
+    Once active, waits for the '<cluster>-kubeconfig' Secret and yields a final dict with
+    'kubeconfig_ready' set to True.
+
+    Raises:
+        FatalError: If the reservation does not exist, is deleted or expires
+        TimeoutError: If the cluster is not ready within 'timeout' sec
+    """
+    deadline = time.monotonic() + timeout
+    state = None
+    summary = None
+
+    for res in follow_object(
+        client,
+        CRD_API_VERSION,
+        "ClusterReservation",
+        name,
+        lambda: client.get_cluster_reservation(name),
+        deadline,
+    ):
+        if not res:
+            raise FatalError(f"Cluster reservation '{name}' not found")
+        summary = {**_cluster_summary(res), "kubeconfig_ready": False}
+        if summary["state"] != state:
+            state = summary["state"]
+            log.info("cluster reservation '%s' is '%s'", name, state or "pending")
+            yield summary
+        if state == "expired":
+            raise FatalError(f"Cluster reservation '{name}' has expired. Reserve a new cluster.")
+        if state == "active" and summary["cluster_name"]:
+            break
+    else:
+        raise TimeoutError(
+            f"timed out after {timeout}s waiting for cluster reservation '{name}' to be active"
+        )
+
+    secret_name = f"{summary['cluster_name']}{KUBECONFIG_SECRET_SUFFIX}"
+    log.info("waiting for kubeconfig Secret '%s'", secret_name)
+    for secret in follow_object(
+        client,
+        "v1",
+        "Secret",
+        secret_name,
+        lambda: client.get_secret(secret_name, KUBECONFIG_SECRET_NAMESPACE),
+        deadline,
+        namespace=KUBECONFIG_SECRET_NAMESPACE,
+    ):
+        if secret:
+            log.info("kubeconfig for cluster reservation '%s' is ready", name)
+            yield {**summary, "kubeconfig_ready": True}
+            return
+
+    raise TimeoutError(f"timed out after {timeout}s waiting for kubeconfig Secret '{secret_name}'")
+
+
 def get_kubeconfig(
     client: EphemeralK8sClient,
     name: str,
@@ -227,20 +298,38 @@ def list_cluster_reservations(
         log.debug("ClusterReservation CRD not available")
         return []
 
-    result = []
-    for res in raw:
-        s = res.get("status", {})
-        sp = res.get("spec", {})
-        result.append(
-            {
-                "name": res["metadata"]["name"],
-                "type": "cluster",
-                "cluster_name": s.get("clusterName", ""),
-                "state": s.get("state", ""),
-                "expiration": s.get("expiration", ""),
-                "requester": sp.get("requester", ""),
-                "pool": sp.get("pool", DEFAULT_CLUSTER_POOL),
-                "duration": sp.get("duration", ""),
-            }
-        )
-    return result
+    return [summarize_cluster_reservation(res) for res in raw]
+
+
+def summarize_cluster_reservation(res: dict) -> dict:
+    """Return the fields of a ClusterReservation shown in reservation listings."""
+    s = res.get("status", {})
+    sp = res.get("spec", {})
+    return {
+        "name": res["metadata"]["name"],
+        "type": "cluster",
+        "cluster_name": s.get("clusterName", ""),
+        "state": s.get("state", ""),
+        "expiration": s.get("expiration", ""),
+        "requester": sp.get("requester", ""),
+        "pool": sp.get("pool", DEFAULT_CLUSTER_POOL),
+        "duration": sp.get("duration", ""),
+    }
+
+
+def list_all_reservations(client: EphemeralK8sClient, requester: str | None = None) -> dict:
+    """List namespace and cluster reservations from a single concurrent snapshot.
+
+    Returns:
+        dict with "namespace_reservations" and "cluster_reservations" keys. Cluster
+        reservations are empty if the ClusterReservation CRD is not installed.
+    """
+    kinds = ("reservations", "cluster_reservations")
+    selectors = {kind: f"requester={requester}" for kind in kinds} if requester else None
+    snapshot = load_snapshot(client, kinds, label_selectors=selectors)
+    return {
+        "namespace_reservations": [get_reservation_summary(res) for res in snapshot.reservations],
+        "cluster_reservations": [
+            summarize_cluster_reservation(res) for res in snapshot.cluster_reservations or []
+        ],
+    }
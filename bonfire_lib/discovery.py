@@ -0,0 +1,45 @@
+"""On-disk cache for Kubernetes API discovery.
+
+The DynamicClient stores the API groups and resources it discovers in a JSON cache file. Its
+default file lives in the system temp dir, is keyed only by the API server URL and never
+expires. This module places the file in bonfire's cache dir, keys it by API server URL and
+server version (so a cluster upgrade never reuses a stale resource list) and expires it after
+DISCOVERY_CACHE_TTL seconds.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+DISCOVERY_CACHE_TTL = int(os.getenv("BONFIRE_DISCOVERY_CACHE_TTL", "3600"))
+
+
+def get_cache_dir(name: str = "discovery") -> Path:
+    """Return the directory bonfire's 'name' cache files are written to."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(cache_home).joinpath("bonfire", name)
+
+
+def cache_file(server: str, server_version: str, ttl: int | None = None) -> str:
+    """Return the discovery cache file path for an API server.
+
+    An existing file older than 'ttl' (default DISCOVERY_CACHE_TTL) sec is removed so the
+    DynamicClient re-discovers the cluster's API resources and writes a fresh one.
+    """
+    ttl = DISCOVERY_CACHE_TTL if ttl is None else ttl
+    cache_id = hashlib.sha256(f"{server}|{server_version}".encode()).hexdigest()[:32]
+    path = get_cache_dir().joinpath(f"{cache_id}.json")
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and time.time() - path.stat().st_mtime > ttl:
+            log.debug("discovery cache for '%s' expired, removing %s", server, path)
+            path.unlink()
+    except OSError as err:
+        log.debug("unable to prepare discovery cache dir '%s': %s", path.parent, err)
+
+    return str(path)
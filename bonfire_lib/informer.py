@@ -0,0 +1,269 @@
+"""Watch-backed cache of reservations and pools for long-running processes.
+
+The MCP server answers many status/list requests for the same few hundred reservation and
+pool CRs. CachedK8sClient lists each kind once, follows it with a cluster-wide watch (via
+readiness.ResourceCache) and serves reads from memory while the watch is current. Reads
+fall back to the API when a kind's watch has been broken for longer than 'max_staleness'.
+
+Writes go to the API, then block until the watch has delivered the written resourceVersion
+(bounded by 'write_sync_timeout'), so a tool that reserves or extends and then lists sees
+its own change.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+
+from bonfire_lib.k8s_client import CRD_API_VERSION, EphemeralK8sClient
+from bonfire_lib.readiness import KindSpec, ResourceCache
+
+log = logging.getLogger(__name__)
+
+INFORMER_KINDS = (
+    KindSpec("NamespaceReservation", CRD_API_VERSION, namespaced=False),
+    KindSpec("NamespacePool", CRD_API_VERSION, namespaced=False),
+    KindSpec("ClusterReservation", CRD_API_VERSION, namespaced=False, optional=True),
+    KindSpec("ClusterPool", CRD_API_VERSION, namespaced=False, optional=True),
+)
+
+# Serve reads from the cache unless its watch has been broken for longer than this (sec)
+MAX_STALENESS = float(os.getenv("BONFIRE_INFORMER_MAX_STALENESS", "30"))
+# How long a write waits for the watch to deliver the written object (sec)
+WRITE_SYNC_TIMEOUT = float(os.getenv("BONFIRE_INFORMER_WRITE_SYNC_TIMEOUT", "5"))
+
+
+def _parse_label_selector(selector: str) -> list[tuple] | None:
+    """Parse an equality-based label selector into (key, op, value) requirements.
+
+    Returns None for syntax not handled here (set-based 'in'/'notin').
+    """
+    if "(" in selector:
+        return None
+    requirements = []
+    for term in (t.strip() for t in selector.split(",")):
+        if not term:
+            continue
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            requirements.append((key.strip(), "!=", value.strip()))
+        elif "=" in term:
+            key, value = term.replace("==", "=", 1).split("=", 1)
+            requirements.append((key.strip(), "=", value.strip()))
+        elif term.startswith("!"):
+            requirements.append((term[1:].strip(), "!", None))
+        elif " " in term:
+            return None
+        else:
+            requirements.append((term, "exists", None))
+    return requirements
+
+
+def _matches(obj: dict, requirements: list[tuple]) -> bool:
+    labels = obj.get("metadata", {}).get("labels") or {}
+    for key, op, value in requirements:
+        if op == "=" and labels.get(key) != value:
+            return False
+        if op == "!=" and labels.get(key) == value:
+            return False
+        if op == "exists" and key not in labels:
+            return False
+        if op == "!" and key in labels:
+            return False
+    return True
+
+
+def _version_reached(obj: dict | None, resource_version: str) -> bool:
+    if obj is None:
+        return False
+    cached = obj.get("metadata", {}).get("resourceVersion")
+    try:
+        return int(cached) >= int(resource_version)
+    except (TypeError, ValueError):
+        # resourceVersions are opaque strings, only etcd-backed servers make them comparable
+        return cached == resource_version
+
+
+class CachedK8sClient:
+    """EphemeralK8sClient whose reservation and pool reads are served from a watch cache.
+
+    Methods not overridden here are delegated to the wrapped client. Objects returned from
+    the cache are shared with it and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        client: EphemeralK8sClient,
+        kinds=INFORMER_KINDS,
+        max_staleness: float | None = None,
+        write_sync_timeout: float | None = None,
+    ):
+        self.client = client
+        self.max_staleness = MAX_STALENESS if max_staleness is None else max_staleness
+        self.write_sync_timeout = (
+            WRITE_SYNC_TIMEOUT if write_sync_timeout is None else write_sync_timeout
+        )
+        self._api_versions = {spec.kind: spec.api_version for spec in kinds}
+        self.cache = ResourceCache(client, namespace=None, kinds=kinds)
+
+    def start(self) -> "CachedK8sClient":
+        """List every cached kind and start watching.
+
+        Raises FatalError if a non-optional kind cannot be listed.
+        """
+        self.cache.start()
+        return self
+
+    def stop(self) -> None:
+        self.cache.stop()
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+    def _fresh(self, kind: str) -> bool:
+        staleness = self.cache.staleness(kind)
+        return staleness is not None and staleness <= self.max_staleness
+
+    def _cached(self, kind: str, label_selector: str | None = None) -> list[dict] | None:
+        """Return the cached items of 'kind', None if the API must be used instead."""
+        if not self._fresh(kind):
+            return None
+        items = self.cache.items(kind)
+        if not label_selector:
+            return items
+        requirements = _parse_label_selector(label_selector)
+        if requirements is None:
+            return None
+        return [obj for obj in items if _matches(obj, requirements)]
+
+    def _get(self, kind: str, name: str, fallback) -> dict | None:
+        if not self._fresh(kind):
+            return fallback(name)
+        return self.cache.get(f"{kind.lower()}/{name}")
+
+    def _wait_for_write(self, kind: str, obj: dict) -> dict:
+        """Block until the cache holds 'obj' at its resourceVersion or newer."""
+        resource_version = obj.get("metadata", {}).get("resourceVersion")
+        if not resource_version or self.cache.staleness(kind) is None:
+            return obj
+        key = f"{kind.lower()}/{obj['metadata']['name']}"
+        deadline = time.monotonic() + self.write_sync_timeout
+        generation = self.cache.generation
+        while not _version_reached(self.cache.get(key), resource_version):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.cache.stopped:
+                log.debug("cache did not observe %s at version %s", key, resource_version)
+                break
+            generation = self.cache.wait_for_change(generation, remaining)
+        return obj
+
+    # --- NamespaceReservation operations ---
+
+    def create_reservation(self, body: dict) -> dict:
+        return self._wait_for_write("NamespaceReservation", self.client.create_reservation(body))
+
+    def get_reservation(self, name: str) -> dict | None:
+        return self._get("NamespaceReservation", name, self.client.get_reservation)
+
+    def list_reservations(self, label_selector: str | None = None) -> list[dict]:
+        return list(self.iter_reservations(label_selector=label_selector))
+
+    def iter_reservations(
+        self, label_selector: str | None = None, page_size: int | None = None
+    ) -> Iterator[dict]:
+        items = self._cached("NamespaceReservation", label_selector)
+        if items is None:
+            return self.client.iter_reservations(label_selector=label_selector, page_size=page_size)
+        return iter(items)
+
+    def patch_reservation(self, name: str, body: dict) -> dict:
+        return self._wait_for_write(
+            "NamespaceReservation", self.client.patch_reservation(name, body)
+        )
+
+    # --- NamespacePool operations ---
+
+    def list_pools(self) -> list[dict]:
+        return list(self.iter_pools())
+
+    def iter_pools(self, page_size: int | None = None) -> Iterator[dict]:
+        items = self._cached("NamespacePool")
+        if items is None:
+            return self.client.iter_pools(page_size=page_size)
+        return iter(items)
+
+    def get_pool(self, name: str) -> dict | None:
+        return self._get("NamespacePool", name, self.client.get_pool)
+
+    # --- ClusterReservation operations ---
+
+    def create_cluster_reservation(self, body: dict) -> dict:
+        return self._wait_for_write(
+            "ClusterReservation", self.client.create_cluster_reservation(body)
+        )
+
+    def get_cluster_reservation(self, name: str) -> dict | None:
+        return self._get("ClusterReservation", name, self.client.get_cluster_reservation)
+
+    def list_cluster_reservations(self, label_selector: str | None = None) -> list[dict]:
+        return list(self.iter_cluster_reservations(label_selector=label_selector))
+
+    def iter_cluster_reservations(
+        self, label_selector: str | None = None, page_size: int | None = None
+    ) -> Iterator[dict]:
+        items = self._cached("ClusterReservation", label_selector)
+        if items is None:
+            return self.client.iter_cluster_reservations(
+                label_selector=label_selector, page_size=page_size
+            )
+        return iter(items)
+
+    def patch_cluster_reservation(self, name: str, body: dict) -> dict:
+        return self._wait_for_write(
+            "ClusterReservation", self.client.patch_cluster_reservation(name, body)
+        )
+
+    # --- ClusterPool operations ---
+
+    def list_cluster_pools(self) -> list[dict]:
+        return list(self.iter_cluster_pools())
+
+    def iter_cluster_pools(self, page_size: int | None = None) -> Iterator[dict]:
+        items = self._cached("ClusterPool")
+        if items is None:
+            return self.client.iter_cluster_pools(page_size=page_size)
+        return iter(items)
+
+    def get_cluster_pool(self, name: str) -> dict | None:
+        return self._get("ClusterPool", name, self.client.get_cluster_pool)
+
+    # --- Generic operations ---
+
+    def list_resources(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        cacheable = self._api_versions.get(kind) == api_version and not namespace
+        name = None
+        if field_selector:
+            # only the single-name selector used to watch one cluster-scoped object
+            if field_selector.startswith("metadata.name=") and "," not in field_selector:
+                name = field_selector.split("=", 1)[1]
+            else:
+                cacheable = False
+        items = self._cached(kind, label_selector) if cacheable else None
+        if items is not None and name is not None:
+            items = [obj for obj in items if obj["metadata"]["name"] == name]
+        if items is None:
+            return self.client.list_resources(
+                api_version,
+                kind,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+        return items, self.cache.resource_version(kind)
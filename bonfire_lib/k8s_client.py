@@ -6,14 +6,22 @@ Supports three auth modes: explicit server+token, in-cluster, kubeconfig.
 
 import atexit
 import base64
+import functools
+import json
 import logging
 import os
 import tempfile
+import threading
+from collections.abc import Iterator
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client import ApisApi, ApiException
 from kubernetes.config import ConfigException
+from kubernetes.config.kube_config import KUBE_CONFIG_DEFAULT_LOCATION, KubeConfigMerger
 from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from bonfire_lib import discovery
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +29,12 @@ CRD_API_VERSION = "cloud.redhat.com/v1alpha1"
 
 DEFAULT_READ_TIMEOUT = 30
 DEFAULT_WRITE_TIMEOUT = 60
+DEFAULT_WATCH_TIMEOUT = 300
+# Client-side read timeout of a watch beyond its server-side timeout, ends half-open streams
+WATCH_READ_TIMEOUT_MARGIN = 10
+
+# Max items per list response for the iter_*() methods
+LIST_PAGE_SIZE = int(os.getenv("BONFIRE_LIST_PAGE_SIZE", "500"))
 
 
 def _sanitize_username(name: str) -> str:
@@ -43,6 +57,46 @@ def _extract_username(context_user: str) -> str:
     return context_user
 
 
+def _read_json(response) -> dict:
+    """Decode a raw (not preloaded) API response body straight into plain dicts.
+
+    Building DynamicClient ResourceInstances or typed models and converting them back with
+    .to_dict() walks every object twice, which for large lists costs more than the request.
+    Like ResourceInstance, list items are given the list's apiVersion and item kind.
+    """
+    body = json.loads(response.data)
+    kind = body.get("kind") or ""
+    if kind.endswith("List") and body.get("items"):
+        for item in body["items"]:
+            item.setdefault("apiVersion", body.get("apiVersion"))
+            item.setdefault("kind", kind[:-4])
+    return body
+
+
+def _get_json(resource, **kwargs) -> dict:
+    """GET through a DynamicClient resource handle, returning the decoded JSON body."""
+    return _read_json(resource.get(serialize=False, **kwargs))
+
+
+def _paginate(list_fn, page_size: int | None = None, **kwargs) -> Iterator[dict]:
+    """Yield the items of a list call, fetching 'page_size' items per request.
+
+    'list_fn' returns a decoded list response. Uses the API server's limit/continue
+    chunking, so only one page is held in memory and callers that stop iterating early skip
+    the remaining requests. A continue token that expires between pages raises ApiException
+    with status 410.
+    """
+    kwargs["limit"] = page_size or LIST_PAGE_SIZE
+    kwargs.setdefault("_request_timeout", DEFAULT_READ_TIMEOUT)
+    while True:
+        page = list_fn(**kwargs)
+        yield from page.get("items") or []
+        token = page.get("metadata", {}).get("continue")
+        if not token:
+            return
+        kwargs["_continue"] = token
+
+
 class EphemeralK8sClient:
     """Kubernetes API client for ephemeral resource CRDs.
 
@@ -112,8 +166,27 @@ class EphemeralK8sClient:
                         "Unable to load kubeconfig and not running in-cluster"
                     ) from e
 
-        self._dynamic = DynamicClient(self._api_client)
+        self._dynamic = DynamicClient(self._api_client, cache_file=self._discovery_cache_file())
         self._core_v1 = client.CoreV1Api(self._api_client)
+        self._api_resource_cache = {}
+        self._discovery_lock = threading.Lock()
+
+    @property
+    def server(self) -> str:
+        """URL of the API server this client talks to."""
+        return self._api_client.configuration.host
+
+    def _discovery_cache_file(self) -> str | None:
+        """Discovery cache file for this API server, keyed by server URL and version."""
+        server = self.server
+        try:
+            version = client.VersionApi(self._api_client).get_code(
+                _request_timeout=DEFAULT_READ_TIMEOUT
+            )
+        except Exception as e:
+            log.debug("unable to get server version, not caching discovery: %s", e)
+            return None
+        return discovery.cache_file(server, version.git_version)
 
     @staticmethod
     def _is_in_cluster() -> bool:
@@ -121,15 +194,23 @@ class EphemeralK8sClient:
         return os.path.exists("/var/run/secrets/kubernetes.io/serviceaccount/token")
 
     def _get_resource(self, kind: str):
-        """Get a DynamicClient resource handle for a cloud.redhat.com/v1alpha1 CRD."""
+        """Get a DynamicClient resource handle for a cloud.redhat.com/v1alpha1 CRD.
+
+        Handles are memoized by get_api_resource(), so only the first use of a kind per
+        client does a discovery lookup.
+        """
         try:
-            return self._dynamic.resources.get(api_version=CRD_API_VERSION, kind=kind)
+            resource = self.get_api_resource(CRD_API_VERSION, kind)
         except Exception as e:
             # Log available resources for debugging
             log.error(
                 f"Failed to get resource {kind} from {CRD_API_VERSION}. "
                 f"Error: {e.__class__.__name__}: {e}"
             )
+            return None
+        if resource is None:
+            log.error(f"Failed to get resource {kind} from {CRD_API_VERSION}: not served")
+        return resource
 
     # --- NamespaceReservation operations ---
 
@@ -142,7 +223,7 @@ class EphemeralK8sClient:
         """Get a NamespaceReservation by name. Returns None if not found."""
         resource = self._get_resource("NamespaceReservation")
         try:
-            return resource.get(name=name, _request_timeout=DEFAULT_READ_TIMEOUT).to_dict()
+            return _get_json(resource, name=name, _request_timeout=DEFAULT_READ_TIMEOUT)
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -150,11 +231,15 @@ class EphemeralK8sClient:
 
     def list_reservations(self, label_selector: str | None = None) -> list[dict]:
         """List all NamespaceReservation CRs."""
+        return list(self.iter_reservations(label_selector=label_selector))
+
+    def iter_reservations(
+        self, label_selector: str | None = None, page_size: int | None = None
+    ) -> Iterator[dict]:
+        """Iterate over NamespaceReservation CRs, fetching them one page at a time."""
         resource = self._get_resource("NamespaceReservation")
-        kwargs = {"_request_timeout": DEFAULT_READ_TIMEOUT}
-        if label_selector:
-            kwargs["label_selector"] = label_selector
-        return [item.to_dict() for item in resource.get(**kwargs).items]
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        return _paginate(functools.partial(_get_json, resource), page_size, **kwargs)
 
     def patch_reservation(self, name: str, body: dict) -> dict:
         """Patch a NamespaceReservation CR (merge patch)."""
@@ -170,16 +255,18 @@ class EphemeralK8sClient:
 
     def list_pools(self) -> list[dict]:
         """List all NamespacePool CRs."""
+        return list(self.iter_pools())
+
+    def iter_pools(self, page_size: int | None = None) -> Iterator[dict]:
+        """Iterate over NamespacePool CRs, fetching them one page at a time."""
         resource = self._get_resource("NamespacePool")
-        return [
-            item.to_dict() for item in resource.get(_request_timeout=DEFAULT_READ_TIMEOUT).items
-        ]
+        return _paginate(functools.partial(_get_json, resource), page_size)
 
     def get_pool(self, name: str) -> dict | None:
         """Get a NamespacePool by name."""
         resource = self._get_resource("NamespacePool")
         try:
-            return resource.get(name=name, _request_timeout=DEFAULT_READ_TIMEOUT).to_dict()
+            return _get_json(resource, name=name, _request_timeout=DEFAULT_READ_TIMEOUT)
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -196,7 +283,7 @@ class EphemeralK8sClient:
         """Get a ClusterReservation by name. Returns None if not found."""
         resource = self._get_resource("ClusterReservation")
         try:
-            return resource.get(name=name, _request_timeout=DEFAULT_READ_TIMEOUT).to_dict()
+            return _get_json(resource, name=name, _request_timeout=DEFAULT_READ_TIMEOUT)
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -204,11 +291,15 @@ class EphemeralK8sClient:
 
     def list_cluster_reservations(self, label_selector: str | None = None) -> list[dict]:
         """List all ClusterReservation CRs."""
+        return list(self.iter_cluster_reservations(label_selector=label_selector))
+
+    def iter_cluster_reservations(
+        self, label_selector: str | None = None, page_size: int | None = None
+    ) -> Iterator[dict]:
+        """Iterate over ClusterReservation CRs, fetching them one page at a time."""
         resource = self._get_resource("ClusterReservation")
-        kwargs = {"_request_timeout": DEFAULT_READ_TIMEOUT}
-        if label_selector:
-            kwargs["label_selector"] = label_selector
-        return [item.to_dict() for item in resource.get(**kwargs).items]
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        return _paginate(functools.partial(_get_json, resource), page_size, **kwargs)
 
     def patch_cluster_reservation(self, name: str, body: dict) -> dict:
         """Patch a ClusterReservation CR (merge patch)."""
@@ -224,16 +315,18 @@ class EphemeralK8sClient:
 
     def list_cluster_pools(self) -> list[dict]:
         """List all ClusterPool CRs."""
+        return list(self.iter_cluster_pools())
+
+    def iter_cluster_pools(self, page_size: int | None = None) -> Iterator[dict]:
+        """Iterate over ClusterPool CRs, fetching them one page at a time."""
         resource = self._get_resource("ClusterPool")
-        return [
-            item.to_dict() for item in resource.get(_request_timeout=DEFAULT_READ_TIMEOUT).items
-        ]
+        return _paginate(functools.partial(_get_json, resource), page_size)
 
     def get_cluster_pool(self, name: str) -> dict | None:
         """Get a ClusterPool by name."""
         resource = self._get_resource("ClusterPool")
         try:
-            return resource.get(name=name, _request_timeout=DEFAULT_READ_TIMEOUT).to_dict()
+            return _get_json(resource, name=name, _request_timeout=DEFAULT_READ_TIMEOUT)
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -244,9 +337,13 @@ class EphemeralK8sClient:
     def get_namespace(self, name: str) -> dict | None:
         """Get a namespace by name."""
         try:
-            return self._core_v1.read_namespace(
-                name=name, _request_timeout=DEFAULT_READ_TIMEOUT
-            ).to_dict()
+            return _read_json(
+                self._core_v1.read_namespace(
+                    name=name,
+                    _request_timeout=DEFAULT_READ_TIMEOUT,
+                    _preload_content=False,
+                )
+            )
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -255,9 +352,14 @@ class EphemeralK8sClient:
     def get_configmap(self, name: str, namespace: str) -> dict | None:
         """Get a ConfigMap by name and namespace."""
         try:
-            return self._core_v1.read_namespaced_config_map(
-                name=name, namespace=namespace, _request_timeout=DEFAULT_READ_TIMEOUT
-            ).to_dict()
+            return _read_json(
+                self._core_v1.read_namespaced_config_map(
+                    name=name,
+                    namespace=namespace,
+                    _request_timeout=DEFAULT_READ_TIMEOUT,
+                    _preload_content=False,
+                )
+            )
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -266,9 +368,14 @@ class EphemeralK8sClient:
     def get_secret(self, name: str, namespace: str) -> dict | None:
         """Get a Secret by name and namespace."""
         try:
-            return self._core_v1.read_namespaced_secret(
-                name=name, namespace=namespace, _request_timeout=DEFAULT_READ_TIMEOUT
-            ).to_dict()
+            return _read_json(
+                self._core_v1.read_namespaced_secret(
+                    name=name,
+                    namespace=namespace,
+                    _request_timeout=DEFAULT_READ_TIMEOUT,
+                    _preload_content=False,
+                )
+            )
         except ApiException as e:
             if e.status == 404:
                 return None
@@ -276,20 +383,31 @@ class EphemeralK8sClient:
 
     def list_namespaces(self, label_selector: str | None = None) -> list[dict]:
         """List namespaces, optionally filtered by label."""
-        kwargs = {"_request_timeout": DEFAULT_READ_TIMEOUT}
-        if label_selector:
-            kwargs["label_selector"] = label_selector
-        return [item.to_dict() for item in self._core_v1.list_namespace(**kwargs).items]
+        return list(self.iter_namespaces(label_selector=label_selector))
+
+    def iter_namespaces(
+        self, label_selector: str | None = None, page_size: int | None = None
+    ) -> Iterator[dict]:
+        """Iterate over namespaces, fetching them one page at a time."""
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        return _paginate(self._list_namespace_json, page_size, **kwargs)
+
+    def _list_namespace_json(self, **kwargs) -> dict:
+        return _read_json(self._core_v1.list_namespace(_preload_content=False, **kwargs))
 
     # --- Generic CRD operations (for ClowdApp, Frontend, etc.) ---
 
     def list_crds(self, kind: str, namespace: str | None = None) -> list[dict]:
         """List CRDs of a given kind, optionally in a namespace."""
+        return list(self.iter_crds(kind, namespace=namespace))
+
+    def iter_crds(
+        self, kind: str, namespace: str | None = None, page_size: int | None = None
+    ) -> Iterator[dict]:
+        """Iterate over CRDs of a given kind, fetching them one page at a time."""
         resource = self._get_resource(kind)
-        kwargs = {"_request_timeout": DEFAULT_READ_TIMEOUT}
-        if namespace:
-            kwargs["namespace"] = namespace
-        return [item.to_dict() for item in resource.get(**kwargs).items]
+        kwargs = {"namespace": namespace} if namespace else {}
+        return _paginate(functools.partial(_get_json, resource), page_size, **kwargs)
 
     def get_crd(self, kind: str, name: str, namespace: str | None = None) -> dict | None:
         """Get a single CRD by kind and name."""
@@ -298,12 +416,108 @@ class EphemeralK8sClient:
             kwargs = {"name": name, "_request_timeout": DEFAULT_READ_TIMEOUT}
             if namespace:
                 kwargs["namespace"] = namespace
-            return resource.get(**kwargs).to_dict()
+            return _get_json(resource, **kwargs)
         except ApiException as e:
             if e.status == 404:
                 return None
             raise
 
+    # --- Generic list/watch (any API group, used for readiness checks) ---
+
+    def get_api_resource(self, api_version: str, kind: str):
+        """Get a DynamicClient resource handle for any kind. Returns None if not served.
+
+        Results are memoized per client. API groups/versions missing from the (disk cached)
+        group list are answered without a lookup, since a DynamicClient lookup miss
+        invalidates its whole discovery cache.
+        """
+        cache_key = (api_version, kind)
+        with self._discovery_lock:
+            return self._get_api_resource(cache_key)
+
+    def _get_api_resource(self, cache_key):
+        api_version, kind = cache_key
+        if cache_key not in self._api_resource_cache:
+            resource = None
+            group, _, version = api_version.rpartition("/")
+            groups = self._dynamic.resources.parse_api_groups(request_resources=False)
+            group_served = version in groups["apis"].get(group, {}) if group else True
+            if group_served:
+                try:
+                    resource = self._dynamic.resources.get(api_version=api_version, kind=kind)
+                except ResourceNotFoundError:
+                    pass
+            self._api_resource_cache[cache_key] = resource
+        return self._api_resource_cache[cache_key]
+
+    def has_api_resource(self, api_version: str, kind: str) -> bool:
+        """Check whether the cluster serves a kind, e.g. ('cloud.redhat.com/v1alpha1', 'ClowdApp')."""
+        return self.get_api_resource(api_version, kind) is not None
+
+    def _require_api_resource(self, api_version: str, kind: str):
+        resource = self.get_api_resource(api_version, kind)
+        if resource is None:
+            raise ResourceNotFoundError(f"No matches found for {api_version} {kind}")
+        return resource
+
+    def list_resources(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """List resources of any kind.
+
+        Returns (items, resourceVersion) so callers can start a watch where the list left off.
+        Raises ResourceNotFoundError if the kind is not served by the cluster.
+        """
+        resource = self._require_api_resource(api_version, kind)
+        kwargs = {"_request_timeout": DEFAULT_READ_TIMEOUT}
+        if namespace:
+            kwargs["namespace"] = namespace
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        result = _get_json(resource, **kwargs)
+        return result.get("items") or [], result.get("metadata", {}).get("resourceVersion")
+
+    def watch_resources(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str | None = None,
+        resource_version: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: int = DEFAULT_WATCH_TIMEOUT,
+        watcher=None,
+    ):
+        """Stream (event_type, object) tuples for resources of any kind.
+
+        BOOKMARK events are requested so 'resource_version' can be kept current while nothing
+        changes. The stream ends after 'timeout' sec. An expired 'resource_version' raises
+        ApiException with status 410, callers should re-list and watch again. A connection
+        that stops delivering data raises urllib3's ReadTimeoutError shortly after 'timeout'.
+        """
+        resource = self._require_api_resource(api_version, kind)
+        watcher = watcher or watch.Watch()
+        # DynamicClient.watch() has no client-side timeout, stream resource.get directly
+        for event in watcher.stream(
+            resource.get,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            resource_version=resource_version,
+            serialize=False,
+            timeout_seconds=timeout,
+            allow_watch_bookmarks=True,
+            _request_timeout=(DEFAULT_READ_TIMEOUT, timeout + WATCH_READ_TIMEOUT_MARGIN),
+        ):
+            yield event["type"], event["raw_object"]
+
     # --- Identity ---
 
     def whoami(self) -> str:
@@ -346,3 +560,47 @@ class EphemeralK8sClient:
             pass
 
         return "unknown"
+
+
+_clients: dict[tuple, EphemeralK8sClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _kubeconfig_target(
+    kubeconfig_path: str | None, context: str | None
+) -> tuple[str, str | None, str | None]:
+    """Resolve (kubeconfig path, context name, API server URL) for a kubeconfig client."""
+    path = kubeconfig_path or os.environ.get("KUBECONFIG", KUBE_CONFIG_DEFAULT_LOCATION)
+    server = None
+    try:
+        kube_config = KubeConfigMerger(path).config
+        if kube_config is not None:
+            context = context or kube_config.safe_get("current-context")
+            cluster = kube_config["contexts"].get_with_name(context)["context"]["cluster"]
+            server = kube_config["clusters"].get_with_name(cluster)["cluster"]["server"]
+    except (ConfigException, KeyError, TypeError) as e:
+        log.debug("unable to resolve API server from kubeconfig '%s': %s", path, e)
+    return path, context, server
+
+
+def get_client(
+    kubeconfig_path: str | None = None, context: str | None = None
+) -> EphemeralK8sClient:
+    """Return a shared kubeconfig-mode EphemeralK8sClient.
+
+    Clients are cached for the life of the process, keyed by kubeconfig path, context and
+    API server, so repeated operations reuse one ApiClient connection pool, one parsed
+    kubeconfig and one DynamicClient discovery pass. Switching the current context to
+    another cluster yields a new client.
+    """
+    key = _kubeconfig_target(kubeconfig_path, context)
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = EphemeralK8sClient(kubeconfig_path=kubeconfig_path, context=context)
+        return _clients[key]
+
+
+def clear_clients() -> None:
+    """Drop all shared clients, e.g. after credentials in the kubeconfig have changed."""
+    with _clients_lock:
+        _clients.clear()
@@ -5,11 +5,50 @@ Replaces bonfire/openshift.py get_namespace_pools(), get_pool_size_limit()
 """
 
 import logging
+import os
 
 from bonfire_lib.k8s_client import EphemeralK8sClient
+from bonfire_lib.snapshot import load_snapshot
+from bonfire_lib.utils import FatalError
 
 log = logging.getLogger(__name__)
 
+# Rough sec until a reservation gets a namespace when the pool has one ready (handed out on
+# the operator's next reconcile) and when one must first be provisioned. Used by choose_pool().
+READY_WAIT = float(os.getenv("BONFIRE_POOL_READY_WAIT", "10"))
+PROVISION_WAIT = float(os.getenv("BONFIRE_POOL_PROVISION_WAIT", "300"))
+
+
+def summarize_pool(pool: dict) -> dict:
+    """Return the capacity stats of a NamespacePool resource."""
+    spec = pool.get("spec", {})
+    status = pool.get("status", {})
+    return {
+        "name": pool["metadata"]["name"],
+        "description": spec.get("description", ""),
+        "size": spec.get("size", 0),
+        "size_limit": spec.get("sizeLimit"),
+        "ready": status.get("ready", 0),
+        "creating": status.get("creating", 0),
+        "reserved": status.get("reserved", 0),
+    }
+
+
+def summarize_cluster_pool(pool: dict) -> dict:
+    """Return the capacity stats of a ClusterPool resource."""
+    spec = pool.get("spec", {})
+    status = pool.get("status", {})
+    return {
+        "name": pool["metadata"]["name"],
+        "type": "cluster",
+        "description": spec.get("description", ""),
+        "size": spec.get("size", 0),
+        "size_limit": spec.get("sizeLimit", 0),
+        "ready": status.get("ready", 0),
+        "provisioning": status.get("provisioning", 0),
+        "reserved": status.get("reserved", 0),
+    }
+
 
 def list_pools(client: EphemeralK8sClient) -> list[dict]:
     """List all namespace pools with capacity stats.
@@ -24,23 +63,7 @@ def list_pools(client: EphemeralK8sClient) -> list[dict]:
         - creating: number of namespaces being created
         - reserved: number of reserved namespaces
     """
-    pools = client.list_pools()
-    result = []
-    for pool in pools:
-        spec = pool.get("spec", {})
-        status = pool.get("status", {})
-        result.append(
-            {
-                "name": pool["metadata"]["name"],
-                "description": spec.get("description", ""),
-                "size": spec.get("size", 0),
-                "size_limit": spec.get("sizeLimit"),
-                "ready": status.get("ready", 0),
-                "creating": status.get("creating", 0),
-                "reserved": status.get("reserved", 0),
-            }
-        )
-    return result
+    return [summarize_pool(pool) for pool in client.list_pools()]
 
 
 def get_pool_capacity(client: EphemeralK8sClient, pool_name: str) -> dict | None:
@@ -52,18 +75,7 @@ def get_pool_capacity(client: EphemeralK8sClient, pool_name: str) -> dict | None
     pool = client.get_pool(pool_name)
     if not pool:
         return None
-
-    spec = pool.get("spec", {})
-    status = pool.get("status", {})
-    return {
-        "name": pool_name,
-        "description": spec.get("description", ""),
-        "size": spec.get("size", 0),
-        "size_limit": spec.get("sizeLimit"),
-        "ready": status.get("ready", 0),
-        "creating": status.get("creating", 0),
-        "reserved": status.get("reserved", 0),
-    }
+    return summarize_pool(pool)
 
 
 def list_cluster_pools(client: EphemeralK8sClient) -> list[dict]:
@@ -79,32 +91,74 @@ def list_cluster_pools(client: EphemeralK8sClient) -> list[dict]:
         log.debug("ClusterPool CRD not available, skipping cluster pools")
         return []
 
-    result = []
-    for pool in pools:
-        spec = pool.get("spec", {})
-        status = pool.get("status", {})
-        result.append(
-            {
-                "name": pool["metadata"]["name"],
-                "type": "cluster",
-                "description": spec.get("description", ""),
-                "size": spec.get("size", 0),
-                "size_limit": spec.get("sizeLimit", 0),
-                "ready": status.get("ready", 0),
-                "provisioning": status.get("provisioning", 0),
-                "reserved": status.get("reserved", 0),
-            }
-        )
-    return result
+    return [summarize_cluster_pool(pool) for pool in pools]
 
 
 def list_all_pools(client: EphemeralK8sClient) -> dict:
-    """List both namespace pools and cluster pools.
+    """List both namespace pools and cluster pools from a single concurrent snapshot.
 
     Returns:
         dict with "namespace_pools" and "cluster_pools" keys.
     """
+    snapshot = load_snapshot(client, ("pools", "cluster_pools"))
     return {
-        "namespace_pools": list_pools(client),
-        "cluster_pools": list_cluster_pools(client),
+        "namespace_pools": [summarize_pool(pool) for pool in snapshot.pools],
+        "cluster_pools": [summarize_cluster_pool(pool) for pool in snapshot.cluster_pools or []],
     }
+
+
+def estimate_wait(pool: dict, count: int = 1) -> float | None:
+    """Estimate sec until 'count' reservations from a pool (see summarize_pool()) are assigned.
+
+    Namespaces already being created are assumed half way done. Returns None if the pool
+    does not have room for 'count' more reservations under its sizeLimit.
+    """
+    size_limit = pool.get("size_limit") or 0
+    if size_limit and pool.get("reserved", 0) + count > size_limit:
+        return None
+    if pool.get("ready", 0) >= count:
+        return READY_WAIT
+    if pool.get("ready", 0) + pool.get("creating", 0) >= count:
+        return PROVISION_WAIT / 2
+    return PROVISION_WAIT
+
+
+def choose_pool(client: EphemeralK8sClient, candidates: list[str], count: int = 1) -> dict:
+    """Pick the candidate pool expected to assign 'count' namespaces soonest.
+
+    Capacity stats for all pools are read in one list call. Ties go to the candidate listed
+    first, so callers can order candidates by preference.
+
+    Returns:
+        The pool's summarize_pool() dict with an added 'expected_wait' (sec)
+
+    Raises:
+        FatalError: If no candidate pool exists or none has room under its sizeLimit
+    """
+    if not candidates:
+        raise FatalError("no candidate pools given")
+    by_name = {pool["name"]: pool for pool in list_pools(client)}
+    missing = [name for name in candidates if name not in by_name]
+    if len(missing) == len(candidates):
+        raise FatalError(f"none of the pools {', '.join(candidates)} exist on this cluster")
+    if missing:
+        log.info("ignoring pools that do not exist: %s", ", ".join(missing))
+
+    choices = []
+    for rank, name in enumerate(candidates):
+        wait = estimate_wait(by_name[name], count) if name in by_name else None
+        if wait is not None:
+            choices.append((wait, rank, by_name[name]))
+    if not choices:
+        raise FatalError(
+            f"pools {', '.join(candidates)} have no room for {count} more reservation(s)"
+        )
+    wait, _, pool = min(choices, key=lambda choice: choice[:2])
+    log.info(
+        "chose pool '%s' (%d ready, %d creating), expected wait: ~%ds",
+        pool["name"],
+        pool["ready"],
+        pool["creating"],
+        wait,
+    )
+    return {**pool, "expected_wait": wait}
@@ -0,0 +1,1111 @@
+"""Watch-based readiness checks for resources deployed into a namespace.
+
+Replaces ocviapy's ResourceWatcher / ResourceWaiter / wait_for_ready_threaded, which poll
+by running 'oc get' subprocesses. A ResourceCache lists each watched kind once and then
+follows a single watch stream per kind (resuming from the last resourceVersion, kept
+current by BOOKMARK events), so waiters are woken as soon as the API server reports a
+change.
+
+Readiness semantics match ocviapy's _check_status_for_restype().
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from kubernetes import watch
+from kubernetes.client import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from bonfire_lib.k8s_client import CRD_API_VERSION, DEFAULT_READ_TIMEOUT, EphemeralK8sClient
+from bonfire_lib.utils import FatalError, StatusError
+
+log = logging.getLogger(__name__)
+
+# Server-side timeout for a single watch request, the stream is resumed afterwards
+WATCH_TIMEOUT = 300
+# Delay before re-listing after an unexpected watch error
+WATCH_RETRY_DELAY = 2
+# How often a waiter logs that it is still waiting
+LOG_INTERVAL = 60
+
+# A terminal failure must persist this long before a wait is aborted
+FAILURE_GRACE_PERIOD = int(os.getenv("BONFIRE_FAILURE_GRACE_PERIOD", "30"))
+# Restarts after which a container in CrashLoopBackOff is considered terminally failed
+CRASHLOOP_RESTART_LIMIT = int(os.getenv("BONFIRE_CRASHLOOP_RESTART_LIMIT", "3"))
+
+IMAGE_PULL_ERRORS = ("ImagePullBackOff", "ErrImagePull", "ErrImageNeverPull")
+CONTAINER_CONFIG_ERRORS = ("CreateContainerConfigError", "CreateContainerError", "InvalidImageName")
+
+
+@dataclass(frozen=True)
+class KindSpec:
+    """A resource kind the readiness engine knows how to watch and evaluate.
+
+    optional -- kinds that may not be served/listable (CRDs, OpenShift-only kinds), silently
+        skipped if so
+    top_level -- waited on directly when waiting on "remaining" namespace resources
+    """
+
+    kind: str
+    api_version: str
+    namespaced: bool = True
+    optional: bool = False
+    top_level: bool = True
+
+
+# Ordered from "lowest" to "highest" on the ownership chain
+WATCHED_KINDS = (
+    KindSpec("Pod", "v1", top_level=False),
+    KindSpec("ReplicaSet", "apps/v1"),
+    KindSpec("ReplicationController", "v1"),
+    KindSpec("Job", "batch/v1", top_level=False),
+    KindSpec("DeploymentConfig", "apps.openshift.io/v1", optional=True),
+    KindSpec("Deployment", "apps/v1"),
+    KindSpec("StatefulSet", "apps/v1"),
+    KindSpec("DaemonSet", "apps/v1"),
+    KindSpec("Kafka", "kafka.strimzi.io/v1beta2", optional=True),
+    KindSpec("KafkaConnect", "kafka.strimzi.io/v1beta2", optional=True),
+    KindSpec("CyndiPipeline", "cyndi.cloud.redhat.com/v1alpha1", optional=True),
+    KindSpec("XJoinPipeline", "xjoin.cloud.redhat.com/v1alpha1", optional=True),
+    KindSpec("ClowdApp", CRD_API_VERSION, optional=True),
+    KindSpec("ClowdJobInvocation", CRD_API_VERSION, optional=True),
+    KindSpec("ClowdEnvironment", CRD_API_VERSION, namespaced=False, optional=True),
+    # Cluster API resources for ROSA HCP cluster provisioning
+    KindSpec("ROSAMachinePool", "infrastructure.cluster.x-k8s.io/v1beta2", optional=True),
+    KindSpec("ROSACluster", "infrastructure.cluster.x-k8s.io/v1beta2", optional=True),
+    KindSpec("ROSAControlPlane", "controlplane.cluster.x-k8s.io/v1beta2", optional=True),
+    KindSpec("MachinePool", "cluster.x-k8s.io/v1beta1", optional=True),
+    KindSpec("Cluster", "cluster.x-k8s.io/v1beta1", optional=True),
+)
+
+_KIND_SPECS = {spec.kind.lower(): spec for spec in WATCHED_KINDS}
+
+
+def resource_key(obj: dict) -> str:
+    """Return the '<kind>/<name>' key used to identify a resource, e.g. 'deployment/foo'."""
+    return f"{obj['kind'].lower()}/{obj['metadata']['name']}"
+
+
+# --- Readiness predicates ---
+
+
+def _condition_true(status: dict, cond_type: str) -> bool:
+    for c in status.get("conditions") or []:
+        if str(c.get("type")).lower() == cond_type.lower() and str(c.get("status")) == "True":
+            return True
+    return False
+
+
+def _deployment_ready(obj, status):
+    replicas = obj.get("spec", {}).get("replicas", 1)
+    return (
+        status.get("availableReplicas", 0) == replicas
+        and status.get("updatedReplicas", 0) == replicas
+    )
+
+
+def _replicaset_ready(obj, status):
+    return status.get("availableReplicas", 0) == obj.get("spec", {}).get("replicas", 1)
+
+
+def _statefulset_ready(obj, status):
+    return status.get("readyReplicas", 0) == obj.get("spec", {}).get("replicas", 1)
+
+
+def _daemonset_ready(obj, status):
+    return status.get("desiredNumberScheduled", 1) == status.get("numberAvailable")
+
+
+def _pod_ready(obj, status):
+    return str(status.get("phase", "")).lower() == "running"
+
+
+def _job_ready(obj, status):
+    return _condition_true(status, "Complete")
+
+
+def _clowd_ready(obj, status):
+    return _condition_true(status, "DeploymentsReady") and _condition_true(
+        status, "ReconciliationSuccessful"
+    )
+
+
+def _cji_ready(obj, status):
+    return _condition_true(status, "JobInvocationComplete") and _condition_true(
+        status, "ReconciliationSuccessful"
+    )
+
+
+def _kafka_ready(obj, status):
+    return _condition_true(status, "Ready")
+
+
+def _cyndi_ready(obj, status):
+    return _condition_true(status, "Valid") and status.get("activeTableName") is not None
+
+
+def _xjoin_ready(obj, status):
+    return _condition_true(status, "Valid") and status.get("activeIndexName") is not None
+
+
+def _capi_cluster_ready(obj, status):
+    return str(status.get("phase", "")).lower() == "provisioned" and _condition_true(
+        status, "Available"
+    )
+
+
+def _capi_machinepool_ready(obj, status):
+    # CAPI v1beta2 moved "Ready" to status.deprecated.v1beta1.conditions
+    v1beta1_status = (status.get("deprecated") or {}).get("v1beta1") or status
+    return _condition_true(v1beta1_status, "Ready")
+
+
+def _rosa_machinepool_ready(obj, status):
+    return _condition_true(status, "RosaMachinePoolReady")
+
+
+def _rosa_cluster_ready(obj, status):
+    return status.get("ready") is True
+
+
+def _rosa_control_plane_ready(obj, status):
+    return _condition_true(status, "ROSAControlPlaneReady")
+
+
+_READY_CHECKS = {
+    "pod": _pod_ready,
+    "job": _job_ready,
+    "replicaset": _replicaset_ready,
+    "replicationcontroller": _replicaset_ready,
+    "deploymentconfig": _deployment_ready,
+    "deployment": _deployment_ready,
+    "statefulset": _statefulset_ready,
+    "daemonset": _daemonset_ready,
+    "kafka": _kafka_ready,
+    "kafkaconnect": _kafka_ready,
+    "cyndipipeline": _cyndi_ready,
+    "xjoinpipeline": _xjoin_ready,
+    "clowdapp": _clowd_ready,
+    "clowdjobinvocation": _cji_ready,
+    "clowdenvironment": _clowd_ready,
+    "rosamachinepool": _rosa_machinepool_ready,
+    "rosacluster": _rosa_cluster_ready,
+    "rosacontrolplane": _rosa_control_plane_ready,
+    "machinepool": _capi_machinepool_ready,
+    "cluster": _capi_cluster_ready,
+}
+
+
+def is_ready(obj: dict) -> bool:
+    """Check whether a resource is "ready" (or "complete" for jobs).
+
+    Raises ValueError for kinds the engine does not know how to evaluate.
+    """
+    kind = obj["kind"].lower()
+    if kind not in _READY_CHECKS:
+        raise ValueError(f"Checking status for resource type {kind} currently not supported")
+
+    status = obj.get("status")
+    if not status:
+        return False
+
+    generation = obj.get("metadata", {}).get("generation")
+    status_generation = status.get("observedGeneration") or status.get("generation")
+    if generation and status_generation and generation != status_generation:
+        return False
+
+    return bool(_READY_CHECKS[kind](obj, status))
+
+
+def _pod_status_error(obj, status):
+    container_statuses = (status.get("initContainerStatuses") or []) + (
+        status.get("containerStatuses") or []
+    )
+    for container in container_statuses:
+        waiting = (container.get("state") or {}).get("waiting") or {}
+        reason = waiting.get("reason", "")
+        if reason in IMAGE_PULL_ERRORS or reason in CONTAINER_CONFIG_ERRORS:
+            detail = waiting.get("message", "")
+        elif reason == "CrashLoopBackOff":
+            restarts = container.get("restartCount", 0)
+            if restarts < CRASHLOOP_RESTART_LIMIT:
+                continue
+            detail = f"restarted {restarts} times"
+            terminated = (container.get("lastState") or {}).get("terminated") or {}
+            if terminated:
+                detail += (
+                    f", last exit code {terminated.get('exitCode')}"
+                    f" ({terminated.get('reason', 'unknown reason')})"
+                )
+        else:
+            continue
+        return f"{reason} error for {resource_key(obj)} (container '{container.get('name')}'): {detail}"
+    return None
+
+
+def _owning_cji(obj):
+    labels = obj["metadata"].get("labels") or {}
+    if labels.get("clowdjob"):
+        return labels["clowdjob"]
+    for ref in obj["metadata"].get("ownerReferences") or []:
+        if ref.get("kind") == "ClowdJobInvocation":
+            return ref.get("name")
+    return None
+
+
+def _job_status_error(obj, status):
+    cji_name = _owning_cji(obj)
+    if not cji_name:
+        return None
+    for c in status.get("conditions") or []:
+        if c.get("type") == "Failed" and str(c.get("status")) == "True":
+            return (
+                f"Failed error for {resource_key(obj)} (CJI '{cji_name}'): "
+                f"{c.get('message') or c.get('reason', '')}"
+            )
+    return None
+
+
+_STATUS_ERROR_CHECKS = {
+    "pod": _pod_status_error,
+    "job": _job_status_error,
+}
+
+
+def status_error(obj: dict) -> str | None:
+    """Return a description of a terminal failure reported by a resource, or None.
+
+    Terminal failures are image pull and container config errors, containers in
+    CrashLoopBackOff that restarted at least CRASHLOOP_RESTART_LIMIT times, and failed Jobs
+    run by a ClowdJobInvocation.
+    """
+    check = _STATUS_ERROR_CHECKS.get(obj["kind"].lower())
+    if not check:
+        return None
+    return check(obj, obj.get("status") or {})
+
+
+def details_str(obj: dict) -> str:
+    """Describe a resource's readiness and status conditions for log output."""
+    ready = is_ready(obj)
+    msg = f"{resource_key(obj)} {'' if ready else 'not '}ready"
+    conditions = []
+    for c in (obj.get("status") or {}).get("conditions") or []:
+        txt = f"{c.get('type')}: {c.get('status')}"
+        reason = c.get("message") or c.get("reason")
+        if reason:
+            txt += f" ({reason})"
+        conditions.append(txt)
+    if conditions:
+        msg += ", status conditions:\n" + "\n".join(f"  - {c}" for c in conditions)
+    error = status_error(obj)
+    if error:
+        msg += f"\n  - {error}"
+    return msg
+
+
+# --- Watch-backed resource cache ---
+
+
+class _WatchStream(threading.Thread):
+    """Keeps the cache current for one kind (and optional selectors) via list + watch."""
+
+    def __init__(
+        self, cache, spec: KindSpec, namespace=None, label_selector=None, field_selector=None
+    ):
+        super().__init__(daemon=True, name=f"watch-{spec.kind.lower()}")
+        self.cache = cache
+        self.spec = spec
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.synced = threading.Event()
+        self.error = None
+        self.disabled = False
+        # monotonic time since which the watch has not been known to be current
+        self.stale_since = time.monotonic()
+        self._keys = set()
+        self._resource_version = None
+        self._watcher = watch.Watch()
+
+    def _relist(self):
+        items, self._resource_version = self.cache.client.list_resources(
+            self.spec.api_version,
+            self.spec.kind,
+            namespace=self.namespace,
+            label_selector=self.label_selector,
+            field_selector=self.field_selector,
+        )
+        for item in items:
+            # list responses do not populate 'kind' on items
+            item.setdefault("kind", self.spec.kind)
+            item.setdefault("apiVersion", self.spec.api_version)
+        self._keys = self.cache._replace(self._keys, items)
+        self.stale_since = None
+
+    def _handle_initial_sync_error(self, err):
+        not_served = isinstance(err, ResourceNotFoundError) or (
+            isinstance(err, ApiException) and err.status in (403, 404)
+        )
+        if self.spec.optional and not_served:
+            if isinstance(err, ApiException) and err.status == 403:
+                log.warning(
+                    "client lacks 'list' permission for optional resource type '%s',"
+                    " skipping status checks for this resource type",
+                    self.spec.kind,
+                )
+            else:
+                log.debug("resource type '%s' not found on cluster, skipping", self.spec.kind)
+            self.disabled = True
+        else:
+            self.error = err
+        self.synced.set()
+
+    def _watch(self):
+        for event_type, obj in self.cache.client.watch_resources(
+            self.spec.api_version,
+            self.spec.kind,
+            namespace=self.namespace,
+            resource_version=self._resource_version,
+            label_selector=self.label_selector,
+            field_selector=self.field_selector,
+            timeout=WATCH_TIMEOUT,
+            watcher=self._watcher,
+        ):
+            if self.cache.stopped:
+                return
+            self._resource_version = obj.get("metadata", {}).get("resourceVersion")
+            self.stale_since = None
+            if event_type == "BOOKMARK":
+                continue
+            key = resource_key(obj)
+            if event_type == "DELETED":
+                self._keys.discard(key)
+                self.cache._delete(key)
+            else:
+                self._keys.add(key)
+                self.cache._update(key, obj)
+
+    def run(self):
+        try:
+            self._relist()
+        except Exception as err:
+            self._handle_initial_sync_error(err)
+            return
+        self.synced.set()
+
+        while not self.cache.stopped:
+            try:
+                if self._resource_version is None:
+                    self._relist()
+                self._watch()
+            except ApiException as err:
+                self._mark_stale()
+                if err.status == 410:
+                    log.debug("watch on '%s' expired, re-listing", self.spec.kind)
+                else:
+                    log.debug("watch on '%s' failed: %s", self.spec.kind, err)
+                    self.cache._stopped.wait(WATCH_RETRY_DELAY)
+                self._resource_version = None
+            except Exception as err:
+                if self.cache.stopped:
+                    return
+                self._mark_stale()
+                log.debug("watch on '%s' failed: %s: %s", self.spec.kind, type(err).__name__, err)
+                self._resource_version = None
+                self.cache._stopped.wait(WATCH_RETRY_DELAY)
+
+    def _mark_stale(self):
+        if self.stale_since is None:
+            self.stale_since = time.monotonic()
+
+    def stop(self):
+        self._watcher.stop()
+
+
+class ResourceCache:
+    """Local copy of the resources in a namespace, kept current by watch streams.
+
+    Namespaced kinds are watched across the whole namespace. Cluster-scoped kinds are only
+    watched for the names given in 'cluster_scoped_names' ({kind: names}).
+
+    'label_selectors' and 'field_selectors' ({kind: selector}) narrow the watch on a
+    namespaced kind to the resources a caller is interested in.
+
+    With 'namespace' None every kind is watched cluster-wide, including cluster-scoped kinds
+    without 'cluster_scoped_names'.
+    """
+
+    def __init__(
+        self,
+        client: EphemeralK8sClient,
+        namespace: str | None,
+        kinds=WATCHED_KINDS,
+        cluster_scoped_names: dict | None = None,
+        label_selectors: dict | None = None,
+        field_selectors: dict | None = None,
+    ):
+        self.client = client
+        self.namespace = namespace
+        self._kinds = kinds
+        self._cluster_scoped_names = cluster_scoped_names or {}
+        self._label_selectors = label_selectors or {}
+        self._field_selectors = field_selectors or {}
+        self._resources = {}
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._stopped = threading.Event()
+        self._streams = []
+
+    @property
+    def stopped(self):
+        return self._stopped.is_set()
+
+    @property
+    def generation(self):
+        """Counter bumped on every change to the cache."""
+        with self._cond:
+            return self._generation
+
+    def start(self):
+        """Start watching and block until every kind completed its initial list."""
+        for spec in self._kinds:
+            if spec.optional and not self.client.has_api_resource(spec.api_version, spec.kind):
+                log.debug("resource type '%s' not found on cluster, skipping", spec.kind)
+                continue
+            if spec.namespaced or self.namespace is None:
+                self._streams.append(
+                    _WatchStream(
+                        self,
+                        spec,
+                        namespace=self.namespace,
+                        label_selector=self._label_selectors.get(spec.kind),
+                        field_selector=self._field_selectors.get(spec.kind),
+                    )
+                )
+            else:
+                for name in sorted(self._cluster_scoped_names.get(spec.kind, ())):
+                    self._streams.append(
+                        _WatchStream(self, spec, field_selector=f"metadata.name={name}")
+                    )
+
+        for stream in self._streams:
+            stream.start()
+        for stream in self._streams:
+            if not stream.synced.wait(DEFAULT_READ_TIMEOUT * 2):
+                self.stop()
+                raise FatalError(f"timed out listing '{stream.spec.kind}' resources")
+            if stream.error:
+                self.stop()
+                raise FatalError(
+                    f"unable to list '{stream.spec.kind}' resources: {stream.error}"
+                ) from stream.error
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        for stream in self._streams:
+            stream.stop()
+        with self._cond:
+            self._cond.notify_all()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def watched_kinds(self) -> list[KindSpec]:
+        """Kinds that are actually being watched (optional kinds missing on the cluster excluded)."""
+        kinds = []
+        for stream in self._streams:
+            if not stream.disabled and stream.spec not in kinds:
+                kinds.append(stream.spec)
+        return kinds
+
+    def resources(self) -> dict[str, dict]:
+        """Return a snapshot of all cached resources keyed by resource_key()."""
+        with self._cond:
+            return dict(self._resources)
+
+    def get(self, key: str) -> dict | None:
+        with self._cond:
+            return self._resources.get(key)
+
+    def items(self, kind: str) -> list[dict]:
+        """Return the cached resources of one kind."""
+        with self._cond:
+            return [obj for obj in self._resources.values() if obj.get("kind") == kind]
+
+    def staleness(self, kind: str) -> float | None:
+        """Seconds the cached 'kind' resources may lag behind the cluster.
+
+        0 while its watch is live, None if the kind is not watched (missing optional kind or
+        failed initial list).
+        """
+        now = time.monotonic()
+        lags = [
+            0.0 if stream.stale_since is None else now - stream.stale_since
+            for stream in self._streams
+            if stream.spec.kind == kind and not stream.disabled and not stream.error
+        ]
+        return max(lags) if lags else None
+
+    def resource_version(self, kind: str) -> str | None:
+        """Last resourceVersion seen for a kind watched by a single stream."""
+        versions = [s._resource_version for s in self._streams if s.spec.kind == kind]
+        return versions[0] if len(versions) == 1 else None
+
+    def wait_for_change(self, generation: int, timeout: float) -> int:
+        """Block until the cache changes after 'generation' or 'timeout' sec pass.
+
+        Returns the current generation.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._generation != generation or self.stopped, timeout=timeout
+            )
+            return self._generation
+
+    def _notify(self):
+        self._generation += 1
+        self._cond.notify_all()
+
+    def _update(self, key, obj):
+        with self._cond:
+            self._resources[key] = obj
+            self._notify()
+
+    def _delete(self, key):
+        with self._cond:
+            self._resources.pop(key, None)
+            self._notify()
+
+    def _replace(self, old_keys, items):
+        """Replace the entries previously listed by a stream, returns the new key set."""
+        new = {resource_key(item): item for item in items}
+        with self._cond:
+            for key in old_keys - new.keys():
+                self._resources.pop(key, None)
+            self._resources.update(new)
+            self._notify()
+        return set(new)
+
+
+# --- Waiting ---
+
+
+class ResourceWaiter:
+    """Tracks readiness of one resource and, optionally, the resources it directly owns."""
+
+    def __init__(self, kind: str, name: str, watch_owned: bool = False):
+        self.kind = kind.lower()
+        self.name = name.lower()
+        self.key = f"{self.kind}/{self.name}"
+        self.watch_owned = watch_owned
+        self.observed_resources = {}
+        self.timed_out = False
+
+    def _owns(self, owner_uid, obj):
+        for ref in obj.get("metadata", {}).get("ownerReferences") or []:
+            if ref.get("kind", "").lower() == self.kind and ref.get("uid") == owner_uid:
+                return True
+        return False
+
+    def _observe(self, key, obj, owned=True):
+        previous = self.observed_resources.get(key)
+        self.observed_resources[key] = obj
+        ready = is_ready(obj)
+        if owned:
+            if previous is None and not ready:
+                log.info("[%s] found owned resource %s, not yet ready", self.key, key)
+            if ready and (previous is None or not is_ready(previous)):
+                log.info("[%s] owned resource %s is ready!", self.key, key)
+
+    def check_ready(self, resources: dict[str, dict]) -> bool:
+        """Update observed state from a cache snapshot, return True if everything is ready."""
+        resource = resources.get(self.key)
+        if not resource:
+            return False
+
+        self._observe(self.key, resource, owned=False)
+
+        if self.watch_owned:
+            uid = resource["metadata"].get("uid")
+            for key, obj in resources.items():
+                if key != self.key and self._owns(uid, obj):
+                    self._observe(key, obj)
+            for key in [k for k in self.observed_resources if k not in resources]:
+                log.info("[%s] resource has disappeared, no longer monitoring it", key)
+                del self.observed_resources[key]
+
+        ready = all(is_ready(obj) for obj in self.observed_resources.values())
+        if ready:
+            log.info("[%s] resource is ready!", self.key)
+        return ready
+
+    def not_ready_details(self) -> list[str]:
+        return [details_str(obj) for obj in self.observed_resources.values() if not is_ready(obj)]
+
+
+def _raise_status_errors(errors):
+    combined_msg = "\n".join(f"* {msg}" for msg in sorted(errors))
+    msg = f"Found resource status errors:\n{combined_msg}"
+    log.error(msg)
+    raise StatusError(msg)
+
+
+class FailureMonitor:
+    """Aborts a wait once a resource has reported a terminal failure for the grace period.
+
+    The grace period ('grace_period' sec, default FAILURE_GRACE_PERIOD) lets transient
+    errors, e.g. an image pull racing an image push, recover without failing the wait.
+    """
+
+    def __init__(self, grace_period: float | None = None):
+        self.grace_period = FAILURE_GRACE_PERIOD if grace_period is None else grace_period
+        self._first_seen = {}
+
+    def check(self, resources: dict[str, dict]) -> float | None:
+        """Record failures in a cache snapshot, raise StatusError for ones past the grace period.
+
+        Returns the sec until the next recorded failure's grace period expires, or None.
+        """
+        now = time.monotonic()
+        errors = {}
+        for key, obj in resources.items():
+            error = status_error(obj)
+            if error:
+                errors[key] = error
+
+        for key in [k for k in self._first_seen if k not in errors]:
+            log.info("[%s] resource recovered from error state", key)
+            del self._first_seen[key]
+
+        for key, error in errors.items():
+            if key not in self._first_seen:
+                self._first_seen[key] = now
+                if self.grace_period > 0:
+                    log.warning("%s (aborting in %dsec if not resolved)", error, self.grace_period)
+
+        expired = {
+            errors[key]
+            for key, first_seen in self._first_seen.items()
+            if now - first_seen >= self.grace_period
+        }
+        if expired:
+            _raise_status_errors(expired)
+
+        if not self._first_seen:
+            return None
+        return self.grace_period - (now - min(self._first_seen.values()))
+
+
+def _log_timed_out(waiter):
+    waiter.timed_out = True
+    msg = f"[{waiter.key}] timed out waiting for resource to be ready"
+    details = [f"  {d}" for d in waiter.not_ready_details()]
+    if details:
+        msg += ", details: {}\n".format("\n".join(details))
+    log.error(msg)
+
+
+def _wait_time(now, deadline, next_log, next_failure=None):
+    wake_at = min(deadline, next_log)
+    if next_failure is not None:
+        wake_at = min(wake_at, now + next_failure)
+    return max(wake_at - now, 0)
+
+
+def wait_for_ready(
+    cache: ResourceCache,
+    waiters: list[ResourceWaiter],
+    timeout: float,
+    defer_status_errors: bool = False,
+    failure_grace_period: float | None = None,
+) -> bool:
+    """Wait for all waiters to be ready, re-evaluating whenever the cache changes.
+
+    Returns False if 'timeout' expires first. Unless 'defer_status_errors' is set, raises
+    StatusError once a resource in the namespace has reported a terminal failure for
+    'failure_grace_period' sec (see FailureMonitor).
+    """
+    deadline = time.monotonic() + timeout
+    next_log = time.monotonic() + LOG_INTERVAL
+    failures = None if defer_status_errors else FailureMonitor(failure_grace_period)
+    next_failure = None
+    pending = list(waiters)
+    for waiter in pending:
+        waiter.timed_out = False
+
+    while True:
+        generation = cache.generation
+        resources = cache.resources()
+        pending = [w for w in pending if not w.check_ready(resources)]
+        if not pending:
+            log.info("all resources being monitored reached 'ready' state")
+            return True
+
+        if failures:
+            next_failure = failures.check(resources)
+
+        now = time.monotonic()
+        if now >= deadline or cache.stopped:
+            for waiter in pending:
+                _log_timed_out(waiter)
+            log.info("some resources failed to become ready: %s", ", ".join(w.key for w in pending))
+            return False
+
+        if now >= next_log:
+            log.info(
+                "waiting %dsec longer on: %s",
+                deadline - now,
+                ", ".join(w.key for w in pending),
+            )
+            next_log = now + LOG_INTERVAL
+
+        cache.wait_for_change(generation, _wait_time(now, deadline, next_log, next_failure))
+
+
+def _list_clowdapps(client: EphemeralK8sClient, namespace: str) -> list[dict]:
+    try:
+        items, _ = client.list_resources(CRD_API_VERSION, "ClowdApp", namespace=namespace)
+    except ResourceNotFoundError:
+        log.debug("clowdapp resource type not found, skipping")
+        return []
+    return items
+
+
+ENV_PHASE = "resources owned by ClowdEnvironment"
+APP_PHASE = "resources owned by ClowdApps"
+REMAINING_PHASE = "remaining namespace resources"
+
+
+class ReadinessTracker:
+    """Everything to wait on in a namespace, evaluated concurrently under one deadline.
+
+    Each tracked resource is a node; ownerReferences are the edges that attach owned resources
+    (deployments, jobs, ...) to their ClowdEnvironment/ClowdApp/top-level owner. Nodes are
+    grouped into phases only for reporting, no phase waits on another.
+
+    Top-level resources that are not owned by another node are picked up as they appear, so
+    resources created while waiting are still covered.
+    """
+
+    def __init__(self, cache: ResourceCache, env_names=(), clowdapp_names=()):
+        self.cache = cache
+        self.phases = {
+            ENV_PHASE: [
+                ResourceWaiter("ClowdEnvironment", env, watch_owned=True)
+                for env in sorted(env_names)
+            ],
+            APP_PHASE: [
+                ResourceWaiter("ClowdApp", app, watch_owned=True) for app in sorted(clowdapp_names)
+            ],
+            REMAINING_PHASE: [],
+        }
+        self._top_level = {
+            spec.kind.lower()
+            for spec in cache.watched_kinds()
+            if spec.namespaced and spec.top_level
+        }
+        self._phase_start = {}
+        self._ready = set()
+        self._done_phases = set()
+
+    @property
+    def waiters(self) -> list[ResourceWaiter]:
+        return [w for waiters in self.phases.values() for w in waiters]
+
+    def _discover(self, resources):
+        """Add nodes for top-level resources that no other node owns."""
+        node_keys = {w.key for w in self.waiters}
+        covered = set(node_keys)
+        owner_uids = set()
+        for waiter in self.waiters:
+            covered.update(waiter.observed_resources)
+            owner = resources.get(waiter.key)
+            if owner:
+                owner_uids.add(owner["metadata"].get("uid"))
+
+        for key, obj in resources.items():
+            if key in covered or obj["kind"].lower() not in self._top_level:
+                continue
+            owner_refs = obj["metadata"].get("ownerReferences") or []
+            if any(ref.get("uid") in owner_uids for ref in owner_refs):
+                continue
+            if not self.phases[REMAINING_PHASE]:
+                log.info("found remaining namespace resources to wait on")
+            self.phases[REMAINING_PHASE].append(
+                ResourceWaiter(obj["kind"], obj["metadata"]["name"], watch_owned=True)
+            )
+
+    def _update(self, resources):
+        """Re-evaluate every node that is not ready yet, returns pending waiters per phase."""
+        self._discover(resources)
+        pending = {}
+        for phase, waiters in self.phases.items():
+            if not waiters:
+                continue
+            self._phase_start.setdefault(phase, time.monotonic())
+            not_ready = []
+            for waiter in waiters:
+                if waiter.key in self._ready:
+                    continue
+                if waiter.check_ready(resources):
+                    self._ready.add(waiter.key)
+                else:
+                    not_ready.append(waiter)
+            if not_ready:
+                pending[phase] = not_ready
+            elif phase not in self._done_phases:
+                self._done_phases.add(phase)
+                log.info(
+                    "all %s are ready (%.1fsec)", phase, time.monotonic() - self._phase_start[phase]
+                )
+        return pending
+
+    def wait(
+        self,
+        timeout: float,
+        defer_status_errors: bool = False,
+        failure_grace_period: float | None = None,
+    ) -> None:
+        """Wait for every node to be ready.
+
+        Raises TimeoutError naming the phases that did not finish and, unless
+        'defer_status_errors' is set, StatusError once a resource has reported a terminal
+        failure for 'failure_grace_period' sec.
+        """
+        deadline = time.monotonic() + timeout
+        next_log = time.monotonic() + LOG_INTERVAL
+        failures = None if defer_status_errors else FailureMonitor(failure_grace_period)
+        next_failure = None
+        log.info("waiting up to %dsec on all namespace resources...", timeout)
+
+        while True:
+            generation = self.cache.generation
+            resources = self.cache.resources()
+            pending = self._update(resources)
+            if not pending:
+                log.info("all resources being monitored reached 'ready' state")
+                return
+
+            if failures:
+                next_failure = failures.check(resources)
+
+            now = time.monotonic()
+            if now >= deadline or self.cache.stopped:
+                for waiters in pending.values():
+                    for waiter in waiters:
+                        _log_timed_out(waiter)
+                raise TimeoutError(f"timed out waiting for {', '.join(pending)}")
+
+            if now >= next_log:
+                for phase, waiters in pending.items():
+                    log.info(
+                        "waiting %dsec longer on %s: %s",
+                        deadline - now,
+                        phase,
+                        ", ".join(w.key for w in waiters),
+                    )
+                next_log = now + LOG_INTERVAL
+
+            self.cache.wait_for_change(
+                generation, _wait_time(now, deadline, next_log, next_failure)
+            )
+
+
+def wait_for_all_resources(
+    client: EphemeralK8sClient,
+    namespace: str,
+    timeout: float = 600,
+    defer_status_errors: bool = False,
+    failure_grace_period: float | None = None,
+) -> None:
+    """Wait for everything deployed into a namespace to be ready.
+
+    Waits on resources owned by the ClowdEnvironments the namespace's ClowdApps use, on
+    resources owned by the ClowdApps, and on any remaining top-level resources, all at once.
+
+    Raises TimeoutError if 'timeout' expires and StatusError on terminal resource failures
+    that outlast 'failure_grace_period'.
+    """
+    deadline = time.monotonic() + timeout
+
+    log.info("checking for ClowdApps to wait on...")
+    clowdapps = _list_clowdapps(client, namespace)
+    env_names = set()
+    for clowdapp in clowdapps:
+        env_name = clowdapp["spec"]["envName"]
+        if env_name not in env_names:
+            log.info(
+                "will wait on ClowdEnvironment '%s' found on ClowdApp's .spec.envName", env_name
+            )
+            env_names.add(env_name)
+
+    cache = ResourceCache(client, namespace, cluster_scoped_names={"ClowdEnvironment": env_names})
+    with cache:
+        if not cache.resources():
+            raise TimeoutError("no resources to wait for observed in namespace")
+
+        tracker = ReadinessTracker(cache, env_names, [app["metadata"]["name"] for app in clowdapps])
+        tracker.wait(max(deadline - time.monotonic(), 0), defer_status_errors, failure_grace_period)
+
+
+def wait_for_db_resources(
+    client: EphemeralK8sClient,
+    namespace: str,
+    timeout: float = 600,
+    defer_status_errors: bool = False,
+    failure_grace_period: float | None = None,
+) -> None:
+    """Wait for the database deployments of the ClowdApps in a namespace to be ready.
+
+    Raises ValueError if there are no databases to wait for.
+    """
+    clowdapps = _list_clowdapps(client, namespace)
+    if len(clowdapps) == 0:
+        raise ValueError(f"no clowdapps found in ns '{namespace}', no DB's to wait for")
+
+    waiters = []
+    for clowdapp in clowdapps:
+        clowdapp_name = clowdapp["metadata"]["name"]
+        db_config = clowdapp["spec"].get("database", {})
+        if db_config.get("name"):
+            waiters.append(ResourceWaiter("Deployment", f"{clowdapp_name}-db"))
+        if db_config.get("sharedDbAppName"):
+            waiters.append(ResourceWaiter("Deployment", f"{db_config['sharedDbAppName']}-db"))
+
+    if not waiters:
+        raise ValueError(
+            f"no clowdapps with db configurations found in '{namespace}', no DB's to wait for"
+        )
+
+    with ResourceCache(client, namespace, kinds=(_KIND_SPECS["deployment"],)) as cache:
+        if not wait_for_ready(cache, waiters, timeout, defer_status_errors, failure_grace_period):
+            raise TimeoutError("timed out waiting for DB resources")
+
+
+def _newest(objs: list[dict]) -> dict | None:
+    """Return the most recently created resource, or None."""
+    if not objs:
+        return None
+    return max(objs, key=lambda obj: obj["metadata"].get("creationTimestamp") or "")
+
+
+def _cji_job(resources: dict[str, dict], cji_name: str) -> dict | None:
+    return _newest(
+        [
+            obj
+            for obj in resources.values()
+            if obj["kind"] == "Job"
+            and (obj["metadata"].get("labels") or {}).get("clowdjob") == cji_name
+        ]
+    )
+
+
+def _job_pod(resources: dict[str, dict], job_name: str) -> dict | None:
+    return _newest(
+        [
+            obj
+            for obj in resources.values()
+            if obj["kind"] == "Pod"
+            and (obj["metadata"].get("labels") or {}).get("job-name") == job_name
+        ]
+    )
+
+
+def wait_on_cji(
+    client: EphemeralK8sClient,
+    namespace: str,
+    cji_name: str,
+    timeout: float = 600,
+    defer_status_errors: bool = False,
+    failure_grace_period: float | None = None,
+) -> str:
+    """Wait for the pod run by a ClowdJobInvocation to be running, returns the pod's name.
+
+    Follows the CJI -> Job -> Pod chain with one label-selected watch per kind: Jobs labeled
+    'clowdjob=<cji_name>' and Pods carrying a 'job-name' label. Each transition is logged
+    with the time elapsed since the wait started.
+
+    Raises TimeoutError if 'timeout' expires and, unless 'defer_status_errors' is set,
+    StatusError if the Job or pod report a terminal failure for 'failure_grace_period' sec.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    cache = ResourceCache(
+        client,
+        namespace,
+        kinds=(_KIND_SPECS["clowdjobinvocation"], _KIND_SPECS["job"], _KIND_SPECS["pod"]),
+        label_selectors={"Job": f"clowdjob={cji_name}", "Pod": "job-name"},
+        field_selectors={"ClowdJobInvocation": f"metadata.name={cji_name}"},
+    )
+
+    log.info("waiting for Job to appear owned by CJI '%s'", cji_name)
+    job_name = pod_name = pod_phase = None
+    failures = None if defer_status_errors else FailureMonitor(failure_grace_period)
+    next_failure = None
+
+    with cache:
+        while True:
+            generation = cache.generation
+            resources = cache.resources()
+
+            job = _cji_job(resources, cji_name)
+            if job and job["metadata"]["name"] != job_name:
+                job_name = job["metadata"]["name"]
+                log.info(
+                    "found Job '%s' created by CJI '%s' (%.1fsec), waiting for pod to appear",
+                    job_name,
+                    cji_name,
+                    time.monotonic() - start,
+                )
+
+            pod = _job_pod(resources, job_name) if job_name else None
+            if pod:
+                if pod["metadata"]["name"] != pod_name:
+                    pod_name = pod["metadata"]["name"]
+                    pod_phase = None
+                    log.info(
+                        "found pod '%s' associated with CJI '%s' (%.1fsec),"
+                        " waiting for pod to be 'running'",
+                        pod_name,
+                        cji_name,
+                        time.monotonic() - start,
+                    )
+                phase = (pod.get("status") or {}).get("phase")
+                if phase and phase != pod_phase:
+                    pod_phase = phase
+                    log.info(
+                        "pod '%s' is in phase '%s' (%.1fsec)",
+                        pod_name,
+                        phase,
+                        time.monotonic() - start,
+                    )
+                if is_ready(pod):
+                    return pod_name
+
+            if failures:
+                chain = [obj for obj in (job, pod) if obj]
+                next_failure = failures.check({resource_key(obj): obj for obj in chain})
+
+            now = time.monotonic()
+            if now >= deadline or cache.stopped:
+                if pod:
+                    waiting_on = f"pod '{pod_name}' to be running"
+                    log.error("[%s] not ready, details: %s\n", pod_name, details_str(pod))
+                else:
+                    waiting_on = f"{'Pod' if job_name else 'Job'} to appear"
+                    cji = resources.get(f"clowdjobinvocation/{cji_name}")
+                    if cji and not is_ready(cji):
+                        log.error(
+                            "[%s] not ready, details: %s\n", resource_key(cji), details_str(cji)
+                        )
+                raise TimeoutError(f"timed out waiting for {waiting_on} owned by CJI '{cji_name}'")
+
+            cache.wait_for_change(generation, _wait_time(now, deadline, deadline, next_failure))
@@ -0,0 +1,133 @@
+"""Namespace to reservation lookups without listing every reservation.
+
+A NamespaceReservation records its namespace only in 'status.namespace', which cannot be
+used as a server-side selector, so finding the reservation for a namespace means listing
+all reservations, a collection that grows with reservation history. ReservationIndex keeps
+a small namespace -> reservation name map: a lookup GETs the indexed reservation and only
+re-lists (rebuilding the map) when that reservation is no longer the namespace's latest one.
+
+The map is kept per client and saved in bonfire's cache dir, keyed by API server URL, so
+separate CLI invocations share it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+
+from kubernetes.client import ApiException
+
+from bonfire_lib.discovery import get_cache_dir
+from bonfire_lib.k8s_client import EphemeralK8sClient
+
+log = logging.getLogger(__name__)
+
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def _records(res: dict | None, namespace: str) -> bool:
+    """Whether 'res' is a reservation (active or not) of 'namespace'."""
+    return (res or {}).get("status", {}).get("namespace") == namespace
+
+
+def _is_active(res: dict) -> bool:
+    return res.get("status", {}).get("state") == "active"
+
+
+def _is_reserved(client: EphemeralK8sClient, namespace: str) -> bool:
+    """Whether the namespace is currently reserved, True if that cannot be determined."""
+    try:
+        ns = client.get_namespace(namespace)
+    except ApiException as err:
+        log.debug("unable to get namespace '%s': %s", namespace, err)
+        return True
+    return ((ns or {}).get("metadata", {}).get("annotations") or {}).get("reserved") == "true"
+
+
+class ReservationIndex:
+    """namespace -> reservation name, verified with a GET on use and rebuilt on a miss.
+
+    'path' is the JSON file the index is persisted to, None keeps it in memory only.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._names = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, str]:
+        if not self.path:
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            log.debug("ignoring unreadable reservation index '%s': %s", self.path, err)
+            return {}
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._names, f)
+            os.replace(tmp, self.path)
+        except OSError as err:
+            log.debug("unable to write reservation index '%s': %s", self.path, err)
+
+    def rebuild(self, client: EphemeralK8sClient) -> dict[str, dict]:
+        """List all reservations once and re-index them, returns {namespace: reservation}.
+
+        A namespace returned to its pool is reused by later reservations, the active
+        reservation is indexed if there is one.
+        """
+        by_namespace = {}
+        for res in client.iter_reservations():
+            namespace = res.get("status", {}).get("namespace")
+            if namespace and (namespace not in by_namespace or _is_active(res)):
+                by_namespace[namespace] = res
+        with self._lock:
+            self._names = {ns: res["metadata"]["name"] for ns, res in by_namespace.items()}
+            self._save()
+        return by_namespace
+
+    def lookup(self, client: EphemeralK8sClient, namespace: str) -> dict | None:
+        """Return the reservation of 'namespace', preferring its active one.
+
+        An indexed reservation that is no longer active is still the right answer unless the
+        namespace was reserved again since, which one GET of the namespace tells.
+        """
+        with self._lock:
+            name = self._names.get(namespace)
+        if name:
+            res = client.get_reservation(name)
+            if _records(res, namespace) and (
+                _is_active(res) or not _is_reserved(client, namespace)
+            ):
+                return res
+            log.debug("reservation index entry for '%s' is stale, rebuilding", namespace)
+        return self.rebuild(client).get(namespace)
+
+
+def _index_path(client: EphemeralK8sClient) -> Path | None:
+    server = getattr(client, "server", None)
+    if not isinstance(server, str):
+        return None
+    index_id = hashlib.sha256(server.encode()).hexdigest()[:32]
+    return get_cache_dir("reservations").joinpath(f"{index_id}.json")
+
+
+def get_reservation_index(client: EphemeralK8sClient) -> ReservationIndex:
+    """Return the ReservationIndex shared by all lookups made with 'client'."""
+    with _indexes_lock:
+        if client not in _indexes:
+            _indexes[client] = ReservationIndex(_index_path(client))
+        return _indexes[client]
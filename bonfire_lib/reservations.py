@@ -6,16 +6,101 @@ extend_namespace() — using EphemeralK8sClient instead of ocviapy.
 
 import logging
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+from kubernetes.client import ApiException
 
 from bonfire_lib.core_resources import render_reservation
-from bonfire_lib.k8s_client import EphemeralK8sClient
-from bonfire_lib.status import wait_on_reservation
+from bonfire_lib.k8s_client import CRD_API_VERSION, EphemeralK8sClient
+from bonfire_lib.reservation_index import get_reservation_index
+from bonfire_lib.status import (
+    iter_active_reservations,
+    wait_on_reservation,
+    wait_on_reservations,
+)
 from bonfire_lib.utils import FatalError, hms_to_seconds, duration_fmt
 
 log = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 600  # 10 minutes
 
+# Max concurrent API calls made by reserve_many(), release_many() and extend_many()
+BULK_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ReservationPreflight:
+    """Checks made before reserving a namespace, see check_reservation_preflight().
+
+    existing_reservations -- names of the requester's active reservations
+    size_limit -- the pool's sizeLimit, 0 if unlimited
+    reserved -- namespaces currently reserved from the pool (NamespacePool status.reserved)
+    """
+
+    operator_installed: bool
+    pool_exists: bool = False
+    existing_reservations: tuple[str, ...] = ()
+    size_limit: int = 0
+    reserved: int = 0
+
+    @property
+    def has_existing_reservation(self) -> bool:
+        return bool(self.existing_reservations)
+
+    @property
+    def pool_full(self) -> bool:
+        return not self.has_room_for(1)
+
+    def has_room_for(self, count: int) -> bool:
+        """Whether 'count' more namespaces can be reserved without exceeding the sizeLimit."""
+        return self.size_limit <= 0 or self.reserved + count <= self.size_limit
+
+    @property
+    def can_reserve(self) -> bool:
+        return self.operator_installed and self.pool_exists and not self.pool_full
+
+
+def check_reservation_preflight(
+    client: EphemeralK8sClient, requester: str, pool: str, check_existing: bool = True
+) -> ReservationPreflight:
+    """Collect what is needed to decide whether 'requester' can reserve from 'pool'.
+
+    The pool and the requester's active reservations are looked up concurrently. Skip the
+    reservation lookup with check_existing=False.
+
+    Raises:
+        FatalError: If the API server cannot be queried
+    """
+    if not client.has_api_resource(CRD_API_VERSION, "NamespaceReservation"):
+        return ReservationPreflight(operator_installed=False)
+
+    def _existing():
+        if not check_existing:
+            return ()
+        return tuple(res["metadata"]["name"] for res in iter_active_reservations(client, requester))
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pool_future = executor.submit(client.get_pool, pool)
+            existing_future = executor.submit(_existing)
+        pool_obj = pool_future.result()
+        existing = existing_future.result()
+    except ApiException as exc:
+        raise FatalError(f"unable to check pool '{pool}' before reserving: {exc}") from exc
+
+    if not pool_obj:
+        return ReservationPreflight(operator_installed=True, existing_reservations=existing)
+    return ReservationPreflight(
+        operator_installed=True,
+        pool_exists=True,
+        existing_reservations=existing,
+        size_limit=int(pool_obj.get("spec", {}).get("sizeLimit") or 0),
+        reserved=int(pool_obj.get("status", {}).get("reserved") or 0),
+    )
+
 
 def reserve(
     client: EphemeralK8sClient,
@@ -50,7 +135,7 @@ def reserve(
         TimeoutError: If namespace not assigned within timeout
     """
     if name is None:
-        name = f"bonfire-reservation-{str(uuid.uuid4()).split('-')[0]}"
+        name = _reservation_name()
 
     if requester is None:
         try:
@@ -98,6 +183,121 @@ def reserve(
     }
 
 
+def _reservation_name() -> str:
+    return f"bonfire-reservation-{str(uuid.uuid4()).split('-')[0]}"
+
+
+def _map_concurrently(calls: dict[str, Callable]) -> list:
+    """Run each {description: call} on a bounded thread pool, return results in order.
+
+    Every call runs to completion, then FatalError is raised describing each one that failed.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(len(calls), BULK_MAX_WORKERS))) as executor:
+        futures = {desc: executor.submit(call) for desc, call in calls.items()}
+    results, errors = [], []
+    for desc, future in futures.items():
+        try:
+            results.append(future.result())
+        except (FatalError, ApiException) as exc:
+            errors.append(f"{desc}: {exc}")
+    if errors:
+        raise FatalError("; ".join(errors))
+    return results
+
+
+def reserve_many(
+    client: EphemeralK8sClient,
+    count: int,
+    duration: str = "1h",
+    requester: str | None = None,
+    pool: str = "default",
+    team: str | None = None,
+    secrets_src_namespace: str | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> list[dict]:
+    """Reserve 'count' ephemeral namespaces at once, e.g. one per parallel test shard.
+
+    The NamespaceReservation CRs are created concurrently and followed with a single watch.
+    Nothing is kept on failure: if a CR cannot be created or not every reservation gets a
+    namespace within 'timeout', all reservations created here are released.
+
+    Returns:
+        list of dicts in the format returned by reserve(), one per reservation
+
+    Raises:
+        FatalError: If 'count' is less than 1 or a reservation cannot be created
+        TimeoutError: If namespaces are not assigned within timeout
+    """
+    if count < 1:
+        raise FatalError(f"count must be at least 1, got {count}")
+
+    if requester is None:
+        try:
+            requester = client.whoami()
+        except Exception:
+            requester = "bonfire"
+
+    def _create(name):
+        body = render_reservation(
+            name=name,
+            duration=duration,
+            requester=requester,
+            pool=pool,
+            team=team,
+            secrets_src_namespace=secrets_src_namespace,
+        )
+        return client.create_reservation(body)["metadata"]["name"]
+
+    names = [_reservation_name() for _ in range(count)]
+    with ThreadPoolExecutor(max_workers=min(count, BULK_MAX_WORKERS)) as executor:
+        futures = {name: executor.submit(_create, name) for name in names}
+    created = [name for name, future in futures.items() if not future.exception()]
+    if len(created) < count:
+        failed = next(future.exception() for future in futures.values() if future.exception())
+        _rollback(client, created)
+        raise FatalError(
+            f"unable to create {count - len(created)} of {count} reservations: {failed}"
+        )
+
+    try:
+        reserved = wait_on_reservations(client, names, timeout, requester=requester)
+    except Exception:
+        log.info("namespaces not assigned to all reservations, cancelling %d reservations", count)
+        _rollback(client, names)
+        raise
+
+    results = []
+    for name in names:
+        status = reserved[name].get("status", {})
+        results.append(
+            {
+                "name": name,
+                "namespace": status["namespace"],
+                "state": status.get("state", ""),
+                "expiration": status.get("expiration", ""),
+                "requester": requester,
+                "pool": pool,
+            }
+        )
+    log.info(
+        "%d namespaces reserved by '%s' for '%s' from pool '%s': %s",
+        count,
+        requester,
+        duration,
+        pool,
+        ", ".join(result["namespace"] for result in results),
+    )
+    return results
+
+
+def _rollback(client: EphemeralK8sClient, names: list[str]) -> None:
+    """Release reservations made by a failed reserve_many(), logging what could not be."""
+    try:
+        release_many(client, names=names)
+    except FatalError as exc:
+        log.error("unable to release reservations after failed reserve: %s", exc)
+
+
 def release(
     client: EphemeralK8sClient,
     name: str | None = None,
@@ -166,6 +366,48 @@ def extend(
     return {"name": res_name, "new_duration": new_duration}
 
 
+def release_many(
+    client: EphemeralK8sClient,
+    names: list[str] | None = None,
+    namespaces: list[str] | None = None,
+) -> list[dict]:
+    """Release several reservations concurrently, by name and/or by namespace.
+
+    Returns:
+        list of dicts in the format returned by release()
+
+    Raises:
+        FatalError: After attempting every release, if any of them failed
+    """
+    calls = {f"reservation '{name}'": partial(release, client, name=name) for name in names or []}
+    for namespace in namespaces or []:
+        calls[f"namespace '{namespace}'"] = partial(release, client, namespace=namespace)
+    return _map_concurrently(calls)
+
+
+def extend_many(
+    client: EphemeralK8sClient,
+    namespaces: list[str],
+    duration: str,
+) -> list[dict]:
+    """Extend the reservations of several namespaces concurrently by 'duration'.
+
+    Returns:
+        list of dicts in the format returned by extend()
+
+    Raises:
+        FatalError: After attempting every extension, if any of them failed
+    """
+    return _map_concurrently(
+        {
+            f"namespace '{namespace}'": partial(
+                extend, client, namespace=namespace, duration=duration
+            )
+            for namespace in namespaces
+        }
+    )
+
+
 def _find_reservation(
     client: EphemeralK8sClient,
     name: str | None = None,
@@ -178,10 +420,9 @@ def _find_reservation(
             raise FatalError(f"Reservation '{name}' not found")
         return res
     elif namespace:
-        all_res = client.list_reservations()
-        for res in all_res:
-            if res.get("status", {}).get("namespace") == namespace:
-                return res
+        res = get_reservation_index(client).lookup(client, namespace)
+        if res:
+            return res
         raise FatalError(f"No reservation found for namespace '{namespace}'")
     else:
         raise FatalError("Must provide either name or namespace")
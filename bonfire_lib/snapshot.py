@@ -0,0 +1,170 @@
+"""Point-in-time snapshot of ephemeral environment resources.
+
+Listing namespaces, reservations, pools, ClowdApps and clusters one after the other (or
+through one 'oc' process each) makes commands like 'namespace list' slow on large clusters.
+load_snapshot() runs the list calls concurrently on a single EphemeralK8sClient, so all of
+them share one authenticated connection pool, and returns an immutable Snapshot that
+indexes the results for lookups by namespace and pool.
+"""
+
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from kubernetes.client import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from bonfire_lib.k8s_client import CRD_API_VERSION, EphemeralK8sClient
+from bonfire_lib.utils import FatalError
+
+log = logging.getLogger(__name__)
+
+# Upper bound on concurrent list calls, one per requested kind
+MAX_WORKERS = 8
+
+PROJECT_API_VERSION = "project.openshift.io/v1"
+CAPI_API_VERSION = "cluster.x-k8s.io/v1beta1"
+
+
+@dataclass(frozen=True)
+class SnapshotKind:
+    """A resource type load_snapshot() can list.
+
+    optional -- kinds that may not be installed/listable, left as None in the Snapshot
+    """
+
+    api_version: str
+    kind: str
+    label_selector: str | None = None
+    optional: bool = False
+
+
+SNAPSHOT_KINDS = {
+    "namespaces": SnapshotKind("v1", "Namespace", label_selector="operator-ns"),
+    "reservations": SnapshotKind(CRD_API_VERSION, "NamespaceReservation"),
+    "pools": SnapshotKind(CRD_API_VERSION, "NamespacePool"),
+    "clowdapps": SnapshotKind(CRD_API_VERSION, "ClowdApp", optional=True),
+    "clusters": SnapshotKind(CAPI_API_VERSION, "Cluster", optional=True),
+    "cluster_reservations": SnapshotKind(CRD_API_VERSION, "ClusterReservation", optional=True),
+    "cluster_pools": SnapshotKind(CRD_API_VERSION, "ClusterPool", optional=True),
+}
+
+
+def _index_by_namespace(items: list[dict] | None) -> dict[str, list[dict]]:
+    """Group items into {namespace: [items]} in a single pass."""
+    index = {}
+    for item in items or []:
+        index.setdefault(item.get("metadata", {}).get("namespace"), []).append(item)
+    return index
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Resources listed by load_snapshot().
+
+    Each field holds the listed items, or None if that kind was not requested or is an
+    optional kind that is not available on the cluster. 'resource_versions' records the
+    list resourceVersion of each loaded kind.
+    """
+
+    namespaces: list[dict] | None = None
+    reservations: list[dict] | None = None
+    pools: list[dict] | None = None
+    clowdapps: list[dict] | None = None
+    clusters: list[dict] | None = None
+    cluster_reservations: list[dict] | None = None
+    cluster_pools: list[dict] | None = None
+    resource_versions: dict = field(default_factory=dict)
+
+    @functools.cached_property
+    def clowdapps_by_namespace(self) -> dict[str, list[dict]]:
+        return _index_by_namespace(self.clowdapps)
+
+    @functools.cached_property
+    def clusters_by_namespace(self) -> dict[str, list[dict]]:
+        return _index_by_namespace(self.clusters)
+
+    @functools.cached_property
+    def reservation_by_namespace(self) -> dict[str, dict]:
+        """Map each namespace to the first reservation found for it."""
+        index = {}
+        for res in self.reservations or []:
+            index.setdefault(res.get("status", {}).get("namespace"), res)
+        return index
+
+    def pool(self, name: str) -> dict | None:
+        for pool in self.pools or []:
+            if pool["metadata"]["name"] == name:
+                return pool
+        return None
+
+    def pool_size_limit(self, name: str) -> int:
+        """Return the pool's sizeLimit, 0 if the pool is unknown or has no limit."""
+        pool = self.pool(name)
+        size_limit = pool.get("spec", {}).get("sizeLimit") if pool else 0
+        return int(size_limit) if size_limit else 0
+
+    def reserved_in_pool(self, name: str) -> int:
+        """Count the reserved namespaces belonging to a pool."""
+        return sum(
+            1
+            for ns in self.namespaces or []
+            if (ns["metadata"].get("labels") or {}).get("pool") == name
+            and (ns["metadata"].get("annotations") or {}).get("reserved") == "true"
+        )
+
+
+def _namespace_kind(client: EphemeralK8sClient, spec: SnapshotKind) -> SnapshotKind:
+    # on OpenShift, projects can be listed by users who may not list namespaces
+    if client.has_api_resource(PROJECT_API_VERSION, "Project"):
+        return SnapshotKind(PROJECT_API_VERSION, "Project", label_selector=spec.label_selector)
+    return spec
+
+
+def _list(
+    client: EphemeralK8sClient, name: str, label_selector: str | None = None
+) -> tuple[list[dict] | None, str | None]:
+    spec = SNAPSHOT_KINDS[name]
+    if name == "namespaces":
+        spec = _namespace_kind(client, spec)
+    try:
+        return client.list_resources(
+            spec.api_version, spec.kind, label_selector=label_selector or spec.label_selector
+        )
+    except (ResourceNotFoundError, ApiException) as err:
+        not_served = isinstance(err, ResourceNotFoundError) or err.status in (403, 404)
+        if spec.optional and not_served:
+            log.debug("unable to list optional resource type '%s', skipping", spec.kind)
+            return None, None
+        raise FatalError(f"unable to list '{spec.kind}' resources: {err}") from err
+
+
+def load_snapshot(
+    client: EphemeralK8sClient,
+    kinds=tuple(SNAPSHOT_KINDS),
+    label_selectors: dict[str, str] | None = None,
+) -> Snapshot:
+    """List the given kinds (keys of SNAPSHOT_KINDS) concurrently and return a Snapshot.
+
+    'label_selectors' maps kind names to a selector used instead of the kind's default.
+    Raises FatalError if a non-optional kind cannot be listed.
+    """
+    label_selectors = label_selectors or {}
+    unknown = set(kinds) - SNAPSHOT_KINDS.keys()
+    if unknown:
+        raise ValueError(f"unknown snapshot kinds: {', '.join(sorted(unknown))}")
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(kinds), MAX_WORKERS))) as executor:
+        futures = {
+            name: executor.submit(_list, client, name, label_selectors.get(name)) for name in kinds
+        }
+
+    results = {}
+    resource_versions = {}
+    for name, future in futures.items():
+        results[name], resource_version = future.result()
+        if resource_version:
+            resource_versions[name] = resource_version
+
+    return Snapshot(resource_versions=resource_versions, **results)
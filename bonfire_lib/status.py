@@ -7,14 +7,39 @@ and bonfire/namespaces.py describe_namespace()
 """
 
 import base64
+import itertools
 import logging
+import math
+import re
+import threading
 import time
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-from bonfire_lib.k8s_client import EphemeralK8sClient
+import urllib3
+from kubernetes.client import ApiException
+
+from bonfire_lib.k8s_client import CRD_API_VERSION, EphemeralK8sClient
+from bonfire_lib.reservation_index import get_reservation_index
 from bonfire_lib.utils import FatalError
 
 log = logging.getLogger(__name__)
 
+# Backoff bounds (sec) used when polling a reservation because watch is not permitted
+POLL_INTERVAL_MIN = 1
+POLL_INTERVAL_MAX = 10
+
+# A valid label value, reservations are labeled with their requester
+_LABEL_VALUE_RE = re.compile(r"^([A-Za-z0-9]([-A-Za-z0-9_.]{0,61}[A-Za-z0-9])?)?$")
+
+# Max concurrent API calls made by describe_namespace()
+DESCRIBE_MAX_WORKERS = 6
+
+# Console URL per client, it is cluster-global and does not change during a session
+_console_urls = weakref.WeakKeyDictionary()
+_console_urls_lock = threading.Lock()
+
 
 def get_reservation(
     client: EphemeralK8sClient,
@@ -24,16 +49,18 @@ def get_reservation(
 ) -> dict | None:
     """Look up a reservation by name, namespace, or requester.
 
-    Matches the lookup semantics of bonfire/openshift.py:get_reservation().
+    Namespace lookups go through the namespace -> reservation index (see reservation_index)
+    and prefer the namespace's active reservation.
     """
     if name:
         return client.get_reservation(name)
     elif namespace:
-        for res in client.list_reservations():
-            if res.get("status", {}).get("namespace") == namespace:
-                return res
+        return get_reservation_index(client).lookup(client, namespace)
     elif requester:
-        reservations = client.list_reservations(label_selector=f"requester={requester}")
+        # two matches are enough to know the lookup is ambiguous
+        reservations = list(
+            itertools.islice(client.iter_reservations(label_selector=f"requester={requester}"), 2)
+        )
         if len(reservations) == 0:
             return None
         elif len(reservations) == 1:
@@ -58,22 +85,7 @@ def list_reservations(
     else:
         reservations = client.list_reservations()
 
-    result = []
-    for res in reservations:
-        status = res.get("status", {})
-        spec = res.get("spec", {})
-        result.append(
-            {
-                "name": res["metadata"]["name"],
-                "namespace": status.get("namespace", ""),
-                "state": status.get("state", ""),
-                "expiration": status.get("expiration", ""),
-                "requester": spec.get("requester", ""),
-                "pool": spec.get("pool", "default"),
-                "duration": spec.get("duration", ""),
-            }
-        )
-    return result
+    return [get_reservation_summary(res) for res in reservations]
 
 
 def get_reservation_summary(res: dict) -> dict:
@@ -94,12 +106,112 @@ def get_reservation_summary(res: dict) -> dict:
     }
 
 
+def _reserved_namespace(res: dict | None) -> str | None:
+    return (res or {}).get("status", {}).get("namespace") or None
+
+
+def _list_and_watch(
+    client, api_version, kind, deadline, namespace=None, label_selector=None, field_selector=None
+):
+    """List a kind, then watch it from the listed resourceVersion until 'deadline'.
+
+    Yields ("LISTED", items) after every list and (event_type, obj) for each watch event. The
+    watch is resumed when the server ends it and re-listed when its resourceVersion expired
+    or the connection stopped responding.
+    """
+    resource_version = None
+    while True:
+        if resource_version is None:
+            items, resource_version = client.list_resources(
+                api_version,
+                kind,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+            yield "LISTED", items
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+
+        try:
+            for event_type, obj in client.watch_resources(
+                api_version,
+                kind,
+                namespace=namespace,
+                resource_version=resource_version,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                timeout=math.ceil(remaining),
+            ):
+                resource_version = obj.get("metadata", {}).get("resourceVersion")
+                if event_type in ("ADDED", "MODIFIED", "DELETED"):
+                    yield event_type, obj
+        except ApiException as err:
+            if err.status != 410:
+                raise
+            log.debug("watch on %s expired, re-listing", kind)
+            resource_version = None
+        except urllib3.exceptions.HTTPError as err:
+            log.debug("watch on %s failed, re-listing: %s", kind, err)
+            resource_version = None
+
+
+def _poll_object(get, deadline):
+    interval = POLL_INTERVAL_MIN
+    while True:
+        yield get()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, POLL_INTERVAL_MAX)
+
+
+def follow_object(
+    client: EphemeralK8sClient,
+    api_version: str,
+    kind: str,
+    name: str,
+    get,
+    deadline: float,
+    namespace: str | None = None,
+):
+    """Yield a single object (None while it does not exist) each time it changes.
+
+    Lists the object and then watches it with a field selector on its name. If the client is
+    not permitted to list/watch the kind (403/405), falls back to calling 'get()' with
+    exponential backoff between POLL_INTERVAL_MIN and POLL_INTERVAL_MAX sec. Stops once the
+    time.monotonic() 'deadline' passes.
+    """
+    try:
+        for event_type, obj in _list_and_watch(
+            client, api_version, kind, deadline, namespace, field_selector=f"metadata.name={name}"
+        ):
+            if event_type == "LISTED":
+                yield obj[0] if obj else None
+            elif event_type == "DELETED":
+                yield None
+            else:
+                yield obj
+    except ApiException as err:
+        if err.status not in (403, 405):
+            raise
+        log.debug("watching %s not permitted (%s), polling instead", kind, err.status)
+        yield from _poll_object(get, deadline)
+
+
 def wait_on_reservation(
     client: EphemeralK8sClient,
     name: str,
     timeout: int = 600,
 ) -> str:
-    """Poll reservation until namespace is assigned.
+    """Wait until the operator assigns a namespace to a reservation.
+
+    Watches the single NamespaceReservation (field selector on its name), so the namespace is
+    returned as soon as status.namespace is set. Falls back to polling with backoff if the
+    client is not permitted to watch reservations.
 
     Returns:
         The assigned namespace name.
@@ -108,42 +220,124 @@ def wait_on_reservation(
         TimeoutError if namespace not assigned within timeout.
     """
     log.info("waiting for reservation '%s' to get picked up by operator", name)
-    start = time.time()
-    while time.time() - start < timeout:
-        res = client.get_reservation(name)
-        if res:
-            ns = res.get("status", {}).get("namespace")
-            if ns:
-                return ns
-        time.sleep(2)
+    for res in follow_object(
+        client,
+        CRD_API_VERSION,
+        "NamespaceReservation",
+        name,
+        lambda: client.get_reservation(name),
+        time.monotonic() + timeout,
+    ):
+        ns = _reserved_namespace(res)
+        if ns:
+            return ns
     raise TimeoutError(f"timed out after {timeout}s waiting for namespace on reservation '{name}'")
 
 
-def check_for_existing_reservation(
+def wait_on_reservations(
     client: EphemeralK8sClient,
-    requester: str,
-) -> bool:
-    """Check if requester already has an active reservation."""
-    for res in client.list_reservations():
+    names: list[str],
+    timeout: int = 600,
+    requester: str | None = None,
+) -> dict[str, dict]:
+    """Wait until the operator assigns a namespace to every reservation in 'names'.
+
+    All reservations are followed with one watch, narrowed to the requester's reservations
+    (by 'requester' label) when 'requester' is given and a valid label value. Falls back to
+    polling the pending reservations with backoff if the client is not permitted to watch.
+
+    Returns:
+        {reservation name: reservation} once each has a namespace.
+
+    Raises:
+        TimeoutError if a namespace is not assigned to all of them within timeout.
+    """
+    log.info("waiting for %d reservations to get picked up by operator", len(names))
+    pending = set(names)
+    assigned = {}
+    deadline = time.monotonic() + timeout
+
+    def _update(res):
+        name = res["metadata"]["name"]
+        if name in pending and _reserved_namespace(res):
+            pending.discard(name)
+            assigned[name] = res
+
+    selector = None
+    if requester and _LABEL_VALUE_RE.match(requester):
+        selector = f"requester={requester}"
+    try:
+        for event_type, obj in _list_and_watch(
+            client, CRD_API_VERSION, "NamespaceReservation", deadline, label_selector=selector
+        ):
+            if event_type == "LISTED":
+                for res in obj:
+                    _update(res)
+            elif event_type != "DELETED":
+                _update(obj)
+            if not pending:
+                return assigned
+    except ApiException as err:
+        if err.status not in (403, 405):
+            raise
+        log.debug("watching NamespaceReservations not permitted (%s), polling instead", err.status)
+        for reservations in _poll_object(
+            lambda: [client.get_reservation(name) for name in sorted(pending)], deadline
+        ):
+            for res in filter(None, reservations):
+                _update(res)
+            if not pending:
+                return assigned
+    raise TimeoutError(
+        f"timed out after {timeout}s waiting for namespaces on reservations: "
+        f"{', '.join(sorted(pending))}"
+    )
+
+
+def iter_active_reservations(client: EphemeralK8sClient, requester: str) -> Iterator[dict]:
+    """Yield the requester's active reservations whose namespace still exists.
+
+    Only the requester's reservations are listed (by 'requester' label) when the requester
+    is a valid label value.
+    """
+    selector = f"requester={requester}" if _LABEL_VALUE_RE.match(requester) else None
+    for res in client.iter_reservations(label_selector=selector):
         if (
             res.get("spec", {}).get("requester") == requester
             and res.get("status", {}).get("state") == "active"
         ):
             ns = res["status"].get("namespace", "")
             if ns and client.get_namespace(ns):
-                return True
-    return False
+                yield res
+            elif ns:
+                log.info("reservation found for namespace '%s' which no longer exists", ns)
+
+
+def check_for_existing_reservation(
+    client: EphemeralK8sClient,
+    requester: str,
+) -> bool:
+    """Check if requester already has an active reservation."""
+    return next(iter_active_reservations(client, requester), None) is not None
 
 
 def get_console_url(client: EphemeralK8sClient) -> str | None:
-    """Get the OpenShift console URL from the cluster's console-public configmap."""
+    """Get the OpenShift console URL from the cluster's console-public configmap.
+
+    The result is memoized per client, failed lookups are retried on the next call.
+    """
+    with _console_urls_lock:
+        if client in _console_urls:
+            return _console_urls[client]
     try:
         cm = client.get_configmap("console-public", "openshift-config-managed")
-        if cm:
-            return cm.get("data", {}).get("consoleURL")
     except Exception as err:
         log.debug("unable to obtain console url: %s: %s", err.__class__.__name__, err)
-    return None
+        return None
+    url = cm.get("data", {}).get("consoleURL") if cm else None
+    with _console_urls_lock:
+        _console_urls[client] = url
+    return url
 
 
 def describe_namespace(client: EphemeralK8sClient, namespace: str) -> dict:
@@ -154,6 +348,8 @@ def describe_namespace(client: EphemeralK8sClient, namespace: str) -> dict:
     - ClowdApp count and status
     - Frontend count
     - Gateway route, keycloak credentials
+
+    After the namespace itself is checked, the remaining lookups run concurrently.
     """
     ns = client.get_namespace(namespace)
     if not ns:
@@ -163,50 +359,54 @@ def describe_namespace(client: EphemeralK8sClient, namespace: str) -> dict:
     if labels.get("operator-ns") != "true":
         raise FatalError(f"namespace '{namespace}' was not reserved with namespace operator")
 
-    try:
-        clowdapps = client.list_crds("ClowdApp", namespace=namespace)
-    except Exception as exc:
-        log.warning("failed to list ClowdApps in namespace '%s': %s", namespace, exc)
-        clowdapps = []
-
-    try:
-        frontends = client.list_crds("Frontend", namespace=namespace)
-    except Exception as exc:
-        log.warning("failed to list Frontends in namespace '%s': %s", namespace, exc)
-        frontends = []
-
-    fe_host = ""
-    keycloak_url = ""
-    try:
-        fe_env = client.get_crd("FrontendEnvironment", f"env-{namespace}")
-        if fe_env:
-            fe_host = fe_env.get("spec", {}).get("hostname", "")
-            keycloak_url = fe_env.get("spec", {}).get("sso", "")
-    except Exception as exc:
-        log.warning("failed to get FrontendEnvironment for namespace '%s': %s", namespace, exc)
-
-    kc_creds = _get_keycloak_creds(client, namespace)
-
-    console_url = get_console_url(client)
+    with ThreadPoolExecutor(max_workers=DESCRIBE_MAX_WORKERS) as executor:
+        futures = {
+            "clowdapps": executor.submit(_list_crds, client, "ClowdApp", namespace),
+            "frontends": executor.submit(_list_crds, client, "Frontend", namespace),
+            "fe_env": executor.submit(_get_frontend_env, client, namespace),
+            "kc_creds": executor.submit(_get_keycloak_creds, client, namespace),
+            "console_url": executor.submit(get_console_url, client),
+            "has_cluster": executor.submit(_has_cluster_kubeconfig, client, namespace),
+        }
+    results = {name: future.result() for name, future in futures.items()}
+
+    fe_spec = (results["fe_env"] or {}).get("spec", {})
+    fe_host = fe_spec.get("hostname", "")
+    kc_creds = results["kc_creds"]
+    console_url = results["console_url"]
     ns_url = f"{console_url}/k8s/cluster/projects/{namespace}" if console_url else ""
 
-    has_cluster = _has_cluster_kubeconfig(client, namespace)
-
     return {
         "namespace": namespace,
         "console_namespace_route": ns_url,
-        "keycloak_admin_route": keycloak_url,
+        "keycloak_admin_route": fe_spec.get("sso", ""),
         "keycloak_admin_username": kc_creds.get("username", "N/A"),
         "keycloak_admin_password": kc_creds.get("password", "N/A"),
-        "clowdapps_deployed": len(clowdapps),
-        "frontends_deployed": len(frontends),
+        "clowdapps_deployed": len(results["clowdapps"]),
+        "frontends_deployed": len(results["frontends"]),
         "default_username": kc_creds.get("defaultUsername", "N/A"),
         "default_password": kc_creds.get("defaultPassword", "N/A"),
         "gateway_route": f"https://{fe_host}" if fe_host else "",
-        "has_cluster": has_cluster,
+        "has_cluster": results["has_cluster"],
     }
 
 
+def _list_crds(client: EphemeralK8sClient, kind: str, namespace: str) -> list[dict]:
+    try:
+        return client.list_crds(kind, namespace=namespace)
+    except Exception as exc:
+        log.warning("failed to list %ss in namespace '%s': %s", kind, namespace, exc)
+        return []
+
+
+def _get_frontend_env(client: EphemeralK8sClient, namespace: str) -> dict | None:
+    try:
+        return client.get_crd("FrontendEnvironment", f"env-{namespace}")
+    except Exception as exc:
+        log.warning("failed to get FrontendEnvironment for namespace '%s': %s", namespace, exc)
+        return None
+
+
 def _has_cluster_kubeconfig(client: EphemeralK8sClient, namespace: str) -> bool:
     """Check if a cluster kubeconfig secret exists in the namespace."""
     try:
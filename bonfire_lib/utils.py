@@ -9,6 +9,10 @@ class FatalError(Exception):
     pass
 
 
+class StatusError(Exception):
+    """A watched resource reported an error state (e.g. image pull failure)."""
+
+
 _DNS_LABEL_RE = re.compile(r"^[a-z0-9]([a-z0-9\-]{0,61}[a-z0-9])?$")
 
 
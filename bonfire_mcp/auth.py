@@ -4,17 +4,27 @@ Mirrors the auth model of containers/kubernetes-mcp-server:
 1. Explicit server + token (K8S_SERVER + K8S_TOKEN env vars)
 2. In-cluster service account auto-detection
 3. Kubeconfig file (KUBECONFIG env var or ~/.kube/config)
+
+Over the HTTP transport each MCP client may instead send its own bearer token, the server
+then acts as that identity (see ClientPool).
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+from collections import OrderedDict
 
 from kubernetes.client import ApiException
 
+from bonfire_lib.async_client import AsyncEphemeralK8sClient
 from bonfire_lib.k8s_client import EphemeralK8sClient
 
 log = logging.getLogger(__name__)
 
+# Max per-identity clients kept by a ClientPool, least recently used ones are closed first
+MAX_CLIENTS = int(os.getenv("BONFIRE_MCP_MAX_CLIENTS", "50"))
+
 
 def load_k8s_client() -> EphemeralK8sClient:
     """Load a K8s client with auth auto-detection.
@@ -66,12 +76,13 @@ def _preflight_check(client: EphemeralK8sClient) -> None:
         RuntimeError: If the cluster is unreachable, auth is invalid, or CRDs
             don't exist on the cluster (404).
     """
-    for crd_name, check_fn in [
-        ("NamespacePool", client.list_pools),
-        ("NamespaceReservation", client.list_reservations),
+    for crd_name, iter_fn in [
+        ("NamespacePool", client.iter_pools),
+        ("NamespaceReservation", client.iter_reservations),
     ]:
         try:
-            check_fn()
+            # a single-item page is enough to prove access
+            next(iter_fn(page_size=1), None)
             log.info("preflight check passed: %s CRD accessible", crd_name)
         except ApiException as e:
             if e.status == 401:
@@ -100,3 +111,102 @@ def _preflight_check(client: EphemeralK8sClient) -> None:
                 f"Failed to connect to the management cluster: {e}. "
                 "Check network connectivity, K8S_SERVER, or KUBECONFIG."
             ) from e
+
+
+def load_token_client(token: str) -> EphemeralK8sClient:
+    """Load a K8s client authenticating with a caller-supplied bearer token.
+
+    The API server comes from K8S_SERVER (plus K8S_CA_DATA / K8S_SKIP_TLS_VERIFY).
+
+    Raises:
+        RuntimeError: If K8S_SERVER is not set or the preflight check fails.
+    """
+    server = os.getenv("K8S_SERVER")
+    if not server:
+        raise RuntimeError("K8S_SERVER must be set to authenticate with client-supplied tokens")
+    client = EphemeralK8sClient(
+        server=server,
+        token=token,
+        ca_data=os.getenv("K8S_CA_DATA"),
+        skip_tls=os.getenv("K8S_SKIP_TLS_VERIFY", "false").lower() == "true",
+    )
+    _preflight_check(client)
+    return client
+
+
+def token_identity(token: str) -> str:
+    """Key identifying the holder of a bearer token without keeping the token itself."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _close_client(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class ClientPool:
+    """Per-identity clients for a multi-client server, keyed by bearer token.
+
+    Each token is checked once with load_token_client(); concurrent first requests for the
+    same token share that check.
+
+    A client evicted to stay within 'max_clients' is closed once every task that got it from
+    get() has finished, so a tool call can keep using its client across several awaits.
+    """
+
+    def __init__(self, max_clients: int | None = None, loader=load_token_client):
+        self.max_clients = max_clients or MAX_CLIENTS
+        self._loader = loader
+        self._clients = OrderedDict()
+        self._holders = {}
+        self._evicted = set()
+
+    async def get(self, token: str) -> AsyncEphemeralK8sClient:
+        key = token_identity(token)
+        entry = self._clients.get(key)
+        if entry is None:
+            entry = asyncio.ensure_future(self._load(token))
+            self._clients[key] = entry
+            while len(self._clients) > self.max_clients:
+                self._evict(self._clients.popitem(last=False)[1])
+        self._clients.move_to_end(key)
+        self._hold(entry)
+        try:
+            return await asyncio.shield(entry)
+        except Exception:
+            # don't cache failed logins, the token may be fixed/refreshed
+            if self._clients.get(key) is entry:
+                del self._clients[key]
+            raise
+
+    async def _load(self, token: str) -> AsyncEphemeralK8sClient:
+        return AsyncEphemeralK8sClient(await asyncio.to_thread(self._loader, token))
+
+    def _hold(self, entry: asyncio.Future) -> None:
+        task = asyncio.current_task()
+        holders = self._holders.setdefault(entry, set())
+        if task not in holders:
+            holders.add(task)
+            task.add_done_callback(lambda _: self._release(entry, task))
+
+    def _release(self, entry: asyncio.Future, task: asyncio.Task) -> None:
+        holders = self._holders[entry]
+        holders.discard(task)
+        if holders:
+            return
+        del self._holders[entry]
+        if entry in self._evicted:
+            self._evicted.discard(entry)
+            entry.add_done_callback(_close_client)
+
+    def _evict(self, entry: asyncio.Future) -> None:
+        if self._holders.get(entry):
+            self._evicted.add(entry)
+        else:
+            entry.add_done_callback(_close_client)
+
+    def close(self) -> None:
+        while self._clients:
+            self._clients.popitem()[1].add_done_callback(_close_client)
+        while self._evicted:
+            self._evicted.pop().add_done_callback(_close_client)
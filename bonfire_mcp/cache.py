@@ -0,0 +1,122 @@
+"""Request coalescing and short-lived response cache for read-only MCP tools.
+
+Agents tend to call the list/describe tools repeatedly with the same arguments. A
+ResponseCache lets identical concurrent calls share one backend call ("single-flight") and
+keeps each tool's result for a short TTL. Mutating tools call invalidate() so a reserve,
+extend or release is visible to the next read.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+
+log = logging.getLogger(__name__)
+
+# Seconds a read tool's result is reused, per tool. 0 disables caching (calls are still
+# coalesced). BONFIRE_MCP_CACHE_TTL overrides all of them.
+DEFAULT_TTLS = {
+    "ephemeral_list_pools": 30.0,
+    "ephemeral_list_reservations": 5.0,
+    "ephemeral_describe": 5.0,
+}
+
+
+def _ttls_from_env() -> dict[str, float]:
+    ttl = os.getenv("BONFIRE_MCP_CACHE_TTL")
+    if ttl is None:
+        return dict(DEFAULT_TTLS)
+    return dict.fromkeys(DEFAULT_TTLS, float(ttl))
+
+
+class ResponseCache:
+    """Single-flight + TTL cache keyed on (tool name, arguments, scope).
+
+    'scope' separates callers that may see different results, e.g. per-identity clients.
+
+    Only tools listed in 'ttls' are cached. Counters for hits, misses and coalesced calls
+    are kept per tool, see stats().
+    """
+
+    def __init__(self, ttls: dict[str, float] | None = None):
+        self.ttls = _ttls_from_env() if ttls is None else ttls
+        self._entries = {}
+        self._in_flight = {}
+        self._generation = 0
+        self.hits = Counter()
+        self.misses = Counter()
+        self.coalesced = Counter()
+
+    def cacheable(self, name: str) -> bool:
+        return name in self.ttls
+
+    @staticmethod
+    def _key(name: str, arguments: dict, scope: str | None) -> tuple:
+        return name, json.dumps(arguments, sort_keys=True, default=str), scope
+
+    async def get(
+        self,
+        name: str,
+        arguments: dict,
+        call: Callable[[], Awaitable],
+        cache_result=None,
+        scope: str | None = None,
+    ):
+        """Return a cached or in-flight result for the call, else await call().
+
+        'cache_result' decides whether a result may be kept for the TTL (e.g. not errors).
+        """
+        key = self._key(name, arguments, scope)
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.hits[name] += 1
+            return entry[1]
+
+        task = self._in_flight.get(key)
+        if task:
+            self.coalesced[name] += 1
+        else:
+            self.misses[name] += 1
+            task = asyncio.ensure_future(self._fetch(key, call, cache_result, self._generation))
+            self._in_flight[key] = task
+        # a caller being cancelled must not cancel the call shared with the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key, call, cache_result, generation):
+        try:
+            result = await call()
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+        ttl = self.ttls.get(key[0], 0)
+        # a result fetched across an invalidation may predate the write
+        fresh = ttl > 0 and generation == self._generation
+        if fresh and (cache_result is None or cache_result(result)):
+            now = time.monotonic()
+            # a long-running server sees many distinct arguments and scopes, keep only live ones
+            self._entries = {k: e for k, e in self._entries.items() if e[0] > now}
+            self._entries[key] = (now + ttl, result)
+        return result
+
+    def invalidate(self) -> None:
+        """Drop every cached result.
+
+        Calls in flight are no longer joined by new callers and their results are not stored.
+        """
+        self._generation += 1
+        self._entries.clear()
+        self._in_flight.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return {tool: {"hits": n, "misses": n, "coalesced": n}}."""
+        return {
+            name: {
+                "hits": self.hits[name],
+                "misses": self.misses[name],
+                "coalesced": self.coalesced[name],
+            }
+            for name in sorted(set(self.hits) | set(self.misses) | set(self.coalesced))
+        }
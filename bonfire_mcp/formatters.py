@@ -43,6 +43,14 @@ def format_pool_list(pools: list[dict]) -> str:
     return "\n".join(lines)
 
 
+def format_pool_choice(pool: dict) -> str:
+    """Format the pool a reservation was routed to (see pools.choose_pool())."""
+    return (
+        f"Routed to pool '{pool['name']}' (ready: {pool.get('ready', 0)}, "
+        f"creating: {pool.get('creating', 0)}, expected wait: ~{int(pool['expected_wait'])}s)"
+    )
+
+
 def format_reservation_list(reservations: list[dict]) -> str:
     """Format a list of reservation summary dicts."""
     if not reservations:
@@ -134,6 +142,8 @@ def format_cluster_reservation(reservation: dict) -> str:
         lines.append(f"  Console: {console_url}")
     if expiration:
         lines.append(f"  Expiration: {expiration}")
+    if reservation.get("kubeconfig_ready"):
+        lines.append(f"  Kubeconfig: ready (fetch with ephemeral_get_kubeconfig(name='{name}'))")
     if state in ("waiting", "provisioning") and not cluster_name:
         lines.append(
             "  Note: Poll with ephemeral_status(name='%s', type='cluster') to track progress."
@@ -7,19 +7,22 @@ namespace and cluster resource types with polymorphic dispatch.
 
 import asyncio
 import logging
+import os
 
 from mcp.server import Server
 from mcp.types import CallToolResult, TextContent, Tool
 
+from bonfire_lib.async_client import AsyncEphemeralK8sClient
 from bonfire_lib.config import Settings
-from bonfire_lib.k8s_client import EphemeralK8sClient
+from bonfire_lib.informer import CachedK8sClient
 from bonfire_lib.utils import FatalError, validate_dns_name, validate_time_string
 import bonfire_lib.reservations as reservations
 import bonfire_lib.clusters as clusters
 import bonfire_lib.pools as pools
 import bonfire_lib.status as status
 
-from bonfire_mcp.auth import load_k8s_client
+from bonfire_mcp.auth import ClientPool, load_k8s_client, token_identity
+from bonfire_mcp.cache import ResponseCache
 from bonfire_mcp.formatters import (
     format_cluster_reservation,
     format_cluster_pool_list,
@@ -27,6 +30,7 @@ from bonfire_mcp.formatters import (
     format_describe,
     format_extend,
     format_kubeconfig,
+    format_pool_choice,
     format_pool_list,
     format_release,
     format_reservation,
@@ -37,14 +41,68 @@ log = logging.getLogger(__name__)
 
 app = Server("bonfire-mcp")
 
-_client: EphemeralK8sClient | None = None
+# Serve reservation/pool reads from a watch-backed cache (bonfire_lib.informer)
+INFORMER_CACHE = os.getenv("BONFIRE_MCP_INFORMER_CACHE", "false").lower() == "true"
+
+# HTTP transport settings, see run_http_server()
+HTTP_HOST = os.getenv("BONFIRE_MCP_HOST", "127.0.0.1")
+HTTP_PORT = int(os.getenv("BONFIRE_MCP_PORT", "8000"))
+# Max concurrent MCP sessions
+MAX_SESSIONS = int(os.getenv("BONFIRE_MCP_MAX_SESSIONS", "100"))
+# Sessions idle for longer than this are closed (sec)
+SESSION_IDLE_TIMEOUT = float(os.getenv("BONFIRE_MCP_SESSION_IDLE_TIMEOUT", "1800"))
+# Max concurrent HTTP connections, further requests are answered with 503
+MAX_CONNECTIONS = int(os.getenv("BONFIRE_MCP_MAX_CONNECTIONS", "200"))
+# Reject HTTP requests without a bearer token instead of using the server's own credentials
+REQUIRE_TOKEN = os.getenv("BONFIRE_MCP_REQUIRE_TOKEN", "false").lower() == "true"
+
+# Tools after which cached read results may be out of date
+MUTATING_TOOLS = frozenset({"ephemeral_reserve", "ephemeral_release", "ephemeral_extend"})
+
+_client: AsyncEphemeralK8sClient | None = None
+_client_lock = asyncio.Lock()
 _settings: Settings | None = None
+_response_cache = ResponseCache()
+_client_pool = ClientPool()
 
 
-def _get_client() -> EphemeralK8sClient:
+def _load_client():
+    client = load_k8s_client()
+    if not INFORMER_CACHE:
+        return client
+    try:
+        return CachedK8sClient(client).start()
+    except FatalError as err:
+        log.warning("informer cache disabled, reading from the API server: %s", err)
+        return client
+
+
+def _request_token() -> str | None:
+    """Return the bearer token of the current HTTP request, None over stdio."""
+    try:
+        request = app.request_context.request
+    except LookupError:
+        return None
+    if request is None:
+        return None
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        return None
+    return token.strip()
+
+
+async def _get_client() -> AsyncEphemeralK8sClient:
     global _client
-    if _client is None:
-        _client = load_k8s_client()
+    token = _request_token()
+    if token:
+        return await _client_pool.get(token)
+    if REQUIRE_TOKEN:
+        raise FatalError("an 'Authorization: Bearer <token>' header is required")
+    async with _client_lock:
+        if _client is None:
+            # the preflight check in load_k8s_client() and the informer's initial lists make
+            # API calls
+            _client = AsyncEphemeralK8sClient(await asyncio.to_thread(_load_client))
     return _client
 
 
@@ -78,8 +136,8 @@ TOOLS = [
         name="ephemeral_reserve",
         description=(
             "Reserve an ephemeral resource (namespace or cluster). "
-            "For namespaces: polls until assigned (seconds). "
-            "For clusters: returns immediately — poll with ephemeral_status()."
+            "For namespaces: waits until assigned (seconds). "
+            "For clusters: returns immediately — wait with ephemeral_wait_for_cluster()."
         ),
         inputSchema={
             "type": "object",
@@ -130,6 +188,26 @@ TOOLS = [
                     ),
                     "default": 600,
                 },
+                "pools": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Acceptable pools, in order of preference (namespace only). The "
+                        "reservation is routed to the pool expected to assign a namespace "
+                        "soonest, based on its ready/creating/reserved counts. "
+                        "Overrides 'pool'."
+                    ),
+                },
+                "count": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": (
+                        "Number of namespaces to reserve, e.g. one per parallel test shard "
+                        "(namespace only). All are released again if any cannot be reserved. "
+                        "Cannot be combined with 'name'. Default: 1."
+                    ),
+                    "default": 1,
+                },
             },
         },
     ),
@@ -273,6 +351,29 @@ TOOLS = [
             "required": ["name"],
         },
     ),
+    Tool(
+        name="ephemeral_wait_for_cluster",
+        description=(
+            "Block until a ROSA HCP cluster reservation is active and its kubeconfig is "
+            "available (provisioning takes 20-40 min). Sends a progress notification on "
+            "each state change (waiting/provisioning/active)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Cluster reservation name.",
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "Max seconds to wait. Default: 3600.",
+                    "default": 3600,
+                },
+            },
+            "required": ["name"],
+        },
+    ),
 ]
 
 
@@ -289,25 +390,71 @@ def _error_result(message: str) -> CallToolResult:
     )
 
 
+async def _send_progress(progress: int, message: str) -> None:
+    """Send a progress notification if the client asked for them with a progressToken."""
+    try:
+        ctx = app.request_context
+    except LookupError:
+        return
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return
+    await ctx.session.send_progress_notification(
+        progress_token, progress, message=message, related_request_id=ctx.request_id
+    )
+
+
+async def _wait_for_cluster(client: AsyncEphemeralK8sClient, name: str, timeout: int) -> dict:
+    """Run clusters.wait_for_cluster() off the event loop, reporting each state change."""
+    updates = clusters.wait_for_cluster(client.client, name, timeout=timeout)
+    result = None
+    step = 0
+    async for update in client.iterate(updates):
+        result = update
+        step += 1
+        if update["kubeconfig_ready"]:
+            message = f"Cluster reservation '{name}' is active, kubeconfig is ready"
+        else:
+            message = f"Cluster reservation '{name}' is {update['state'] or 'pending'}"
+        await _send_progress(step, message)
+    return result
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolResult:
+    if _response_cache.cacheable(name):
+        token = _request_token()
+        return await _response_cache.get(
+            name,
+            arguments,
+            lambda: _call_tool(name, arguments),
+            cache_result=lambda result: not isinstance(result, CallToolResult),
+            scope=token_identity(token) if token else None,
+        )
+    try:
+        return await _call_tool(name, arguments)
+    finally:
+        if name in MUTATING_TOOLS:
+            _response_cache.invalidate()
+
+
+async def _call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolResult:
     try:
-        client = _get_client()
+        client = await _get_client()
         resource_type = arguments.get("type", "namespace")
 
         if name == "ephemeral_list_pools":
             if resource_type == "cluster":
-                result = pools.list_cluster_pools(client)
+                result = await client.run(pools.list_cluster_pools)
                 return [TextContent(type="text", text=format_cluster_pool_list(result))]
             elif resource_type == "namespace":
-                result = pools.list_pools(client)
+                result = await client.run(pools.list_pools)
                 return [TextContent(type="text", text=format_pool_list(result))]
             else:
-                ns_pools = pools.list_pools(client)
-                cl_pools = pools.list_cluster_pools(client)
-                text = format_pool_list(ns_pools)
-                if cl_pools:
-                    text += "\n\n" + format_cluster_pool_list(cl_pools)
+                result = await client.run(pools.list_all_pools)
+                text = format_pool_list(result["namespace_pools"])
+                if result["cluster_pools"]:
+                    text += "\n\n" + format_cluster_pool_list(result["cluster_pools"])
                 return [TextContent(type="text", text=text)]
 
         elif name == "ephemeral_reserve":
@@ -321,9 +468,27 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
 
             settings = _get_settings()
 
+            count = arguments.get("count", 1)
+            if count != 1:
+                if resource_type == "cluster":
+                    return _error_result("Error: 'count' is only supported for namespaces.")
+                if res_name:
+                    return _error_result("Error: 'name' cannot be combined with 'count'.")
+
+            route = ""
+            pool = arguments.get("pool", settings.default_namespace_pool)
+            if arguments.get("pools"):
+                if resource_type == "cluster":
+                    return _error_result("Error: 'pools' is only supported for namespaces.")
+                choice = await client.run(
+                    pools.choose_pool, arguments["pools"], count=max(count, 1)
+                )
+                pool = choice["name"]
+                route = format_pool_choice(choice) + "\n\n"
+
             if resource_type == "cluster":
-                result = clusters.reserve_cluster(
-                    client,
+                result = await client.run(
+                    clusters.reserve_cluster,
                     name=res_name,
                     duration=duration or "4h",
                     requester=arguments.get("requester"),
@@ -331,18 +496,29 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
                     team=arguments.get("team"),
                 )
                 return [TextContent(type="text", text=format_cluster_reservation(result))]
+            elif count != 1:
+                result = await client.run(
+                    reservations.reserve_many,
+                    count,
+                    duration=duration or settings.default_reservation_duration,
+                    requester=arguments.get("requester"),
+                    pool=pool,
+                    team=arguments.get("team"),
+                    timeout=arguments.get("timeout", 600),
+                )
+                text = "\n\n".join(format_reservation(res) for res in result)
+                return [TextContent(type="text", text=route + text)]
             else:
-                result = await asyncio.to_thread(
+                result = await client.run(
                     reservations.reserve,
-                    client,
                     name=res_name,
                     duration=duration or settings.default_reservation_duration,
                     requester=arguments.get("requester"),
-                    pool=arguments.get("pool", settings.default_namespace_pool),
+                    pool=pool,
                     team=arguments.get("team"),
                     timeout=arguments.get("timeout", 600),
                 )
-                return [TextContent(type="text", text=format_reservation(result))]
+                return [TextContent(type="text", text=route + format_reservation(result))]
 
         elif name == "ephemeral_status":
             res_name = arguments.get("name")
@@ -351,7 +527,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
             if resource_type == "cluster":
                 if not res_name:
                     return _error_result("Error: 'name' is required for cluster status lookup.")
-                result = clusters.get_cluster_status(client, res_name)
+                result = await client.run(clusters.get_cluster_status, res_name)
                 if not result:
                     return [
                         TextContent(
@@ -364,7 +540,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
                     return _error_result(
                         "Error: provide either 'name' or 'namespace' to look up a reservation."
                     )
-                res = status.get_reservation(client, name=res_name, namespace=namespace)
+                res = await client.run(status.get_reservation, name=res_name, namespace=namespace)
                 if not res:
                     return [
                         TextContent(
@@ -381,13 +557,13 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
                 res_name = arguments.get("name")
                 if not res_name:
                     return _error_result("Error: 'name' is required for cluster extend.")
-                result = clusters.extend_cluster(client, res_name, arguments["duration"])
+                result = await client.run(clusters.extend_cluster, res_name, arguments["duration"])
             else:
                 namespace = arguments.get("namespace")
                 if not namespace:
                     return _error_result("Error: 'namespace' is required for namespace extend.")
-                result = reservations.extend(
-                    client, namespace=namespace, duration=arguments["duration"]
+                result = await client.run(
+                    reservations.extend, namespace=namespace, duration=arguments["duration"]
                 )
             return [TextContent(type="text", text=format_extend(result))]
 
@@ -398,38 +574,44 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
             if resource_type == "cluster":
                 if not res_name:
                     return _error_result("Error: 'name' is required for cluster release.")
-                result = clusters.release_cluster(client, res_name)
+                result = await client.run(clusters.release_cluster, res_name)
             else:
                 if not res_name and not namespace:
                     return _error_result(
                         "Error: provide either 'name' or 'namespace' to release a reservation."
                     )
-                result = reservations.release(client, name=res_name, namespace=namespace)
+                result = await client.run(reservations.release, name=res_name, namespace=namespace)
             return [TextContent(type="text", text=format_release(result))]
 
         elif name == "ephemeral_list_reservations":
             requester = arguments.get("requester")
-            parts = []
-
-            if resource_type in ("namespace", "all"):
-                ns_result = status.list_reservations(client, requester=requester)
-                parts.append(format_reservation_list(ns_result))
-
-            if resource_type in ("cluster", "all"):
-                cl_reservations = clusters.list_cluster_reservations(client, requester=requester)
-                if cl_reservations or resource_type == "cluster":
-                    parts.append(format_cluster_reservation_list(cl_reservations))
-
-            return [TextContent(type="text", text="\n\n".join(parts))]
+            if resource_type == "namespace":
+                result = await client.run(status.list_reservations, requester=requester)
+                return [TextContent(type="text", text=format_reservation_list(result))]
+            elif resource_type == "cluster":
+                result = await client.run(clusters.list_cluster_reservations, requester=requester)
+                return [TextContent(type="text", text=format_cluster_reservation_list(result))]
+            else:
+                result = await client.run(clusters.list_all_reservations, requester=requester)
+                text = format_reservation_list(result["namespace_reservations"])
+                if result["cluster_reservations"]:
+                    text += "\n\n" + format_cluster_reservation_list(result["cluster_reservations"])
+                return [TextContent(type="text", text=text)]
 
         elif name == "ephemeral_describe":
-            result = status.describe_namespace(client, arguments["namespace"])
+            result = await client.run(status.describe_namespace, arguments["namespace"])
             return [TextContent(type="text", text=format_describe(result))]
 
         elif name == "ephemeral_get_kubeconfig":
-            kubeconfig = clusters.get_kubeconfig(client, arguments["name"])
+            kubeconfig = await client.run(clusters.get_kubeconfig, arguments["name"])
             return [TextContent(type="text", text=format_kubeconfig(arguments["name"], kubeconfig))]
 
+        elif name == "ephemeral_wait_for_cluster":
+            result = await _wait_for_cluster(
+                client, arguments["name"], arguments.get("timeout", 3600)
+            )
+            return [TextContent(type="text", text=format_cluster_reservation(result))]
+
         else:
             return _error_result(f"Unknown tool: {name}")
 
@@ -449,12 +631,64 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolR
 async def run_server():
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        log.info("response cache stats: %s", _response_cache.stats())
+
+
+def _http_app():
+    """Build the ASGI app serving MCP over streamable HTTP at /mcp."""
+    import contextlib
+
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+
+    session_manager = StreamableHTTPSessionManager(
+        app=app, max_sessions=MAX_SESSIONS, session_idle_timeout=SESSION_IDLE_TIMEOUT
+    )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_):
+        async with session_manager.run():
+            try:
+                yield
+            finally:
+                _client_pool.close()
+                log.info("response cache stats: %s", _response_cache.stats())
+
+    return Starlette(routes=[Mount("/mcp", app=session_manager.handle_request)], lifespan=lifespan)
+
+
+def run_http_server(host: str = HTTP_HOST, port: int = HTTP_PORT) -> None:
+    """Serve many MCP clients from one process over streamable HTTP.
+
+    Requests carrying 'Authorization: Bearer <token>' run as that identity (see
+    auth.ClientPool), others use the server's own credentials unless
+    BONFIRE_MCP_REQUIRE_TOKEN is set.
+    """
+    import uvicorn
+
+    uvicorn.run(_http_app(), host=host, port=port, limit_concurrency=MAX_CONNECTIONS)
 
 
 def main():
-    import asyncio
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="bonfire-mcp")
+    parser.add_argument(
+        "--transport",
+        choices=("stdio", "http"),
+        default=os.getenv("BONFIRE_MCP_TRANSPORT", "stdio"),
+    )
+    parser.add_argument("--host", default=HTTP_HOST)
+    parser.add_argument("--port", type=int, default=HTTP_PORT)
+    args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(run_server())
+    if args.transport == "http":
+        run_http_server(args.host, args.port)
+    else:
+        asyncio.run(run_server())
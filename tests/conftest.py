@@ -14,3 +14,26 @@ def mock_lib_client(mocker):
     mock_client.whoami.return_value = "test_at_user.com"
     mocker.patch("bonfire.namespaces._get_lib_client", return_value=mock_client)
     return mock_client
+
+
+@pytest.fixture(autouse=True)
+def isolated_connection_checks(mocker, tmp_path):
+    """Keep connection check results from leaking between tests or into the user's config dir.
+
+    Preflight checks are disabled for CLI tests, tests for the preflight itself call
+    bonfire.utils.preflight_url_connections directly.
+    """
+    import bonfire.utils
+
+    mocker.patch("bonfire.utils.CONN_CHECK_PATH", tmp_path / "connectioncheck")
+    mocker.patch("bonfire.utils._connection_check_cache", set())
+    mocker.patch("bonfire.utils._connection_check_cache_loaded", False)
+    mocker.patch("bonfire.utils._connection_check_futures", {})
+    mocker.patch.object(bonfire.utils, "_preflight_executor", None)
+    mocker.patch("bonfire.bonfire.preflight_url_connections")
+
+
+@pytest.fixture(autouse=True)
+def isolated_discovery_cache(monkeypatch, tmp_path):
+    """Write API discovery and reservation index cache files to a temp dir instead of ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -3,6 +3,7 @@ import pytest
 from bonfire.bonfire import _get_apps_config, APP_SRE_SRC, FILE_SRC
 
 import bonfire
+import bonfire.qontract
 
 # Make sure to use functions for these test dictionaries instead of global vars.
 # Otherwise, data gets polluted between the tests due to re-using the same dict object in memory.
@@ -167,18 +168,17 @@ def _mock_get_apps_for_env(env, preferred_params):
 
 
 def _setup_monkeypatch(monkeypatch, source, local_cfg):
-    # always patch this func since it is used in bonfire.qontract.sub_refs()
+    # always patch this func since it is used in bonfire.qontract.sub_refs(), this also covers
+    # fetching of remote app config for APP_SRE_SRC
     monkeypatch.setattr(bonfire.qontract, "get_apps_for_env", _mock_get_apps_for_env)
 
     # patch loading of local cfg
     monkeypatch.setattr(bonfire.bonfire.conf, "load_config", lambda _: local_cfg)
 
     # patch fetching of remote app config
-    if source == APP_SRE_SRC:
-        monkeypatch.setattr(bonfire.bonfire, "get_apps_for_env", _mock_get_apps_for_env)
-    elif source == FILE_SRC:
+    if source == FILE_SRC:
         monkeypatch.setattr(bonfire.bonfire, "get_appsfile_apps", lambda _: _target_apps())
-    else:
+    elif source != APP_SRE_SRC:
         raise ValueError(f"invalid source '{source}' provided to mock function")
 
 
@@ -1,15 +1,23 @@
 import json
+import logging
 from pathlib import Path
 
 import click
+import ocviapy
 import pytest
+import wait_for
 from click.testing import CliRunner
 
+import bonfire_lib.readiness
 from bonfire import bonfire
 from bonfire.utils import FatalError
+from bonfire_lib.reservations import ReservationPreflight
+from bonfire_lib.snapshot import Snapshot
 
 DATA_PATH = Path(__file__).parent.joinpath("data")
 
+PREFLIGHT_OK = ReservationPreflight(operator_installed=True, pool_exists=True)
+
 
 @pytest.fixture(scope="module")
 def namespace_list():
@@ -23,6 +31,19 @@ def reservation_list():
         return json.load(reservation_data_file)["items"]
 
 
+def _mock_snapshot(mocker, **items):
+    """Patch the snapshot loader to return 'items' (empty lists for kinds not given)."""
+
+    def _load_snapshot(client, kinds, label_selectors=None):
+        return Snapshot(**{kind: items.get(kind, []) for kind in kinds})
+
+    mocker.patch("bonfire.namespaces._get_lib_client")
+    mocker.patch("bonfire.namespaces.has_ns_operator", return_value=True)
+    return mocker.patch(
+        "bonfire.namespaces._lib_snapshot.load_snapshot", side_effect=_load_snapshot
+    )
+
+
 @pytest.mark.parametrize(
     "name",
     [
@@ -33,11 +54,8 @@ def reservation_list():
 def test_ns_reserve_flag_name(mocker, caplog, name: str):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.get_namespace_pools", return_value=["default"])
-    mocker.patch("bonfire.bonfire.get_pool_size_limit", return_value=0)
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=PREFLIGHT_OK)
     mocker.patch("bonfire.bonfire._get_requester", return_value="user-3")
-    mocker.patch("bonfire.bonfire.check_for_existing_reservation", return_value=False)
     mocker.patch("bonfire.namespaces._get_lib_client")
     mocker.patch("bonfire.namespaces.get_console_url", return_value=None)
     mocker.patch("bonfire.namespaces.set_current_namespace")
@@ -78,11 +96,8 @@ def test_ns_reserve_flag_name(mocker, caplog, name: str):
 def test_ns_reserve_flag_requester(mocker, caplog, requester: str):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.get_namespace_pools", return_value=["default"])
-    mocker.patch("bonfire.bonfire.get_pool_size_limit", return_value=0)
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=PREFLIGHT_OK)
     mocker.patch("bonfire.bonfire._get_requester", return_value=requester)
-    mocker.patch("bonfire.bonfire.check_for_existing_reservation", return_value=False)
     mocker.patch("bonfire.namespaces._get_lib_client")
     mocker.patch("bonfire.namespaces.get_console_url", return_value=None)
     mocker.patch("bonfire.namespaces.set_current_namespace")
@@ -122,11 +137,8 @@ def test_ns_reserve_flag_requester(mocker, caplog, requester: str):
 def test_ns_reserve_flag_duration(mocker, caplog, duration: str):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.get_namespace_pools", return_value=["default"])
-    mocker.patch("bonfire.bonfire.get_pool_size_limit", return_value=0)
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=PREFLIGHT_OK)
     mocker.patch("bonfire.bonfire._get_requester", return_value="user-3")
-    mocker.patch("bonfire.bonfire.check_for_existing_reservation", return_value=False)
     mocker.patch("bonfire.namespaces._get_lib_client")
     mocker.patch("bonfire.namespaces.get_console_url", return_value=None)
     mocker.patch("bonfire.namespaces.set_current_namespace")
@@ -162,10 +174,8 @@ def test_ns_reserve_flag_duration(mocker, caplog, duration: str):
 def test_ns_list_option(mocker, caplog, namespace_list: list, reservation_list: list):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
-    mocker.patch("bonfire.namespaces.get_all_namespaces", return_value=namespace_list)
-    mocker.patch("bonfire.namespaces.get_json", return_value={})
-    mocker.patch("bonfire.namespaces.get_all_reservations", return_value=reservation_list)
+    mocker.patch("bonfire.openshift.has_ns_operator", return_value=True)
+    _mock_snapshot(mocker, namespaces=namespace_list, reservations=reservation_list)
     mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
     mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
     mocker.patch("bonfire.processor.process_template", return_value={})
@@ -183,13 +193,26 @@ def test_ns_list_option(mocker, caplog, namespace_list: list, reservation_list:
     assert " ".join(["ns-5", "true", "false", "none", "none", "user-5", "default"]) in actual
 
 
+def test_namespaces_without_ns_operator(mocker, namespace_list: list):
+    from bonfire.namespaces import get_namespaces
+
+    load_snapshot = _mock_snapshot(mocker, namespaces=namespace_list)
+    mocker.patch("bonfire.namespaces.has_ns_operator", return_value=False)
+    mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
+    mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
+
+    namespaces = get_namespaces()
+
+    assert "reservations" not in load_snapshot.call_args.args[1]
+    assert namespaces
+    assert all(ns.reservation is None for ns in namespaces)
+
+
 def test_ns_list_options_available(mocker, caplog, namespace_list: list, reservation_list: list):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
-    mocker.patch("bonfire.namespaces.get_all_namespaces", return_value=namespace_list)
-    mocker.patch("bonfire.namespaces.get_json", return_value={})
-    mocker.patch("bonfire.namespaces.get_all_reservations", return_value=reservation_list)
+    mocker.patch("bonfire.openshift.has_ns_operator", return_value=True)
+    _mock_snapshot(mocker, namespaces=namespace_list, reservations=reservation_list)
     mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
     mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
     mocker.patch("bonfire.processor.process_template", return_value={})
@@ -209,10 +232,8 @@ def test_ns_list_options_available(mocker, caplog, namespace_list: list, reserva
 def test_ns_list_option_mine(mocker, caplog, namespace_list: list, reservation_list: list):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
-    mocker.patch("bonfire.namespaces.get_all_namespaces", return_value=namespace_list)
-    mocker.patch("bonfire.namespaces.get_json", return_value={})
-    mocker.patch("bonfire.namespaces.get_all_reservations", return_value=reservation_list)
+    mocker.patch("bonfire.openshift.has_ns_operator", return_value=True)
+    _mock_snapshot(mocker, namespaces=namespace_list, reservations=reservation_list)
     mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
     mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
     mocker.patch("bonfire.processor.process_template", return_value={})
@@ -238,10 +259,8 @@ def test_ns_list_flag_output(
 ):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
-    mocker.patch("bonfire.namespaces.get_all_namespaces", return_value=namespace_list)
-    mocker.patch("bonfire.namespaces.get_json", return_value={})
-    mocker.patch("bonfire.namespaces.get_all_reservations", return_value=reservation_list)
+    mocker.patch("bonfire.openshift.has_ns_operator", return_value=True)
+    _mock_snapshot(mocker, namespaces=namespace_list, reservations=reservation_list)
     mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
     mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
     mocker.patch("bonfire.processor.process_template", return_value={})
@@ -290,6 +309,90 @@ def test_ns_list_flag_output(
     assert all([item in test_items_5.items() for item in actual_ns_5.items()])
 
 
+def _reserved_ns(name):
+    return {
+        "metadata": {
+            "name": name,
+            "annotations": {"env-status": "ready", "reserved": "true"},
+            "labels": {"operator-ns": "true", "pool": "default"},
+        },
+        "status": {"phase": "Active"},
+    }
+
+
+def _ns_reservation(ns_name):
+    return {
+        "metadata": {"name": f"res-{ns_name}"},
+        "spec": {"requester": "user-1"},
+        "status": {"namespace": ns_name, "expiration": "2099-01-01T00:00:00Z"},
+    }
+
+
+def _capi_cluster(name, namespace, ready=True):
+    return {
+        "metadata": {"name": name, "namespace": namespace},
+        "status": {"conditions": [{"type": "Ready", "status": "True" if ready else "False"}]},
+    }
+
+
+def test_ns_list_bulk_loads_once(mocker, caplog):
+    caplog.set_level(100000)
+
+    ns_names = [f"ns-{i}" for i in range(50)]
+    clusters = [
+        _capi_cluster("c1", "ns-0"),
+        _capi_cluster("c2", "ns-0", ready=False),
+        _capi_cluster("c3", "ns-7"),
+    ]
+
+    mocker.patch("bonfire.openshift.has_ns_operator", return_value=True)
+    mock_load = _mock_snapshot(
+        mocker,
+        namespaces=[_reserved_ns(name) for name in ns_names],
+        reservations=[_ns_reservation(name) for name in ns_names],
+        clusters=clusters,
+    )
+    mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
+    mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
+
+    runner = CliRunner()
+    result = runner.invoke(bonfire.namespace, ["list"])
+
+    assert result.exit_code == 0, result.output
+    # every resource type is listed once, in a single snapshot
+    mock_load.assert_called_once()
+    assert set(mock_load.call_args.args[1]) == {
+        "namespaces",
+        "reservations",
+        "clowdapps",
+        "clusters",
+    }
+    actual = " ".join(result.output.split())
+    assert " ".join(["ns-0", "true", "ready", "none", "1/2", "user-1"]) in actual
+    assert " ".join(["ns-7", "true", "ready", "none", "1/1", "user-1"]) in actual
+    assert " ".join(["ns-3", "true", "ready", "none", "none", "user-1"]) in actual
+
+
+def test_ns_list_capi_unavailable(mocker, caplog):
+    caplog.set_level(100000)
+
+    mocker.patch("bonfire.openshift.has_ns_operator", return_value=True)
+    _mock_snapshot(
+        mocker,
+        namespaces=[_reserved_ns("ns-1")],
+        reservations=[_ns_reservation("ns-1")],
+        clusters=None,
+    )
+    mocker.patch("bonfire.namespaces.on_k8s", return_value=False)
+    mocker.patch("bonfire.namespaces.whoami", return_value="user-1")
+
+    runner = CliRunner()
+    result = runner.invoke(bonfire.namespace, ["list"])
+
+    actual = " ".join(result.output.split())
+    assert " ".join(["ns-1", "true", "ready", "none", "n/a", "user-1"]) in actual
+
+
 @pytest.mark.parametrize(
     "user, namespace, timeout",
     [
@@ -300,11 +403,8 @@ def test_ns_list_flag_output(
 def test_ns_reserve_flag_timeout(mocker, caplog, user: str, namespace: str, timeout: int):
     caplog.set_level(100000)
 
-    mocker.patch("bonfire.bonfire.get_namespace_pools", return_value=["default"])
-    mocker.patch("bonfire.bonfire.get_pool_size_limit", return_value=0)
-    mocker.patch("bonfire.bonfire.has_ns_operator", return_value=True)
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=PREFLIGHT_OK)
     mocker.patch("bonfire.bonfire._get_requester", return_value=user)
-    mocker.patch("bonfire.bonfire.check_for_existing_reservation", return_value=False)
     mocker.patch("bonfire.namespaces._get_lib_client")
     mocker.patch("bonfire.namespaces.get_console_url", return_value=None)
     mocker.patch("bonfire.namespaces.set_current_namespace")
@@ -333,11 +433,94 @@ def test_ns_reserve_flag_timeout(mocker, caplog, user: str, namespace: str, time
     assert mock_lib_reserve.call_args.kwargs["timeout"] == timeout
 
 
+@pytest.mark.parametrize(
+    "preflight, message",
+    [
+        (ReservationPreflight(operator_installed=False), "does not use a namespace reservation"),
+        (ReservationPreflight(operator_installed=True), "pool 'default' does not exist"),
+        (
+            ReservationPreflight(
+                operator_installed=True, pool_exists=True, size_limit=2, reserved=2
+            ),
+            "Maximum number of namespaces",
+        ),
+    ],
+)
+def test_ns_reserve_preflight_errors(mocker, caplog, preflight, message):
+    caplog.set_level(100000)
+
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=preflight)
+    mocker.patch("bonfire.bonfire._get_requester", return_value="user-1")
+    mock_reserve = mocker.patch("bonfire.namespaces.reserve_namespace")
+
+    result = CliRunner().invoke(bonfire.namespace, ["reserve"])
+
+    assert result.exit_code != 0
+    assert message in result.output
+    mock_reserve.assert_not_called()
+
+
+def test_ns_reserve_count(mocker, caplog):
+    caplog.set_level(100000)
+
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=PREFLIGHT_OK)
+    mocker.patch("bonfire.bonfire._get_requester", return_value="user-1")
+    mocker.patch("bonfire.namespaces._get_lib_client")
+    mock_reserve_many = mocker.patch(
+        "bonfire.namespaces._lib_reservations.reserve_many",
+        return_value=[{"namespace": "ns-1"}, {"namespace": "ns-2"}],
+    )
+
+    result = CliRunner().invoke(bonfire.namespace, ["reserve", "--count", "2"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines()[-2:] == ["ns-1", "ns-2"]
+    assert mock_reserve_many.call_args.args[1] == 2
+    assert mock_reserve_many.call_args.kwargs["requester"] == "user-1"
+
+
+def test_ns_reserve_pools_routes_to_chosen_pool(mocker, caplog):
+    caplog.set_level(100000)
+
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=PREFLIGHT_OK)
+    mocker.patch("bonfire.bonfire._get_requester", return_value="user-1")
+    mocker.patch("bonfire.namespaces._get_lib_client")
+    mock_choose = mocker.patch(
+        "bonfire.namespaces._lib_pools.choose_pool",
+        return_value={"name": "minimal", "ready": 1, "creating": 0, "expected_wait": 10.0},
+    )
+    mock_reserve = mocker.patch("bonfire.namespaces.reserve_namespace")
+    mock_reserve.return_value.name = "ns-1"
+
+    result = CliRunner().invoke(bonfire.namespace, ["reserve", "--pools", "default, minimal"])
+
+    assert result.exit_code == 0
+    assert mock_choose.call_args.args[1:] == (["default", "minimal"],)
+    assert mock_reserve.call_args.args[3] == "minimal"
+
+
+def test_ns_reserve_count_exceeds_pool_limit(mocker, caplog):
+    caplog.set_level(100000)
+
+    preflight = ReservationPreflight(
+        operator_installed=True, pool_exists=True, size_limit=5, reserved=4
+    )
+    mocker.patch("bonfire.namespaces.get_reservation_preflight", return_value=preflight)
+    mocker.patch("bonfire.bonfire._get_requester", return_value="user-1")
+    mock_reserve_namespaces = mocker.patch("bonfire.namespaces.reserve_namespaces")
+
+    result = CliRunner().invoke(bonfire.namespace, ["reserve", "--count", "2"])
+
+    assert result.exit_code != 0
+    assert "would exceed the limit" in result.output
+    mock_reserve_namespaces.assert_not_called()
+
+
 def test_pool_list_command(mocker, caplog):
     caplog.set_level(100000)
 
     fake_pools = ["very", "fake", "pools"]
-    mocker.patch("bonfire.bonfire.get_namespace_pools", return_value=fake_pools)
+    mocker.patch("bonfire.openshift.get_namespace_pools", return_value=fake_pools)
 
     runner = CliRunner()
     result = runner.invoke(bonfire.pool, ["list"])
@@ -363,7 +546,7 @@ _describe_cli_output = (
 
 def test_describe_ephemeral_ns(mocker):
     mocker.patch(
-        "bonfire.bonfire.describe_namespace",
+        "bonfire.namespaces.describe_namespace",
         return_value=_describe_cli_output,
     )
     runner = CliRunner()
@@ -377,7 +560,7 @@ def test_describe_ephemeral_ns(mocker):
 
 def test_describe_ephemeral_ns_from_ctx(mocker):
     mocker.patch(
-        "bonfire.bonfire.describe_namespace",
+        "bonfire.namespaces.describe_namespace",
         return_value=_describe_cli_output,
     )
     mocker.patch("bonfire.bonfire.current_namespace_or_error", return_value="ephemeral-blah")
@@ -392,7 +575,7 @@ def test_describe_ephemeral_ns_from_ctx(mocker):
 
 def test_describe_default_ns(mocker):
     mocker.patch(
-        "bonfire.bonfire.describe_namespace",
+        "bonfire.namespaces.describe_namespace",
         side_effect=FatalError("namespace 'default' was not reserved with namespace operator"),
     )
     runner = CliRunner()
@@ -405,7 +588,7 @@ def test_describe_default_ns(mocker):
 
 def test_describe_wrong_ns(mocker):
     mocker.patch(
-        "bonfire.bonfire.describe_namespace",
+        "bonfire.namespaces.describe_namespace",
         side_effect=FatalError("namespace 'ephemeral-memes' not found"),
     )
     runner = CliRunner()
@@ -652,3 +835,53 @@ class TestCLIAliases:
         assert result.exit_code == 0
         assert "rosa" in result.output
         assert "ephemeral" in result.output
+
+
+@pytest.mark.parametrize("host, checked", [("gitlab", True), ("github", False)])
+def test_preflight_gitlab_only_when_fetched(host, checked):
+    apps_config = {
+        "app-a": {"components": [{"name": "comp-a", "host": host}]},
+        "app-b": {"components": [{"name": "comp-b", "host": "gitlab"}]},
+    }
+
+    bonfire._preflight_gitlab_connection(apps_config, ("app-a",))
+
+    if checked:
+        bonfire.preflight_url_connections.assert_called_once_with(
+            [], cert_urls=[bonfire.GL_RAW_URL]
+        )
+    else:
+        bonfire.preflight_url_connections.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "lib_error, expected",
+    [
+        (bonfire_lib.readiness.StatusError("pod failed"), ocviapy.StatusError),
+        (bonfire_lib.readiness.FatalError("no such cji"), FatalError),
+        (TimeoutError("timed out"), wait_for.TimedOutError),
+    ],
+)
+def test_readiness_errors_translated(mocker, lib_error, expected):
+    from bonfire import namespaces
+
+    mocker.patch("bonfire.namespaces._get_lib_client")
+    mocker.patch("bonfire.namespaces._lib_readiness.wait_on_cji", side_effect=lib_error)
+
+    with pytest.raises(expected, match=str(lib_error)):
+        namespaces.wait_on_cji("ns-1", "my-cji", timeout=60)
+
+
+def test_choose_pool_logged_once(mocker, caplog):
+    from bonfire import namespaces
+
+    caplog.set_level(logging.INFO)
+    client = mocker.patch("bonfire.namespaces._get_lib_client").return_value
+    client.list_pools.return_value = [
+        {"metadata": {"name": "minimal"}, "spec": {"size": 2}, "status": {"ready": 2}}
+    ]
+
+    assert namespaces.choose_pool(["minimal"]) == "minimal"
+    assert [r.getMessage() for r in caplog.records] == [
+        "chose pool 'minimal' (2 ready, 0 creating), expected wait: ~10s"
+    ]
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+import pytest
+
+from bonfire_lib.async_client import AsyncEphemeralK8sClient
+
+
+@pytest.fixture
+def async_client(mock_client):
+    aclient = AsyncEphemeralK8sClient(mock_client, max_workers=2)
+    yield aclient
+    aclient.close()
+
+
+class TestAsyncEphemeralK8sClient:
+    @pytest.mark.asyncio
+    async def test_client_methods_awaitable(self, async_client, mock_client):
+        mock_client.get_reservation.return_value = {"metadata": {"name": "res"}}
+
+        result = await async_client.get_reservation("res")
+
+        assert result == {"metadata": {"name": "res"}}
+        mock_client.get_reservation.assert_called_once_with("res")
+
+    @pytest.mark.asyncio
+    async def test_run_passes_client(self, async_client, mock_client):
+        def _lookup(client, name, namespace=None):
+            assert threading.current_thread() is not threading.main_thread()
+            return client, name, namespace
+
+        assert await async_client.run(_lookup, "res", namespace="ns") == (mock_client, "res", "ns")
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, async_client, mock_client):
+        mock_client.list_pools.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await async_client.list_pools()
+
+    @pytest.mark.asyncio
+    async def test_iterate(self, async_client):
+        items = [item async for item in async_client.iterate(iter([1, None, 3]))]
+
+        assert items == [1, None, 3]
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self, async_client):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _blocking(client, value):
+            barrier.wait()
+            return value
+
+        results = await asyncio.gather(
+            async_client.run(_blocking, 1), async_client.run(_blocking, 2)
+        )
+
+        assert results == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self, mock_client):
+        aclient = AsyncEphemeralK8sClient(mock_client, max_workers=1)
+        active = []
+        peak = []
+
+        def _track(client):
+            active.append(1)
+            peak.append(len(active))
+            threading.Event().wait(0.01)
+            active.pop()
+
+        try:
+            await asyncio.gather(*(aclient.run(_track) for _ in range(4)))
+        finally:
+            aclient.close()
+
+        assert max(peak) == 1
@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+import pytest
+from kubernetes.client import ApiException
+
+from bonfire_lib.clusters import KUBECONFIG_SECRET_NAMESPACE, wait_for_cluster
+from bonfire_lib.utils import FatalError
+
+
+def _cluster_res(state, cluster_name="", resource_version="1"):
+    status = {"state": state}
+    if cluster_name:
+        status["clusterName"] = cluster_name
+    return {
+        "metadata": {"name": "my-rosa", "resourceVersion": resource_version},
+        "spec": {"requester": "user", "pool": "rosa-default", "duration": "4h"},
+        "status": status,
+    }
+
+
+def _secret():
+    return {"metadata": {"name": "rosa-abc-kubeconfig", "resourceVersion": "7"}}
+
+
+class TestWaitForCluster:
+    def test_yields_state_transitions(self, mock_client):
+        def _list(api_version, kind, **kwargs):
+            if kind == "Secret":
+                return [_secret()], "7"
+            return [_cluster_res("waiting")], "1"
+
+        mock_client.list_resources.side_effect = _list
+        mock_client.watch_resources.return_value = iter(
+            [
+                ("MODIFIED", _cluster_res("waiting", resource_version="2")),
+                ("MODIFIED", _cluster_res("provisioning", resource_version="3")),
+                ("MODIFIED", _cluster_res("active", "rosa-abc", resource_version="4")),
+            ]
+        )
+
+        updates = list(wait_for_cluster(mock_client, "my-rosa", timeout=60))
+
+        assert [(u["state"], u["kubeconfig_ready"]) for u in updates] == [
+            ("waiting", False),
+            ("provisioning", False),
+            ("active", False),
+            ("active", True),
+        ]
+        assert updates[-1]["cluster_name"] == "rosa-abc"
+        secret_list = mock_client.list_resources.call_args_list[-1]
+        assert secret_list.args == ("v1", "Secret")
+        assert secret_list.kwargs == {
+            "namespace": KUBECONFIG_SECRET_NAMESPACE,
+            "label_selector": None,
+            "field_selector": "metadata.name=rosa-abc-kubeconfig",
+        }
+
+    def test_waits_for_kubeconfig_secret(self, mock_client):
+        def _list(api_version, kind, **kwargs):
+            if kind == "Secret":
+                return [], "5"
+            return [_cluster_res("active", "rosa-abc")], "1"
+
+        mock_client.list_resources.side_effect = _list
+        mock_client.watch_resources.return_value = iter([("ADDED", _secret())])
+
+        updates = list(wait_for_cluster(mock_client, "my-rosa", timeout=60))
+
+        assert [u["kubeconfig_ready"] for u in updates] == [False, True]
+        assert mock_client.watch_resources.call_args.kwargs["resource_version"] == "5"
+
+    def test_not_found(self, mock_client):
+        mock_client.list_resources.return_value = ([], "1")
+        with pytest.raises(FatalError, match="not found"):
+            list(wait_for_cluster(mock_client, "my-rosa"))
+
+    def test_expired(self, mock_client):
+        mock_client.list_resources.return_value = ([_cluster_res("expired")], "1")
+        with pytest.raises(FatalError, match="has expired"):
+            list(wait_for_cluster(mock_client, "my-rosa"))
+
+    def test_timeout(self, mock_client):
+        mock_client.list_resources.return_value = ([_cluster_res("provisioning")], "1")
+        updates = wait_for_cluster(mock_client, "my-rosa", timeout=0)
+        assert next(updates)["state"] == "provisioning"
+        with pytest.raises(TimeoutError, match="to be active"):
+            next(updates)
+
+    @patch("bonfire_lib.status.time.sleep")
+    def test_polls_when_watch_forbidden(self, mock_sleep, mock_client):
+        mock_client.list_resources.side_effect = ApiException(status=403)
+        mock_client.get_cluster_reservation.side_effect = [
+            _cluster_res("provisioning"),
+            _cluster_res("active", "rosa-abc"),
+        ]
+        mock_client.get_secret.return_value = _secret()
+
+        updates = list(wait_for_cluster(mock_client, "my-rosa", timeout=60))
+
+        assert [u["state"] for u in updates] == ["provisioning", "active", "active"]
+        assert updates[-1]["kubeconfig_ready"] is True
+        mock_client.get_secret.assert_called_once_with(
+            "rosa-abc-kubeconfig", KUBECONFIG_SECRET_NAMESPACE
+        )
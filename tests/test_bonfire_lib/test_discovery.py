@@ -0,0 +1,35 @@
+import os
+import time
+
+from bonfire_lib import discovery
+
+
+class TestCacheFile:
+    def test_path_in_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        path = discovery.cache_file("https://api.example.com:6443", "v1.30.1")
+        assert path.startswith(str(tmp_path / "bonfire" / "discovery"))
+        assert path.endswith(".json")
+
+    def test_keyed_by_server_and_version(self):
+        a = discovery.cache_file("https://api.a.com:6443", "v1.30.1")
+        b = discovery.cache_file("https://api.b.com:6443", "v1.30.1")
+        c = discovery.cache_file("https://api.a.com:6443", "v1.31.0")
+        assert len({a, b, c}) == 3
+        assert a == discovery.cache_file("https://api.a.com:6443", "v1.30.1")
+
+    def test_fresh_file_kept(self):
+        path = discovery.cache_file("https://api.example.com", "v1.30.1")
+        with open(path, "w") as fp:
+            fp.write("{}")
+        discovery.cache_file("https://api.example.com", "v1.30.1", ttl=60)
+        assert os.path.exists(path)
+
+    def test_expired_file_removed(self):
+        path = discovery.cache_file("https://api.example.com", "v1.30.1")
+        with open(path, "w") as fp:
+            fp.write("{}")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        discovery.cache_file("https://api.example.com", "v1.30.1", ttl=60)
+        assert not os.path.exists(path)
@@ -0,0 +1,184 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from bonfire_lib.informer import CachedK8sClient, _parse_label_selector
+from bonfire_lib.k8s_client import CRD_API_VERSION
+
+
+def _res(name, requester="alice", rv="1", state="active"):
+    return {
+        "apiVersion": CRD_API_VERSION,
+        "kind": "NamespaceReservation",
+        "metadata": {"name": name, "resourceVersion": rv, "labels": {"requester": requester}},
+        "status": {"state": state},
+    }
+
+
+def _pool(name):
+    return {
+        "apiVersion": CRD_API_VERSION,
+        "kind": "NamespacePool",
+        "metadata": {"name": name, "resourceVersion": "1"},
+        "spec": {"sizeLimit": 10},
+    }
+
+
+class FakeApi:
+    """Serves list_resources/watch_resources for the cached kinds from memory."""
+
+    def __init__(self, mock_client, objects, served=("NamespaceReservation", "NamespacePool")):
+        self.objects = objects
+        self.queues = {}
+        self.list_calls = []
+        self._lock = threading.Lock()
+        mock_client.has_api_resource.side_effect = lambda api_version, kind: kind in served
+        mock_client.list_resources.side_effect = self.list_resources
+        mock_client.watch_resources.side_effect = self.watch_resources
+
+    def _queue(self, kind):
+        with self._lock:
+            return self.queues.setdefault(kind, queue.Queue())
+
+    def event(self, event_type, obj):
+        self._queue(obj["kind"]).put((event_type, obj))
+
+    def list_resources(self, api_version, kind, **kwargs):
+        self.list_calls.append(kind)
+        return [obj for obj in self.objects if obj["kind"] == kind], "1"
+
+    def watch_resources(self, api_version, kind, **kwargs):
+        q = self._queue(kind)
+        while True:
+            try:
+                yield q.get(timeout=0.1)
+            except queue.Empty:
+                return
+
+
+@pytest.fixture
+def api(mock_client):
+    return FakeApi(mock_client, [_res("res-1"), _res("res-2", requester="bob"), _pool("default")])
+
+
+@pytest.fixture
+def cached(mock_client, api):
+    client = CachedK8sClient(mock_client, write_sync_timeout=2).start()
+    yield client
+    client.stop()
+
+
+class TestCachedReads:
+    def test_reads_served_from_cache(self, cached, mock_client, api):
+        assert cached.get_reservation("res-1")["metadata"]["name"] == "res-1"
+        assert cached.get_reservation("missing") is None
+        assert [r["metadata"]["name"] for r in cached.list_reservations()] == ["res-1", "res-2"]
+        assert [p["metadata"]["name"] for p in cached.list_pools()] == ["default"]
+        assert cached.get_pool("default")["spec"]["sizeLimit"] == 10
+
+        mock_client.get_reservation.assert_not_called()
+        mock_client.iter_reservations.assert_not_called()
+        mock_client.iter_pools.assert_not_called()
+        assert sorted(api.list_calls) == ["NamespacePool", "NamespaceReservation"]
+
+    @pytest.mark.parametrize(
+        "selector, expected",
+        [
+            ("requester=bob", ["res-2"]),
+            ("requester==alice", ["res-1"]),
+            ("requester!=alice", ["res-2"]),
+            ("requester", ["res-1", "res-2"]),
+            ("!requester", []),
+        ],
+    )
+    def test_label_selector(self, cached, selector, expected):
+        names = [r["metadata"]["name"] for r in cached.iter_reservations(label_selector=selector)]
+        assert names == expected
+
+    def test_set_based_selector_uses_api(self, cached, mock_client):
+        mock_client.iter_reservations.return_value = iter([])
+
+        assert cached.list_reservations(label_selector="requester in (alice,bob)") == []
+        mock_client.iter_reservations.assert_called_once()
+
+    def test_watch_events_update_cache(self, cached, api):
+        api.event("MODIFIED", _res("res-1", rv="2", state="expired"))
+        api.event("DELETED", _res("res-2", requester="bob", rv="3"))
+        deadline = time.monotonic() + 2
+        while cached.get_reservation("res-2") is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert cached.get_reservation("res-1")["status"]["state"] == "expired"
+        assert cached.get_reservation("res-2") is None
+
+    def test_unserved_optional_kind_uses_api(self, cached, mock_client):
+        mock_client.get_cluster_reservation.return_value = {"metadata": {"name": "cr-1"}}
+
+        assert cached.get_cluster_reservation("cr-1") == {"metadata": {"name": "cr-1"}}
+        mock_client.get_cluster_reservation.assert_called_once_with("cr-1")
+
+    def test_stale_kind_uses_api(self, mock_client, api):
+        cached = CachedK8sClient(mock_client, max_staleness=5).start()
+        try:
+            for stream in cached.cache._streams:
+                stream.stale_since = time.monotonic() - 10
+            mock_client.iter_pools.return_value = iter([_pool("from-api")])
+
+            assert [p["metadata"]["name"] for p in cached.list_pools()] == ["from-api"]
+        finally:
+            cached.stop()
+
+    def test_list_resources(self, cached, mock_client):
+        items, _ = cached.list_resources(CRD_API_VERSION, "NamespaceReservation")
+        assert len(items) == 2
+
+        items, _ = cached.list_resources(
+            CRD_API_VERSION, "NamespaceReservation", field_selector="metadata.name=res-2"
+        )
+        assert [r["metadata"]["name"] for r in items] == ["res-2"]
+        assert mock_client.list_resources.call_count == 2  # initial lists only
+
+    def test_delegates_other_methods(self, cached, mock_client):
+        mock_client.get_namespace.return_value = {"metadata": {"name": "ns-1"}}
+
+        assert cached.get_namespace("ns-1") == {"metadata": {"name": "ns-1"}}
+
+
+class TestReadYourWrites:
+    def test_write_waits_for_watch(self, cached, mock_client, api):
+        written = _res("res-1", rv="7", state="active")
+        written["spec"] = {"duration": "2h"}
+        mock_client.patch_reservation.return_value = written
+        threading.Timer(0.2, api.event, ("MODIFIED", written)).start()
+
+        assert cached.patch_reservation("res-1", {"spec": {"duration": "2h"}}) is written
+        assert cached.get_reservation("res-1")["spec"] == {"duration": "2h"}
+
+    def test_write_sync_timeout(self, mock_client, api):
+        cached = CachedK8sClient(mock_client, write_sync_timeout=0.2).start()
+        try:
+            mock_client.create_reservation.return_value = _res("res-3", rv="9")
+
+            start = time.monotonic()
+            assert cached.create_reservation({})["metadata"]["name"] == "res-3"
+            assert time.monotonic() - start < 2
+            assert cached.get_reservation("res-3") is None
+        finally:
+            cached.stop()
+
+
+class TestParseLabelSelector:
+    def test_equality_based(self):
+        assert _parse_label_selector("a=1, b==2,c!=3,d,!e") == [
+            ("a", "=", "1"),
+            ("b", "=", "2"),
+            ("c", "!=", "3"),
+            ("d", "exists", None),
+            ("e", "!", None),
+        ]
+
+    @pytest.mark.parametrize("selector", ["env in (a,b)", "env notin (a)"])
+    def test_set_based_unsupported(self, selector):
+        assert _parse_label_selector(selector) is None
@@ -1,8 +1,20 @@
+import json
 from unittest.mock import patch, MagicMock
 
+import pytest
+import yaml
+
 from kubernetes.config import ConfigException
 from kubernetes.client import ApiException
-from bonfire_lib.k8s_client import EphemeralK8sClient, _sanitize_username, _extract_username
+from kubernetes.dynamic.resource import ResourceInstance
+from bonfire_lib.k8s_client import (
+    EphemeralK8sClient,
+    _extract_username,
+    _read_json,
+    _sanitize_username,
+    clear_clients,
+    get_client,
+)
 
 
 class TestSanitizeUsername:
@@ -125,3 +137,276 @@ class TestAuthModeSelection:
 
         EphemeralK8sClient(server="https://api.example.com", token="mytoken", skip_tls=True)
         assert mock_config.verify_ssl is False
+
+
+class TestApiDiscovery:
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_discovery_cache_keyed_by_server_and_version(self, mock_client_module, mock_dynamic):
+        mock_client_module.ApiClient.return_value.configuration.host = "https://api.example.com"
+        version_api = mock_client_module.VersionApi.return_value
+        version_api.get_code.return_value.git_version = "v1.30.1"
+        EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+        first = mock_dynamic.call_args.kwargs["cache_file"]
+
+        version_api.get_code.return_value.git_version = "v1.31.0"
+        EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+        second = mock_dynamic.call_args.kwargs["cache_file"]
+
+        assert "bonfire/discovery" in first
+        assert first != second
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_no_discovery_cache_without_version(self, mock_client_module, mock_dynamic):
+        mock_client_module.VersionApi.return_value.get_code.side_effect = ApiException(status=403)
+        EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+        assert mock_dynamic.call_args.kwargs["cache_file"] is None
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_has_api_resource(self, mock_client_module, mock_dynamic):
+        resources = mock_dynamic.return_value.resources
+        resources.parse_api_groups.return_value = {"apis": {"cloud.redhat.com": {"v1alpha1": {}}}}
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert k8s.has_api_resource("cloud.redhat.com/v1alpha1", "ClowdApp")
+        assert k8s.has_api_resource("cloud.redhat.com/v1alpha1", "ClowdApp")
+        # memoized per client
+        resources.get.assert_called_once_with(
+            api_version="cloud.redhat.com/v1alpha1", kind="ClowdApp"
+        )
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_has_api_resource_missing_group(self, mock_client_module, mock_dynamic):
+        resources = mock_dynamic.return_value.resources
+        resources.parse_api_groups.return_value = {"apis": {"apps": {"v1": {}}}}
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert not k8s.has_api_resource("kafka.strimzi.io/v1beta2", "Kafka")
+        # a lookup miss would invalidate the DynamicClient's discovery cache
+        resources.get.assert_not_called()
+
+
+def _raw(body):
+    """A raw (not preloaded) API response carrying 'body' as JSON."""
+    return MagicMock(data=json.dumps(body).encode())
+
+
+def _served_crd(mock_dynamic):
+    """Make the mocked DynamicClient serve cloud.redhat.com CRDs, return the resource handle."""
+    resources = mock_dynamic.return_value.resources
+    resources.parse_api_groups.return_value = {"apis": {"cloud.redhat.com": {"v1alpha1": {}}}}
+    return resources.get.return_value
+
+
+def _page(names, token=None):
+    metadata = {"continue": token} if token else {}
+    return _raw({"items": [{"metadata": {"name": n}} for n in names], "metadata": metadata})
+
+
+class TestPagination:
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_iter_follows_continue_tokens(self, mock_client_module, mock_dynamic):
+        resource = _served_crd(mock_dynamic)
+        resource.get.side_effect = [_page(["a", "b"], token="t1"), _page(["c"])]
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        names = [r["metadata"]["name"] for r in k8s.iter_reservations("requester=me", 2)]
+
+        assert names == ["a", "b", "c"]
+        first, second = resource.get.call_args_list
+        assert first.kwargs["limit"] == 2
+        assert first.kwargs["label_selector"] == "requester=me"
+        assert "_continue" not in first.kwargs
+        assert second.kwargs["_continue"] == "t1"
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_iter_stops_early(self, mock_client_module, mock_dynamic):
+        resource = _served_crd(mock_dynamic)
+        resource.get.side_effect = [_page(["a", "b"], token="t1"), _page(["c"])]
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert next(k8s.iter_pools())["metadata"]["name"] == "a"
+        resource.get.assert_called_once()
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_list_collects_all_pages(self, mock_client_module, mock_dynamic):
+        resource = _served_crd(mock_dynamic)
+        resource.get.side_effect = [_page(["a"], token="t1"), _page(["b"], token="t2"), _page([])]
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert [c["metadata"]["name"] for c in k8s.list_crds("ClowdApp", "ns")] == ["a", "b"]
+        assert resource.get.call_count == 3
+        assert all(c.kwargs["namespace"] == "ns" for c in resource.get.call_args_list)
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_iter_namespaces(self, mock_client_module, mock_dynamic):
+        core_v1 = mock_client_module.CoreV1Api.return_value
+        core_v1.list_namespace.side_effect = [_page(["ns-1"], token="t1"), _page(["ns-2"])]
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        names = [ns["metadata"]["name"] for ns in k8s.iter_namespaces("operator-ns")]
+
+        assert names == ["ns-1", "ns-2"]
+        assert core_v1.list_namespace.call_args.kwargs["_continue"] == "t1"
+        assert core_v1.list_namespace.call_args.kwargs["_preload_content"] is False
+
+
+class TestWatch:
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_read_timeout_above_watch_timeout(self, mock_client_module, mock_dynamic):
+        resource = _served_crd(mock_dynamic)
+        watcher = MagicMock()
+        body = {"metadata": {"name": "res", "resourceVersion": "7"}}
+        watcher.stream.return_value = iter([{"type": "ADDED", "raw_object": body}])
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        events = list(
+            k8s.watch_resources(
+                "cloud.redhat.com/v1alpha1",
+                "NamespaceReservation",
+                resource_version="5",
+                timeout=60,
+                watcher=watcher,
+            )
+        )
+
+        assert events == [("ADDED", body)]
+        assert watcher.stream.call_args.args == (resource.get,)
+        kwargs = watcher.stream.call_args.kwargs
+        assert kwargs["timeout_seconds"] == 60
+        assert kwargs["resource_version"] == "5"
+        assert kwargs["_request_timeout"][1] > 60
+
+
+class TestRawJsonReads:
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_dynamic_read_skips_serialization(self, mock_client_module, mock_dynamic):
+        resource = _served_crd(mock_dynamic)
+        body = {"metadata": {"name": "res", "creationTimestamp": "2026-01-01T00:00:00Z"}}
+        resource.get.return_value = _raw(body)
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert k8s.get_reservation("res") == body
+        assert resource.get.call_args.kwargs["serialize"] is False
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_core_read_keeps_api_field_names(self, mock_client_module, mock_dynamic):
+        core_v1 = mock_client_module.CoreV1Api.return_value
+        body = {"metadata": {"name": "ns-1", "creationTimestamp": "2026-01-01T00:00:00Z"}}
+        core_v1.read_namespace.return_value = _raw(body)
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert k8s.get_namespace("ns-1") == body
+        assert core_v1.read_namespace.call_args.kwargs["_preload_content"] is False
+
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_core_read_not_found(self, mock_client_module, mock_dynamic):
+        core_v1 = mock_client_module.CoreV1Api.return_value
+        core_v1.read_namespaced_secret.side_effect = ApiException(status=404)
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        assert k8s.get_secret("missing", "ns-1") is None
+
+    def test_matches_resource_instance_conversion(self):
+        body = {
+            "apiVersion": "cloud.redhat.com/v1alpha1",
+            "kind": "NamespaceReservationList",
+            "metadata": {"resourceVersion": "10"},
+            "items": [
+                {"metadata": {"name": "a", "labels": {"x": "1"}}, "spec": {"ports": [80, 443]}},
+                {"metadata": {"name": "b"}, "status": {"conditions": [{"type": "Ready"}]}},
+            ],
+        }
+
+        raw = _raw(body)
+        slow = ResourceInstance(MagicMock(), body).to_dict()
+
+        assert _read_json(raw) == slow
+        assert slow["items"][0]["kind"] == "NamespaceReservation"
+
+
+def _write_kubeconfig(path, current_context):
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "apiVersion": "v1",
+                "kind": "Config",
+                "current-context": current_context,
+                "contexts": [
+                    {"name": "a", "context": {"cluster": "cluster-a", "user": "u"}},
+                    {"name": "b", "context": {"cluster": "cluster-b", "user": "u"}},
+                ],
+                "clusters": [
+                    {"name": "cluster-a", "cluster": {"server": "https://a.example.com"}},
+                    {"name": "cluster-b", "cluster": {"server": "https://b.example.com"}},
+                ],
+                "users": [{"name": "u", "user": {"token": "t"}}],
+            }
+        )
+    )
+    return str(path)
+
+
+class TestSharedClient:
+    @pytest.fixture(autouse=True)
+    def mock_client_cls(self):
+        clear_clients()
+        with patch("bonfire_lib.k8s_client.EphemeralK8sClient") as mock_cls:
+            mock_cls.side_effect = lambda **kwargs: MagicMock()
+            yield mock_cls
+        clear_clients()
+
+    def test_reused_for_same_target(self, tmp_path, mock_client_cls):
+        kubeconfig = _write_kubeconfig(tmp_path / "config", "a")
+
+        assert get_client(kubeconfig) is get_client(kubeconfig)
+        mock_client_cls.assert_called_once_with(kubeconfig_path=kubeconfig, context=None)
+
+    def test_keyed_by_context(self, tmp_path, mock_client_cls):
+        kubeconfig = _write_kubeconfig(tmp_path / "config", "a")
+
+        assert get_client(kubeconfig, "a") is get_client(kubeconfig)
+        assert get_client(kubeconfig, "b") is not get_client(kubeconfig, "a")
+        assert mock_client_cls.call_count == 2
+
+    def test_current_context_switch(self, tmp_path, mock_client_cls):
+        kubeconfig = _write_kubeconfig(tmp_path / "config", "a")
+        first = get_client(kubeconfig)
+
+        _write_kubeconfig(tmp_path / "config", "b")
+
+        assert get_client(kubeconfig) is not first
+
+    def test_missing_kubeconfig(self, tmp_path, mock_client_cls):
+        missing = str(tmp_path / "missing")
+
+        assert get_client(missing) is get_client(missing)
+        mock_client_cls.assert_called_once()
+
+
+class TestResourceHandleCache:
+    @patch("bonfire_lib.k8s_client.DynamicClient")
+    @patch("bonfire_lib.k8s_client.client")
+    def test_resource_handle_memoized(self, mock_client_module, mock_dynamic):
+        resource = _served_crd(mock_dynamic)
+        resource.get.side_effect = lambda **kwargs: _raw({"metadata": {"name": "r"}})
+        k8s = EphemeralK8sClient(server="https://api.example.com", token="mytoken")
+
+        k8s.get_reservation("r")
+        k8s.get_reservation("r")
+        k8s.list_reservations()
+
+        mock_dynamic.return_value.resources.get.assert_called_once_with(
+            api_version="cloud.redhat.com/v1alpha1", kind="NamespaceReservation"
+        )
@@ -0,0 +1,96 @@
+"""Benchmark of the raw-JSON read path against DynamicClient ResourceInstance conversion.
+
+Deselected by default, run with: pytest -m benchmark -s tests/test_bonfire_lib
+"""
+
+import json
+import timeit
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.dynamic.resource import ResourceInstance
+
+from bonfire_lib.k8s_client import _read_json
+
+pytestmark = pytest.mark.benchmark
+
+LIST_SIZE = 5000
+
+
+def _reservation(i):
+    """A NamespaceReservation as returned by the API server, managedFields included."""
+    name = f"bonfire-reservation-{i:05d}"
+    return {
+        "apiVersion": "cloud.redhat.com/v1alpha1",
+        "kind": "NamespaceReservation",
+        "metadata": {
+            "name": name,
+            "uid": f"6f1c2d8e-0000-4000-8000-{i:012d}",
+            "resourceVersion": str(100000 + i),
+            "generation": 1,
+            "creationTimestamp": "2026-04-09T10:00:00Z",
+            "labels": {"requester": f"user-{i % 50}", "pool": "default"},
+            "annotations": {"bonfire.version": "6.0.0"},
+            "managedFields": [
+                {
+                    "apiVersion": "cloud.redhat.com/v1alpha1",
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": {
+                        "f:metadata": {"f:labels": {".": {}, "f:requester": {}, "f:pool": {}}},
+                        "f:spec": {".": {}, "f:duration": {}, "f:pool": {}, "f:requester": {}},
+                    },
+                    "manager": "bonfire",
+                    "operation": "Update",
+                    "time": "2026-04-09T10:00:00Z",
+                },
+                {
+                    "apiVersion": "cloud.redhat.com/v1alpha1",
+                    "fieldsType": "FieldsV1",
+                    "fieldsV1": {
+                        "f:status": {".": {}, "f:expiration": {}, "f:namespace": {}, "f:state": {}}
+                    },
+                    "manager": "manager",
+                    "operation": "Update",
+                    "subresource": "status",
+                    "time": "2026-04-09T10:00:05Z",
+                },
+            ],
+        },
+        "spec": {"duration": "1h", "pool": "default", "requester": f"user-{i % 50}"},
+        "status": {
+            "expiration": "2026-04-09T11:00:00Z",
+            "namespace": f"ephemeral-{i:05d}",
+            "pool": "default",
+            "state": "active" if i % 10 else "expired",
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def list_response():
+    body = {
+        "apiVersion": "cloud.redhat.com/v1alpha1",
+        "kind": "NamespaceReservationList",
+        "metadata": {"resourceVersion": "200000"},
+        "items": [_reservation(i) for i in range(LIST_SIZE)],
+    }
+    return json.dumps(body).encode()
+
+
+def test_raw_json_faster_than_resource_instance(list_response):
+    def resource_instance():
+        body = json.loads(list_response)
+        return [item.to_dict() for item in ResourceInstance(MagicMock(), body).items]
+
+    def raw_json():
+        return _read_json(MagicMock(data=list_response))["items"]
+
+    assert resource_instance() == raw_json()
+
+    slow = min(timeit.repeat(resource_instance, number=1, repeat=3))
+    fast = min(timeit.repeat(raw_json, number=1, repeat=3))
+    print(
+        f"\n{LIST_SIZE} reservations: ResourceInstance+to_dict {slow * 1000:.1f}ms, "
+        f"raw JSON {fast * 1000:.1f}ms ({slow / fast:.1f}x)"
+    )
+    assert fast < slow
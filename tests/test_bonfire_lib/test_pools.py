@@ -1,4 +1,14 @@
-from bonfire_lib.pools import list_pools, get_pool_capacity
+import pytest
+
+from bonfire_lib.pools import (
+    PROVISION_WAIT,
+    READY_WAIT,
+    choose_pool,
+    estimate_wait,
+    get_pool_capacity,
+    list_pools,
+)
+from bonfire_lib.utils import FatalError
 
 
 class TestListPools:
@@ -69,3 +79,69 @@ class TestGetPoolCapacity:
 
         result = get_pool_capacity(mock_client, "nonexistent")
         assert result is None
+
+
+def _pool(name, ready=0, creating=0, reserved=0, size_limit=None):
+    return {
+        "metadata": {"name": name},
+        "spec": {"size": 2, "sizeLimit": size_limit},
+        "status": {"ready": ready, "creating": creating, "reserved": reserved},
+    }
+
+
+class TestEstimateWait:
+    @pytest.mark.parametrize(
+        "stats, count, expected",
+        [
+            ({"ready": 1}, 1, READY_WAIT),
+            ({"ready": 1, "creating": 1}, 2, PROVISION_WAIT / 2),
+            ({"ready": 0}, 1, PROVISION_WAIT),
+            ({"ready": 3, "reserved": 10, "size_limit": 10}, 1, None),
+            ({"ready": 3, "reserved": 8, "size_limit": 10}, 3, None),
+            ({"ready": 3, "reserved": 8, "size_limit": 10}, 2, READY_WAIT),
+        ],
+    )
+    def test_estimate(self, stats, count, expected):
+        assert estimate_wait(stats, count) == expected
+
+
+class TestChoosePool:
+    def test_prefers_ready_capacity(self, mock_client):
+        mock_client.list_pools.return_value = [
+            _pool("default", ready=0, creating=1),
+            _pool("minimal", ready=2),
+        ]
+
+        choice = choose_pool(mock_client, ["default", "minimal"])
+
+        assert choice["name"] == "minimal"
+        assert choice["expected_wait"] == READY_WAIT
+        mock_client.list_pools.assert_called_once()
+
+    def test_ties_go_to_first_candidate(self, mock_client):
+        mock_client.list_pools.return_value = [_pool("a", ready=1), _pool("b", ready=1)]
+
+        assert choose_pool(mock_client, ["b", "a"])["name"] == "b"
+
+    def test_skips_full_and_missing_pools(self, mock_client):
+        mock_client.list_pools.return_value = [
+            _pool("full", ready=1, reserved=2, size_limit=2),
+            _pool("empty"),
+        ]
+
+        choice = choose_pool(mock_client, ["missing", "full", "empty"])
+
+        assert choice["name"] == "empty"
+        assert choice["expected_wait"] == PROVISION_WAIT
+
+    def test_no_room_raises(self, mock_client):
+        mock_client.list_pools.return_value = [_pool("full", reserved=2, size_limit=2)]
+
+        with pytest.raises(FatalError, match="no room"):
+            choose_pool(mock_client, ["full"])
+
+    def test_no_candidate_exists_raises(self, mock_client):
+        mock_client.list_pools.return_value = []
+
+        with pytest.raises(FatalError, match="exist"):
+            choose_pool(mock_client, ["a", "b"])
@@ -0,0 +1,614 @@
+import queue
+import threading
+import time
+
+import pytest
+from kubernetes.client import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+import bonfire_lib.readiness as readiness
+from bonfire_lib.readiness import (
+    FailureMonitor,
+    ReadinessTracker,
+    ResourceCache,
+    ResourceWaiter,
+    details_str,
+    is_ready,
+    status_error,
+    wait_for_all_resources,
+    wait_for_db_resources,
+    wait_for_ready,
+    wait_on_cji,
+)
+from bonfire_lib.utils import FatalError, StatusError
+
+NS = "ephemeral-abc123"
+
+
+def _res(kind, name, status=None, spec=None, owner=None, uid=None, namespace=NS):
+    metadata = {"name": name, "uid": uid or f"uid-{kind.lower()}-{name}"}
+    if namespace:
+        metadata["namespace"] = namespace
+    if owner:
+        metadata["ownerReferences"] = [
+            {
+                "kind": owner["kind"],
+                "name": owner["metadata"]["name"],
+                "uid": owner["metadata"]["uid"],
+            }
+        ]
+    obj = {"kind": kind, "metadata": metadata, "spec": spec or {}}
+    if status is not None:
+        obj["status"] = status
+    return obj
+
+
+def _labels_match(obj, label_selector):
+    labels = obj["metadata"].get("labels") or {}
+    key, _, value = label_selector.partition("=")
+    return key in labels and (not value or labels[key] == value)
+
+
+def _deployment(name, ready=True, owner=None):
+    status = {"availableReplicas": 1, "updatedReplicas": 1} if ready else {"replicas": 1}
+    return _res("Deployment", name, status=status, spec={"replicas": 1}, owner=owner)
+
+
+def _clowd_status(ready=True):
+    value = "True" if ready else "False"
+    return {
+        "conditions": [
+            {"type": "DeploymentsReady", "status": value},
+            {"type": "ReconciliationSuccessful", "status": "True"},
+        ]
+    }
+
+
+class FakeCluster:
+    """Serves list_resources/watch_resources for a mock EphemeralK8sClient from memory."""
+
+    def __init__(self, mock_client, missing_kinds=()):
+        self.objects = {}
+        self.queues = {}
+        self.missing_kinds = set(missing_kinds)
+        self.expire_next_watch = set()
+        self.list_calls = []
+        self._lock = threading.Lock()
+        mock_client.list_resources.side_effect = self.list_resources
+        mock_client.watch_resources.side_effect = self.watch_resources
+
+    def _queue(self, kind):
+        with self._lock:
+            return self.queues.setdefault(kind, queue.Queue())
+
+    def add(self, obj):
+        self.objects[(obj["kind"], obj["metadata"]["name"])] = obj
+
+    def event(self, event_type, obj):
+        if event_type == "DELETED":
+            self.objects.pop((obj["kind"], obj["metadata"]["name"]), None)
+        else:
+            self.add(obj)
+        self._queue(obj["kind"]).put((event_type, obj))
+
+    def list_resources(
+        self, api_version, kind, namespace=None, label_selector=None, field_selector=None
+    ):
+        if kind in self.missing_kinds:
+            raise ResourceNotFoundError(f"No matches found for {kind}")
+        self.list_calls.append(kind)
+        items = []
+        for (obj_kind, name), obj in self.objects.items():
+            if obj_kind != kind:
+                continue
+            if field_selector and field_selector != f"metadata.name={name}":
+                continue
+            if label_selector and not _labels_match(obj, label_selector):
+                continue
+            # list responses do not include 'kind' on items
+            items.append({k: v for k, v in obj.items() if k != "kind"})
+        return items, "1"
+
+    def watch_resources(self, api_version, kind, **kwargs):
+        if kind in self.expire_next_watch:
+            self.expire_next_watch.discard(kind)
+            raise ApiException(status=410, reason="Expired")
+        q = self._queue(kind)
+        while True:
+            try:
+                event_type, obj = q.get(timeout=0.1)
+            except queue.Empty:
+                # end the stream like a server-side timeout would
+                return
+            yield event_type, obj
+
+
+@pytest.fixture
+def cluster(mock_client):
+    return FakeCluster(mock_client)
+
+
+@pytest.fixture(autouse=True)
+def no_failure_grace_period(monkeypatch):
+    monkeypatch.setattr(readiness, "FAILURE_GRACE_PERIOD", 0)
+
+
+def _waiting_pod(name, reason, restarts=0, last_state=None):
+    container = {"name": "app", "state": {"waiting": {"reason": reason}}, "restartCount": restarts}
+    if last_state:
+        container["lastState"] = last_state
+    return _res("Pod", name, status={"phase": "Running", "containerStatuses": [container]})
+
+
+class TestIsReady:
+    def test_deployment_ready(self):
+        assert is_ready(_deployment("app"))
+
+    def test_deployment_not_ready(self):
+        assert not is_ready(_deployment("app", ready=False))
+
+    def test_no_status(self):
+        assert not is_ready(_res("Deployment", "app", spec={"replicas": 1}))
+
+    def test_generation_mismatch(self):
+        obj = _deployment("app")
+        obj["metadata"]["generation"] = 2
+        obj["status"]["observedGeneration"] = 1
+        assert not is_ready(obj)
+
+    def test_statefulset(self):
+        obj = _res("StatefulSet", "db", status={"readyReplicas": 2}, spec={"replicas": 2})
+        assert is_ready(obj)
+
+    def test_pod_running(self):
+        assert is_ready(_res("Pod", "p", status={"phase": "Running"}))
+        assert not is_ready(_res("Pod", "p", status={"phase": "Pending"}))
+
+    def test_job_complete(self):
+        status = {"conditions": [{"type": "Complete", "status": "True"}]}
+        assert is_ready(_res("Job", "j", status=status))
+
+    def test_clowdapp_conditions(self):
+        assert is_ready(_res("ClowdApp", "app", status=_clowd_status()))
+        assert not is_ready(_res("ClowdApp", "app", status=_clowd_status(ready=False)))
+
+    def test_cji_complete(self):
+        status = {
+            "conditions": [
+                {"type": "JobInvocationComplete", "status": "True"},
+                {"type": "ReconciliationSuccessful", "status": "True"},
+            ]
+        }
+        assert is_ready(_res("ClowdJobInvocation", "cji", status=status))
+
+    def test_capi_cluster(self):
+        status = {"phase": "Provisioned", "conditions": [{"type": "Available", "status": "True"}]}
+        assert is_ready(_res("Cluster", "c", status=status))
+        status["phase"] = "Provisioning"
+        assert not is_ready(_res("Cluster", "c", status=status))
+
+    def test_deploymentconfig(self):
+        status = {"availableReplicas": 2, "updatedReplicas": 2}
+        assert is_ready(_res("DeploymentConfig", "dc", status=status, spec={"replicas": 2}))
+        status["updatedReplicas"] = 1
+        assert not is_ready(_res("DeploymentConfig", "dc", status=status, spec={"replicas": 2}))
+
+    def test_capi_machinepool(self):
+        ready = {"conditions": [{"type": "Ready", "status": "True"}]}
+        assert is_ready(_res("MachinePool", "mp", status=ready))
+        assert is_ready(_res("MachinePool", "mp", status={"deprecated": {"v1beta1": ready}}))
+        assert not is_ready(_res("MachinePool", "mp", status={"phase": "Provisioning"}))
+
+    def test_rosa_resources(self):
+        assert is_ready(_res("ROSACluster", "c", status={"ready": True}))
+        assert not is_ready(_res("ROSACluster", "c", status={"ready": False}))
+        status = {"conditions": [{"type": "ROSAControlPlaneReady", "status": "True"}]}
+        assert is_ready(_res("ROSAControlPlane", "cp", status=status))
+        status = {"conditions": [{"type": "RosaMachinePoolReady", "status": "False"}]}
+        assert not is_ready(_res("ROSAMachinePool", "mp", status=status))
+
+    def test_unsupported_kind(self):
+        with pytest.raises(ValueError, match="not supported"):
+            is_ready(_res("ConfigMap", "cm", status={"foo": "bar"}))
+
+
+class TestStatusError:
+    def test_image_pull_error(self):
+        pod = _res(
+            "Pod",
+            "p",
+            status={
+                "phase": "Pending",
+                "containerStatuses": [
+                    {
+                        "name": "app",
+                        "state": {"waiting": {"reason": "ImagePullBackOff", "message": "nope"}},
+                    }
+                ],
+            },
+        )
+        error = status_error(pod)
+        assert "ImagePullBackOff error for pod/p (container 'app'): nope" == error
+        assert error in details_str(pod)
+
+    def test_no_error(self):
+        assert status_error(_res("Pod", "p", status={"phase": "Running"})) is None
+        assert status_error(_deployment("app")) is None
+
+    def test_container_config_error(self):
+        error = status_error(_waiting_pod("p", "CreateContainerConfigError"))
+        assert error.startswith("CreateContainerConfigError error for pod/p")
+
+    def test_crashloop_below_restart_limit(self, monkeypatch):
+        monkeypatch.setattr(readiness, "CRASHLOOP_RESTART_LIMIT", 3)
+        assert status_error(_waiting_pod("p", "CrashLoopBackOff", restarts=2)) is None
+
+    def test_crashloop_beyond_restart_limit(self, monkeypatch):
+        monkeypatch.setattr(readiness, "CRASHLOOP_RESTART_LIMIT", 3)
+        last_state = {"terminated": {"exitCode": 1, "reason": "Error"}}
+        pod = _waiting_pod("p", "CrashLoopBackOff", restarts=3, last_state=last_state)
+        assert status_error(pod) == (
+            "CrashLoopBackOff error for pod/p (container 'app'):"
+            " restarted 3 times, last exit code 1 (Error)"
+        )
+
+    def test_failed_cji_job(self):
+        status = {"conditions": [{"type": "Failed", "status": "True", "reason": "BackoffLimit"}]}
+        job = _res("Job", "j", status=status)
+        assert status_error(job) is None
+        job["metadata"]["labels"] = {"clowdjob": "cji"}
+        assert status_error(job) == "Failed error for job/j (CJI 'cji'): BackoffLimit"
+
+
+class TestFailureMonitor:
+    def test_raises_after_grace_period(self):
+        monitor = FailureMonitor(grace_period=0.2)
+        resources = {"pod/p": _waiting_pod("p", "ErrImagePull")}
+        remaining = monitor.check(resources)
+        assert 0 < remaining <= 0.2
+        time.sleep(remaining)
+        with pytest.raises(StatusError, match="ErrImagePull error for pod/p"):
+            monitor.check(resources)
+
+    def test_recovery_resets_grace_period(self):
+        monitor = FailureMonitor(grace_period=0.2)
+        monitor.check({"pod/p": _waiting_pod("p", "ErrImagePull")})
+        time.sleep(0.2)
+        assert monitor.check({"pod/p": _res("Pod", "p", status={"phase": "Running"})}) is None
+        assert monitor.check({"pod/p": _waiting_pod("p", "ErrImagePull")}) > 0
+
+
+class TestResourceCache:
+    def test_initial_list_sets_kind(self, mock_client, cluster):
+        cluster.add(_deployment("app"))
+        with ResourceCache(mock_client, NS) as cache:
+            assert cache.get("deployment/app")["kind"] == "Deployment"
+
+    def test_watch_events_update_cache(self, mock_client, cluster):
+        with ResourceCache(mock_client, NS) as cache:
+            generation = cache.generation
+            cluster.event("ADDED", _deployment("app"))
+            cache.wait_for_change(generation, 2)
+            assert "deployment/app" in cache.resources()
+
+            generation = cache.generation
+            cluster.event("DELETED", _deployment("app"))
+            cache.wait_for_change(generation, 2)
+            assert "deployment/app" not in cache.resources()
+
+    def test_bookmark_ignored(self, mock_client, cluster):
+        with ResourceCache(mock_client, NS) as cache:
+            cluster._queue("Deployment").put(
+                ("BOOKMARK", {"kind": "Deployment", "metadata": {"resourceVersion": "5"}})
+            )
+            cluster.event("ADDED", _deployment("app"))
+            deadline = time.monotonic() + 2
+            while "deployment/app" not in cache.resources() and time.monotonic() < deadline:
+                cache.wait_for_change(cache.generation, 0.1)
+            assert list(cache.resources()) == ["deployment/app"]
+
+    def test_relist_on_expired_watch(self, mock_client, cluster):
+        cluster.expire_next_watch.add("Deployment")
+        cluster.add(_deployment("app"))
+        with ResourceCache(mock_client, NS) as cache:
+            deadline = time.monotonic() + 2
+            while cluster.list_calls.count("Deployment") < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert cluster.list_calls.count("Deployment") >= 2
+            assert "deployment/app" in cache.resources()
+
+    def test_missing_optional_kind_skipped(self, mock_client):
+        FakeCluster(mock_client, missing_kinds={"Kafka", "KafkaConnect", "Cluster"})
+        with ResourceCache(mock_client, NS) as cache:
+            kinds = [spec.kind for spec in cache.watched_kinds()]
+        assert "Kafka" not in kinds
+        assert "Deployment" in kinds
+
+    def test_missing_mandatory_kind_raises(self, mock_client):
+        FakeCluster(mock_client, missing_kinds={"Deployment"})
+        with pytest.raises(FatalError, match="unable to list 'Deployment'"):
+            ResourceCache(mock_client, NS).start()
+
+    def test_cluster_scoped_kind_watched_by_name(self, mock_client, cluster):
+        cluster.add(_res("ClowdEnvironment", "env-a", namespace=None))
+        cluster.add(_res("ClowdEnvironment", "env-b", namespace=None))
+        with ResourceCache(
+            mock_client, NS, cluster_scoped_names={"ClowdEnvironment": {"env-a"}}
+        ) as cache:
+            assert "clowdenvironment/env-a" in cache.resources()
+            assert "clowdenvironment/env-b" not in cache.resources()
+
+
+class TestWaitForReady:
+    def test_ready_on_watch_event(self, mock_client, cluster):
+        cluster.add(_deployment("app", ready=False))
+        with ResourceCache(mock_client, NS) as cache:
+            timer = threading.Timer(0.2, cluster.event, ("MODIFIED", _deployment("app")))
+            timer.start()
+            start = time.monotonic()
+            assert wait_for_ready(cache, [ResourceWaiter("Deployment", "app")], timeout=5)
+            assert time.monotonic() - start < 2
+
+    def test_waits_on_owned_resources(self, mock_client, cluster):
+        app = _res("ClowdApp", "app", status=_clowd_status())
+        cluster.add(app)
+        cluster.add(_deployment("app-api", ready=False, owner=app))
+        with ResourceCache(mock_client, NS) as cache:
+            waiter = ResourceWaiter("ClowdApp", "app", watch_owned=True)
+            assert not wait_for_ready(cache, [waiter], timeout=0.3)
+            assert waiter.timed_out
+            assert "deployment/app-api" in waiter.observed_resources
+
+            cluster.event("MODIFIED", _deployment("app-api", owner=app))
+            assert wait_for_ready(cache, [waiter], timeout=5)
+
+    def test_missing_resource_times_out(self, mock_client, cluster):
+        with ResourceCache(mock_client, NS) as cache:
+            assert not wait_for_ready(cache, [ResourceWaiter("Deployment", "app")], timeout=0.2)
+
+    def test_status_error_raised(self, mock_client, cluster):
+        cluster.add(_deployment("app", ready=False))
+        pod = _res(
+            "Pod",
+            "app-123",
+            status={
+                "containerStatuses": [
+                    {"name": "c", "state": {"waiting": {"reason": "ErrImagePull"}}}
+                ]
+            },
+        )
+        cluster.add(pod)
+        with (
+            ResourceCache(mock_client, NS) as cache,
+            pytest.raises(StatusError, match="ErrImagePull error for pod/app-123"),
+        ):
+            wait_for_ready(cache, [ResourceWaiter("Deployment", "app")], timeout=5)
+
+    def test_status_error_deferred(self, mock_client, cluster):
+        cluster.add(_deployment("app", ready=False))
+        pod = _res(
+            "Pod",
+            "app-123",
+            status={
+                "containerStatuses": [
+                    {"name": "c", "state": {"waiting": {"reason": "ErrImagePull"}}}
+                ]
+            },
+        )
+        cluster.add(pod)
+        with ResourceCache(mock_client, NS) as cache:
+            waiters = [ResourceWaiter("Deployment", "app")]
+            assert not wait_for_ready(cache, waiters, timeout=0.2, defer_status_errors=True)
+
+
+class TestWaitForAllResources:
+    def _populate(self, cluster, app_ready=True):
+        env = _res("ClowdEnvironment", "env-a", status=_clowd_status(), namespace=None)
+        app = _res("ClowdApp", "app", status=_clowd_status(), spec={"envName": "env-a"})
+        cluster.add(env)
+        cluster.add(app)
+        cluster.add(_deployment("env-a-minio", owner=env))
+        cluster.add(_deployment("app-api", ready=app_ready, owner=app))
+        cluster.add(_deployment("standalone"))
+        return app
+
+    def test_all_ready(self, mock_client, cluster):
+        self._populate(cluster)
+        wait_for_all_resources(mock_client, NS, timeout=5)
+
+    def test_becomes_ready(self, mock_client, cluster):
+        app = self._populate(cluster, app_ready=False)
+        timer = threading.Timer(0.3, cluster.event, ("MODIFIED", _deployment("app-api", owner=app)))
+        timer.start()
+        wait_for_all_resources(mock_client, NS, timeout=5)
+
+    def test_timeout(self, mock_client, cluster):
+        self._populate(cluster, app_ready=False)
+        with pytest.raises(TimeoutError, match="resources owned by ClowdApps"):
+            wait_for_all_resources(mock_client, NS, timeout=0.3)
+
+    def test_remaining_resources(self, mock_client, cluster):
+        self._populate(cluster)
+        cluster.add(_deployment("other", ready=False))
+        with pytest.raises(TimeoutError, match="remaining namespace resources"):
+            wait_for_all_resources(mock_client, NS, timeout=0.3)
+
+    def test_phases_evaluated_concurrently(self, mock_client, cluster):
+        env = _res("ClowdEnvironment", "env-a", status=_clowd_status(False), namespace=None)
+        app = _res("ClowdApp", "app", status=_clowd_status(), spec={"envName": "env-a"})
+        cluster.add(env)
+        cluster.add(app)
+        cluster.add(_deployment("app-api", ready=False, owner=app))
+        cluster.add(_deployment("other", ready=False))
+        with pytest.raises(TimeoutError) as exc:
+            wait_for_all_resources(mock_client, NS, timeout=0.3)
+        # every phase that is not done is reported, not only the first one
+        assert "resources owned by ClowdEnvironment" in str(exc.value)
+        assert "resources owned by ClowdApps" in str(exc.value)
+        assert "remaining namespace resources" in str(exc.value)
+
+    def test_resource_created_while_waiting(self, mock_client, cluster):
+        app = self._populate(cluster, app_ready=False)
+        cluster.event("ADDED", _deployment("late", ready=False))
+        threading.Timer(0.2, cluster.event, ("MODIFIED", _deployment("app-api", owner=app))).start()
+        with pytest.raises(TimeoutError, match="timed out waiting for remaining namespace"):
+            wait_for_all_resources(mock_client, NS, timeout=0.5)
+
+    def test_waits_on_capi_machine_pool(self, mock_client, cluster):
+        status = {"phase": "Provisioned", "conditions": [{"type": "Available", "status": "True"}]}
+        capi_cluster = _res("Cluster", "c", status=status)
+        cluster.add(capi_cluster)
+        cluster.add(_res("MachinePool", "c-workers", status={}, owner=capi_cluster))
+        with pytest.raises(TimeoutError, match="remaining namespace resources"):
+            wait_for_all_resources(mock_client, NS, timeout=0.3)
+
+        ready = {"conditions": [{"type": "Ready", "status": "True"}]}
+        cluster.add(_res("MachinePool", "c-workers", status=ready, owner=capi_cluster))
+        wait_for_all_resources(mock_client, NS, timeout=5)
+
+    def test_waits_on_deploymentconfig(self, mock_client, cluster):
+        dc = _res("DeploymentConfig", "app", status={"replicas": 1}, spec={"replicas": 1})
+        cluster.add(dc)
+        with pytest.raises(TimeoutError, match="remaining namespace resources"):
+            wait_for_all_resources(mock_client, NS, timeout=0.3)
+
+        dc["status"] = {"availableReplicas": 1, "updatedReplicas": 1}
+        cluster.add(dc)
+        wait_for_all_resources(mock_client, NS, timeout=5)
+
+    def test_tracker_owner_edges(self, mock_client, cluster):
+        self._populate(cluster)
+        with ResourceCache(
+            mock_client, NS, cluster_scoped_names={"ClowdEnvironment": {"env-a"}}
+        ) as cache:
+            tracker = ReadinessTracker(cache, ["env-a"], ["app"])
+            tracker.wait(timeout=5)
+        remaining = [w.key for w in tracker.phases["remaining namespace resources"]]
+        # owned deployments hang off their owner instead of becoming separate nodes
+        assert remaining == ["deployment/standalone"]
+        app_waiter = tracker.phases["resources owned by ClowdApps"][0]
+        assert set(app_waiter.observed_resources) == {"clowdapp/app", "deployment/app-api"}
+
+    def test_terminal_failure_aborts_early(self, mock_client, cluster):
+        self._populate(cluster, app_ready=False)
+        cluster.add(_waiting_pod("app-api-123", "CrashLoopBackOff", restarts=5))
+        start = time.monotonic()
+        with pytest.raises(StatusError, match="CrashLoopBackOff error for pod/app-api-123"):
+            wait_for_all_resources(mock_client, NS, timeout=60, failure_grace_period=0.2)
+        assert time.monotonic() - start < 5
+
+    def test_failure_recovering_within_grace_period(self, mock_client, cluster):
+        app = self._populate(cluster, app_ready=False)
+        cluster.add(_waiting_pod("app-api-123", "ErrImagePull"))
+
+        def _recover():
+            cluster.event("MODIFIED", _res("Pod", "app-api-123", status={"phase": "Running"}))
+            cluster.event("MODIFIED", _deployment("app-api", owner=app))
+
+        threading.Timer(0.2, _recover).start()
+        wait_for_all_resources(mock_client, NS, timeout=5, failure_grace_period=2)
+
+    def test_no_resources(self, mock_client, cluster):
+        with pytest.raises(TimeoutError, match="no resources to wait for"):
+            wait_for_all_resources(mock_client, NS, timeout=1)
+
+
+class TestWaitForDbResources:
+    def test_no_clowdapps(self, mock_client, cluster):
+        with pytest.raises(ValueError, match="no clowdapps found"):
+            wait_for_db_resources(mock_client, NS)
+
+    def test_no_db_config(self, mock_client, cluster):
+        cluster.add(_res("ClowdApp", "app", spec={"envName": "env-a"}))
+        with pytest.raises(ValueError, match="no clowdapps with db configurations"):
+            wait_for_db_resources(mock_client, NS)
+
+    def test_db_ready(self, mock_client, cluster):
+        cluster.add(_res("ClowdApp", "app", spec={"envName": "env-a", "database": {"name": "app"}}))
+        cluster.add(_deployment("app-db"))
+        wait_for_db_resources(mock_client, NS, timeout=5)
+
+
+def _cji_job(name, cji_name="cji"):
+    job = _res("Job", name)
+    job["metadata"]["labels"] = {"clowdjob": cji_name}
+    return job
+
+
+def _job_pod(name, job_name, phase="Pending", waiting_reason=None):
+    status = {"phase": phase}
+    if waiting_reason:
+        status["containerStatuses"] = [
+            {"name": "iqe", "state": {"waiting": {"reason": waiting_reason, "message": "boom"}}}
+        ]
+    pod = _res("Pod", name, status=status)
+    pod["metadata"]["labels"] = {"job-name": job_name}
+    return pod
+
+
+class TestWaitOnCji:
+    def test_pod_already_running(self, mock_client, cluster):
+        cluster.add(_cji_job("cji-job"))
+        cluster.add(_job_pod("cji-job-abc", "cji-job", phase="Running"))
+        assert wait_on_cji(mock_client, NS, "cji", timeout=5) == "cji-job-abc"
+
+    def test_watches_chain_with_selectors(self, mock_client, cluster):
+        cluster.add(_cji_job("cji-job"))
+        cluster.add(_cji_job("other-job", cji_name="other"))
+        cluster.add(_job_pod("other-job-abc", "other-job", phase="Running"))
+        cluster.add(_job_pod("cji-job-abc", "cji-job", phase="Running"))
+        assert wait_on_cji(mock_client, NS, "cji", timeout=5) == "cji-job-abc"
+        selectors = {
+            call.args[1]: call.kwargs.get("label_selector")
+            for call in mock_client.list_resources.call_args_list
+        }
+        assert selectors["Job"] == "clowdjob=cji"
+        assert selectors["Pod"] == "job-name"
+
+    def test_follows_transitions(self, mock_client, cluster):
+        def _create():
+            cluster.event("ADDED", _cji_job("cji-job"))
+            time.sleep(0.1)
+            cluster.event("ADDED", _job_pod("cji-job-abc", "cji-job"))
+            time.sleep(0.1)
+            cluster.event("MODIFIED", _job_pod("cji-job-abc", "cji-job", phase="Running"))
+
+        threading.Timer(0.1, _create).start()
+        assert wait_on_cji(mock_client, NS, "cji", timeout=5) == "cji-job-abc"
+
+    def test_timeout_waiting_for_job(self, mock_client, cluster):
+        with pytest.raises(TimeoutError, match="Job to appear owned by CJI 'cji'"):
+            wait_on_cji(mock_client, NS, "cji", timeout=0.3)
+
+    def test_timeout_waiting_for_pod(self, mock_client, cluster):
+        cluster.add(_cji_job("cji-job"))
+        cluster.add(_job_pod("cji-job-abc", "cji-job"))
+        with pytest.raises(TimeoutError, match="pod 'cji-job-abc' to be running"):
+            wait_on_cji(mock_client, NS, "cji", timeout=0.3)
+
+    def test_status_error(self, mock_client, cluster):
+        cluster.add(_cji_job("cji-job"))
+        cluster.add(_job_pod("cji-job-abc", "cji-job", waiting_reason="ImagePullBackOff"))
+        with pytest.raises(StatusError, match="ImagePullBackOff"):
+            wait_on_cji(mock_client, NS, "cji", timeout=5)
+
+    def test_failed_job(self, mock_client, cluster):
+        job = _cji_job("cji-job")
+        job["status"] = {"conditions": [{"type": "Failed", "status": "True", "message": "oops"}]}
+        cluster.add(job)
+        with pytest.raises(StatusError, match="Failed error for job/cji-job"):
+            wait_on_cji(mock_client, NS, "cji", timeout=5)
+
+    def test_status_error_after_grace_period(self, mock_client, cluster):
+        cluster.add(_cji_job("cji-job"))
+        cluster.add(_job_pod("cji-job-abc", "cji-job", waiting_reason="ErrImagePull"))
+        start = time.monotonic()
+        with pytest.raises(StatusError, match="ErrImagePull"):
+            wait_on_cji(mock_client, NS, "cji", timeout=5, failure_grace_period=0.3)
+        assert 0.3 <= time.monotonic() - start < 2
+
+    def test_status_error_deferred(self, mock_client, cluster):
+        cluster.add(_cji_job("cji-job"))
+        cluster.add(_job_pod("cji-job-abc", "cji-job", waiting_reason="ErrImagePull"))
+        with pytest.raises(TimeoutError):
+            wait_on_cji(mock_client, NS, "cji", timeout=0.3, defer_status_errors=True)
@@ -0,0 +1,105 @@
+import copy
+
+from bonfire_lib.reservation_index import ReservationIndex, get_reservation_index
+
+
+def _res(name, namespace, state="active"):
+    return {
+        "metadata": {"name": name},
+        "status": {"namespace": namespace, "state": state},
+    }
+
+
+def _ns(name, reserved):
+    return {"metadata": {"name": name, "annotations": {"reserved": str(reserved).lower()}}}
+
+
+class TestReservationIndex:
+    def test_miss_rebuilds_then_hit_uses_get(self, mock_client):
+        reservations = [_res("res-1", "ns-1"), _res("res-2", "ns-2")]
+        mock_client.iter_reservations.return_value = reservations
+        mock_client.get_reservation.side_effect = lambda name: next(
+            r for r in reservations if r["metadata"]["name"] == name
+        )
+        index = ReservationIndex()
+
+        assert index.lookup(mock_client, "ns-2")["metadata"]["name"] == "res-2"
+        assert index.lookup(mock_client, "ns-1")["metadata"]["name"] == "res-1"
+
+        mock_client.iter_reservations.assert_called_once_with()
+        mock_client.get_reservation.assert_called_once_with("res-1")
+
+    def test_stale_entry_rebuilt(self, mock_client):
+        index = ReservationIndex()
+        mock_client.iter_reservations.return_value = [_res("res-1", "ns-1")]
+        index.rebuild(mock_client)
+
+        # ns-1 was released and handed to a new reservation
+        mock_client.get_reservation.return_value = _res("res-1", "ns-1", state="expired")
+        mock_client.get_namespace.return_value = _ns("ns-1", reserved=True)
+        mock_client.iter_reservations.return_value = [
+            _res("res-1", "ns-1", state="expired"),
+            _res("res-9", "ns-1"),
+        ]
+
+        assert index.lookup(mock_client, "ns-1")["metadata"]["name"] == "res-9"
+
+    def test_inactive_reservation_returned_when_no_active_one(self, mock_client):
+        mock_client.iter_reservations.return_value = [_res("res-1", "ns-1", state="expired")]
+
+        res = ReservationIndex().lookup(mock_client, "ns-1")
+
+        assert res["status"]["state"] == "expired"
+
+    def test_inactive_entry_used_without_relisting(self, mock_client):
+        expired = _res("res-1", "ns-1", state="expired")
+        mock_client.iter_reservations.return_value = [expired]
+        mock_client.get_reservation.return_value = copy.deepcopy(expired)
+        mock_client.get_namespace.return_value = _ns("ns-1", reserved=False)
+        index = ReservationIndex()
+
+        for _ in range(3):
+            assert index.lookup(mock_client, "ns-1")["metadata"]["name"] == "res-1"
+
+        mock_client.iter_reservations.assert_called_once_with()
+        assert mock_client.get_reservation.call_count == 2
+        assert mock_client.get_namespace.call_count == 2
+
+    def test_not_found(self, mock_client):
+        mock_client.iter_reservations.return_value = []
+
+        assert ReservationIndex().lookup(mock_client, "ns-1") is None
+
+    def test_persisted(self, mock_client, tmp_path):
+        path = tmp_path / "index.json"
+        res = _res("res-1", "ns-1")
+        mock_client.iter_reservations.return_value = [res]
+        ReservationIndex(path).rebuild(mock_client)
+
+        mock_client.iter_reservations.reset_mock()
+        mock_client.get_reservation.return_value = copy.deepcopy(res)
+
+        assert ReservationIndex(path).lookup(mock_client, "ns-1") == res
+        mock_client.iter_reservations.assert_not_called()
+
+    def test_unreadable_file_ignored(self, mock_client, tmp_path):
+        path = tmp_path / "index.json"
+        path.write_text("not json")
+        mock_client.iter_reservations.return_value = [_res("res-1", "ns-1")]
+
+        assert ReservationIndex(path).lookup(mock_client, "ns-1")["metadata"]["name"] == "res-1"
+
+
+class TestGetReservationIndex:
+    def test_shared_per_client(self, mock_client):
+        assert get_reservation_index(mock_client) is get_reservation_index(mock_client)
+
+    def test_persisted_per_server(self, mock_client, tmp_path):
+        mock_client.server = "https://api.example.com:6443"
+
+        index = get_reservation_index(mock_client)
+
+        assert index.path.parent == tmp_path / "cache" / "bonfire" / "reservations"
+
+    def test_in_memory_without_server(self, mock_client):
+        assert get_reservation_index(mock_client).path is None
@@ -1,8 +1,16 @@
-from unittest.mock import patch
-
 import pytest
-
-from bonfire_lib.reservations import reserve, release, extend, _find_reservation
+from kubernetes.client import ApiException
+
+from bonfire_lib.reservations import (
+    check_reservation_preflight,
+    reserve,
+    reserve_many,
+    release,
+    release_many,
+    extend,
+    extend_many,
+    _find_reservation,
+)
 from bonfire_lib.utils import FatalError
 
 
@@ -10,9 +18,9 @@ class TestReserve:
     def test_happy_path(self, mock_client, sample_reservation):
         mock_client.get_reservation.side_effect = [
             None,  # check for existing
-            sample_reservation,  # poll returns namespace
             sample_reservation,  # final get for return dict
         ]
+        mock_client.list_resources.return_value = ([sample_reservation], "1")
         mock_client.create_reservation.return_value = sample_reservation
 
         result = reserve(
@@ -35,18 +43,16 @@ class TestReserve:
         with pytest.raises(FatalError, match="already exists"):
             reserve(mock_client, name="test-reservation")
 
-    @patch("bonfire_lib.status.time")
-    def test_timeout_auto_releases(self, mock_time, mock_client):
+    def test_timeout_auto_releases(self, mock_client):
         mock_client.get_reservation.side_effect = [
             None,  # check existing
-            {"status": {}},  # poll - no namespace yet (then timeout)
             {"metadata": {"name": "test-res"}, "spec": {}},  # release._find_reservation
         ]
-        mock_time.time.side_effect = [0, 0, 100]
-        mock_time.sleep = lambda x: None
+        # watch - no namespace yet (then timeout)
+        mock_client.list_resources.return_value = ([{"status": {}}], "1")
 
         with pytest.raises(TimeoutError, match="timed out"):
-            reserve(mock_client, name="test-res", timeout=1)
+            reserve(mock_client, name="test-res", timeout=0)
 
         mock_client.patch_reservation.assert_called_once_with(
             "test-res", {"spec": {"duration": "0s"}}
@@ -56,8 +62,8 @@ class TestReserve:
         mock_client.get_reservation.side_effect = [
             None,
             sample_reservation,
-            sample_reservation,
         ]
+        mock_client.list_resources.return_value = ([sample_reservation], "1")
         mock_client.create_reservation.return_value = sample_reservation
 
         result = reserve(mock_client, duration="1h", requester="test-user")
@@ -67,14 +73,131 @@ class TestReserve:
         mock_client.get_reservation.side_effect = [
             None,
             sample_reservation,
-            sample_reservation,
         ]
+        mock_client.list_resources.return_value = ([sample_reservation], "1")
         mock_client.create_reservation.return_value = sample_reservation
 
         result = reserve(mock_client, name="test-res")
         assert result["requester"] == "test_at_user.com"
 
 
+class TestReserveMany:
+    @staticmethod
+    def _assign_all(mock_client):
+        """Have the operator assign a namespace to every reservation created."""
+        created = []
+
+        def _create(body):
+            created.append(body)
+            return body
+
+        mock_client.create_reservation.side_effect = _create
+        mock_client.list_resources.side_effect = lambda *args, **kwargs: (
+            [
+                {
+                    "metadata": body["metadata"],
+                    "status": {"namespace": f"ns-{body['metadata']['name']}", "state": "active"},
+                }
+                for body in created
+            ],
+            "1",
+        )
+        return created
+
+    def test_creates_all_and_waits_once(self, mock_client):
+        created = self._assign_all(mock_client)
+
+        results = reserve_many(mock_client, 3, duration="2h", requester="test-user")
+
+        assert [r["namespace"] for r in results] == [f"ns-{r['name']}" for r in results]
+        assert sorted(r["name"] for r in results) == sorted(b["metadata"]["name"] for b in created)
+        assert {r["requester"] for r in results} == {"test-user"}
+        assert len({r["name"] for r in results}) == 3
+        mock_client.list_resources.assert_called_once()
+        mock_client.get_reservation.assert_not_called()
+        mock_client.whoami.assert_not_called()
+
+    def test_timeout_releases_all(self, mock_client):
+        mock_client.create_reservation.side_effect = lambda body: body
+        mock_client.list_resources.return_value = ([], "1")
+        mock_client.get_reservation.side_effect = lambda name: {"metadata": {"name": name}}
+
+        with pytest.raises(TimeoutError):
+            reserve_many(mock_client, 2, requester="test-user", timeout=0)
+
+        assert mock_client.patch_reservation.call_count == 2
+        for call in mock_client.patch_reservation.call_args_list:
+            assert call.args[1] == {"spec": {"duration": "0s"}}
+
+    def test_wait_failure_releases_all(self, mock_client, mocker):
+        mock_client.create_reservation.side_effect = lambda body: body
+        mock_client.get_reservation.side_effect = lambda name: {"metadata": {"name": name}}
+        mocker.patch(
+            "bonfire_lib.reservations.wait_on_reservations",
+            side_effect=FatalError("reservation deleted while waiting"),
+        )
+
+        with pytest.raises(FatalError, match="deleted while waiting"):
+            reserve_many(mock_client, 2, requester="test-user")
+
+        assert mock_client.patch_reservation.call_count == 2
+
+    def test_create_failure_releases_created(self, mock_client):
+        calls = []
+
+        def _create(body):
+            calls.append(body)
+            if len(calls) == 2:
+                raise ApiException(status=409)
+            return body
+
+        mock_client.create_reservation.side_effect = _create
+        mock_client.get_reservation.side_effect = lambda name: {"metadata": {"name": name}}
+
+        with pytest.raises(FatalError, match="unable to create 1 of 2"):
+            reserve_many(mock_client, 2, requester="test-user")
+
+        mock_client.patch_reservation.assert_called_once()
+        mock_client.list_resources.assert_not_called()
+
+    def test_count_must_be_positive(self, mock_client):
+        with pytest.raises(FatalError, match="at least 1"):
+            reserve_many(mock_client, 0)
+
+
+class TestReleaseMany:
+    def test_by_name_and_namespace(self, mock_client, sample_reservation):
+        mock_client.get_reservation.return_value = sample_reservation
+        mock_client.iter_reservations.return_value = [sample_reservation]
+
+        results = release_many(
+            mock_client, names=["test-reservation"], namespaces=["ephemeral-abc123"]
+        )
+
+        assert [r["name"] for r in results] == ["test-reservation"] * 2
+
+    def test_all_attempted_before_raising(self, mock_client, sample_reservation):
+        mock_client.get_reservation.side_effect = lambda name: (
+            sample_reservation if name == "test-reservation" else None
+        )
+
+        with pytest.raises(FatalError, match="reservation 'missing'"):
+            release_many(mock_client, names=["missing", "test-reservation"])
+
+        mock_client.patch_reservation.assert_called_once_with(
+            "test-reservation", {"spec": {"duration": "0s"}}
+        )
+
+
+class TestExtendMany:
+    def test_extends_each(self, mock_client, sample_reservation):
+        mock_client.iter_reservations.return_value = [sample_reservation]
+
+        results = extend_many(mock_client, ["ephemeral-abc123"], "30m")
+
+        assert results == [{"name": "test-reservation", "new_duration": "1h30m0s"}]
+
+
 class TestRelease:
     def test_by_name(self, mock_client, sample_reservation):
         mock_client.get_reservation.return_value = sample_reservation
@@ -88,7 +211,7 @@ class TestRelease:
         )
 
     def test_by_namespace(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
 
         result = release(mock_client, namespace="ephemeral-abc123")
 
@@ -108,7 +231,7 @@ class TestRelease:
 
 class TestExtend:
     def test_happy_path(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
 
         result = extend(mock_client, namespace="ephemeral-abc123", duration="30m")
 
@@ -124,13 +247,13 @@ class TestExtend:
             "spec": {"duration": "1h", "requester": "user", "pool": "default"},
             "status": {"state": "expired", "namespace": "ephemeral-expired"},
         }
-        mock_client.list_reservations.return_value = [expired_res]
+        mock_client.iter_reservations.return_value = [expired_res]
 
         with pytest.raises(FatalError, match="has expired"):
             extend(mock_client, namespace="ephemeral-expired", duration="1h")
 
     def test_not_found_raises(self, mock_client):
-        mock_client.list_reservations.return_value = []
+        mock_client.iter_reservations.return_value = []
 
         with pytest.raises(FatalError, match="No reservation found"):
             extend(mock_client, namespace="nonexistent", duration="1h")
@@ -148,15 +271,79 @@ class TestFindReservation:
             _find_reservation(mock_client, name="nonexistent")
 
     def test_by_namespace_found(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
         result = _find_reservation(mock_client, namespace="ephemeral-abc123")
         assert result["metadata"]["name"] == "test-reservation"
 
     def test_by_namespace_not_found(self, mock_client):
-        mock_client.list_reservations.return_value = []
+        mock_client.iter_reservations.return_value = []
         with pytest.raises(FatalError, match="No reservation found"):
             _find_reservation(mock_client, namespace="nonexistent")
 
     def test_neither_raises(self, mock_client):
         with pytest.raises(FatalError, match="Must provide"):
             _find_reservation(mock_client)
+
+
+class TestReservationPreflight:
+    def test_can_reserve(self, mock_client, sample_pool):
+        mock_client.has_api_resource.return_value = True
+        mock_client.get_pool.return_value = sample_pool
+        mock_client.iter_reservations.return_value = iter([])
+
+        preflight = check_reservation_preflight(mock_client, "test-user", "default")
+
+        assert preflight.can_reserve
+        assert (preflight.size_limit, preflight.reserved) == (10, 2)
+        assert not preflight.has_existing_reservation
+        mock_client.iter_reservations.assert_called_once_with(label_selector="requester=test-user")
+
+    def test_existing_reservation(self, mock_client, sample_pool, sample_reservation):
+        mock_client.has_api_resource.return_value = True
+        mock_client.get_pool.return_value = sample_pool
+        mock_client.iter_reservations.return_value = iter([sample_reservation])
+        mock_client.get_namespace.return_value = {"metadata": {"name": "ephemeral-abc123"}}
+
+        preflight = check_reservation_preflight(mock_client, "test-user", "default")
+
+        assert preflight.existing_reservations == ("test-reservation",)
+        assert preflight.can_reserve
+
+    def test_pool_full(self, mock_client, sample_pool):
+        sample_pool["status"]["reserved"] = 10
+        mock_client.has_api_resource.return_value = True
+        mock_client.get_pool.return_value = sample_pool
+
+        preflight = check_reservation_preflight(
+            mock_client, "test-user", "default", check_existing=False
+        )
+
+        assert preflight.pool_full
+        assert not preflight.can_reserve
+        mock_client.iter_reservations.assert_not_called()
+
+    def test_unknown_pool(self, mock_client):
+        mock_client.has_api_resource.return_value = True
+        mock_client.get_pool.return_value = None
+        mock_client.iter_reservations.return_value = iter([])
+
+        preflight = check_reservation_preflight(mock_client, "test-user", "bogus")
+
+        assert preflight.operator_installed
+        assert not preflight.pool_exists
+
+    def test_no_operator(self, mock_client):
+        mock_client.has_api_resource.return_value = False
+
+        preflight = check_reservation_preflight(mock_client, "test-user", "default")
+
+        assert not preflight.operator_installed
+        mock_client.get_pool.assert_not_called()
+
+    def test_api_error(self, mock_client):
+        mock_client.has_api_resource.return_value = True
+        mock_client.get_pool.side_effect = ApiException(status=500)
+        mock_client.iter_reservations.return_value = iter([])
+
+        with pytest.raises(FatalError, match="unable to check pool 'default'"):
+            check_reservation_preflight(mock_client, "test-user", "default")
@@ -0,0 +1,189 @@
+import threading
+
+import pytest
+from kubernetes.client import ApiException
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from bonfire_lib.pools import list_all_pools
+from bonfire_lib.snapshot import Snapshot, load_snapshot
+from bonfire_lib.utils import FatalError
+
+
+def _ns(name, pool="default", reserved=False):
+    return {
+        "metadata": {
+            "name": name,
+            "labels": {"operator-ns": "true", "pool": pool},
+            "annotations": {"reserved": "true" if reserved else "false"},
+        }
+    }
+
+
+def _list_by_kind(items_by_kind, errors_by_kind=None):
+    errors_by_kind = errors_by_kind or {}
+
+    def _list_resources(api_version, kind, namespace=None, label_selector=None, **kwargs):
+        if kind in errors_by_kind:
+            raise errors_by_kind[kind]
+        return items_by_kind.get(kind, []), f"rv-{kind}"
+
+    return _list_resources
+
+
+@pytest.fixture
+def snapshot_client(mock_client):
+    mock_client.has_api_resource.return_value = False
+    return mock_client
+
+
+class TestLoadSnapshot:
+    def test_loads_requested_kinds(self, snapshot_client):
+        snapshot_client.list_resources.side_effect = _list_by_kind(
+            {"Namespace": [_ns("ns-1")], "NamespaceReservation": [{"metadata": {"name": "r"}}]}
+        )
+
+        snapshot = load_snapshot(snapshot_client, ("namespaces", "reservations"))
+
+        assert [ns["metadata"]["name"] for ns in snapshot.namespaces] == ["ns-1"]
+        assert len(snapshot.reservations) == 1
+        assert snapshot.pools is None
+        assert snapshot.resource_versions == {
+            "namespaces": "rv-Namespace",
+            "reservations": "rv-NamespaceReservation",
+        }
+        kinds = {c.args[1] for c in snapshot_client.list_resources.call_args_list}
+        assert kinds == {"Namespace", "NamespaceReservation"}
+
+    def test_lists_concurrently(self, snapshot_client):
+        # every list call blocks until all of them have started
+        kinds = ("namespaces", "reservations", "pools")
+        barrier = threading.Barrier(len(kinds), timeout=5)
+
+        def _list_resources(api_version, kind, **kwargs):
+            barrier.wait()
+            return [], "1"
+
+        snapshot_client.list_resources.side_effect = _list_resources
+
+        snapshot = load_snapshot(snapshot_client, kinds)
+
+        assert snapshot.namespaces == snapshot.reservations == snapshot.pools == []
+
+    def test_namespace_label_selector(self, snapshot_client):
+        snapshot_client.list_resources.side_effect = _list_by_kind({})
+
+        load_snapshot(snapshot_client, ("namespaces",))
+
+        snapshot_client.list_resources.assert_called_once_with(
+            "v1", "Namespace", label_selector="operator-ns"
+        )
+
+    def test_label_selector_override(self, snapshot_client):
+        snapshot_client.list_resources.side_effect = _list_by_kind({})
+
+        load_snapshot(
+            snapshot_client, ("reservations",), label_selectors={"reservations": "requester=me"}
+        )
+
+        assert snapshot_client.list_resources.call_args.kwargs["label_selector"] == "requester=me"
+
+    def test_uses_projects_on_openshift(self, snapshot_client):
+        snapshot_client.has_api_resource.return_value = True
+        snapshot_client.list_resources.side_effect = _list_by_kind({"Project": [_ns("ns-1")]})
+
+        snapshot = load_snapshot(snapshot_client, ("namespaces",))
+
+        assert len(snapshot.namespaces) == 1
+        snapshot_client.list_resources.assert_called_once_with(
+            "project.openshift.io/v1", "Project", label_selector="operator-ns"
+        )
+
+    @pytest.mark.parametrize(
+        "error", [ResourceNotFoundError("no such kind"), ApiException(status=403)]
+    )
+    def test_optional_kind_unavailable(self, snapshot_client, error):
+        snapshot_client.list_resources.side_effect = _list_by_kind(
+            {"Namespace": [_ns("ns-1")]}, {"Cluster": error}
+        )
+
+        snapshot = load_snapshot(snapshot_client, ("namespaces", "clusters"))
+
+        assert snapshot.clusters is None
+        assert snapshot.clusters_by_namespace == {}
+        assert "clusters" not in snapshot.resource_versions
+
+    def test_required_kind_failure_raises(self, snapshot_client):
+        snapshot_client.list_resources.side_effect = _list_by_kind(
+            {}, {"NamespaceReservation": ApiException(status=403)}
+        )
+
+        with pytest.raises(FatalError, match="NamespaceReservation"):
+            load_snapshot(snapshot_client, ("namespaces", "reservations"))
+
+    def test_optional_kind_server_error_raises(self, snapshot_client):
+        snapshot_client.list_resources.side_effect = _list_by_kind(
+            {}, {"ClowdApp": ApiException(status=500)}
+        )
+
+        with pytest.raises(FatalError):
+            load_snapshot(snapshot_client, ("clowdapps",))
+
+    def test_unknown_kind(self, snapshot_client):
+        with pytest.raises(ValueError, match="bogus"):
+            load_snapshot(snapshot_client, ("namespaces", "bogus"))
+
+
+class TestSnapshot:
+    def test_indexes_by_namespace(self):
+        snapshot = Snapshot(
+            clowdapps=[
+                {"metadata": {"name": "app-a", "namespace": "ns-1"}},
+                {"metadata": {"name": "app-b", "namespace": "ns-1"}},
+                {"metadata": {"name": "app-c", "namespace": "ns-2"}},
+            ],
+            reservations=[
+                {"metadata": {"name": "res-1"}, "status": {"namespace": "ns-1"}},
+                {"metadata": {"name": "res-2"}, "status": {"namespace": "ns-2"}},
+            ],
+        )
+
+        assert [a["metadata"]["name"] for a in snapshot.clowdapps_by_namespace["ns-1"]] == [
+            "app-a",
+            "app-b",
+        ]
+        assert snapshot.reservation_by_namespace["ns-2"]["metadata"]["name"] == "res-2"
+        assert "ns-3" not in snapshot.clowdapps_by_namespace
+
+    def test_pool_usage(self):
+        snapshot = Snapshot(
+            pools=[
+                {"metadata": {"name": "default"}, "spec": {"sizeLimit": 10}},
+                {"metadata": {"name": "minimal"}, "spec": {}},
+            ],
+            namespaces=[
+                _ns("ns-1", reserved=True),
+                _ns("ns-2", reserved=True),
+                _ns("ns-3"),
+                _ns("ns-4", pool="minimal", reserved=True),
+            ],
+        )
+
+        assert snapshot.pool_size_limit("default") == 10
+        assert snapshot.pool_size_limit("minimal") == 0
+        assert snapshot.pool_size_limit("unknown") == 0
+        assert snapshot.reserved_in_pool("default") == 2
+        assert snapshot.reserved_in_pool("minimal") == 1
+
+
+class TestListAllPools:
+    def test_single_snapshot(self, snapshot_client, sample_pool):
+        snapshot_client.list_resources.side_effect = _list_by_kind(
+            {"NamespacePool": [sample_pool]}, {"ClusterPool": ResourceNotFoundError("no CRD")}
+        )
+
+        result = list_all_pools(snapshot_client)
+
+        assert [p["name"] for p in result["namespace_pools"]] == ["default"]
+        assert result["namespace_pools"][0]["size_limit"] == 10
+        assert result["cluster_pools"] == []
+        snapshot_client.list_pools.assert_not_called()
@@ -1,12 +1,16 @@
 import base64
+import threading
 from unittest.mock import patch
 
 import pytest
+import urllib3
+from kubernetes.client import ApiException
 
 from bonfire_lib.status import (
     get_reservation,
     list_reservations,
     wait_on_reservation,
+    wait_on_reservations,
     check_for_existing_reservation,
     get_console_url,
     describe_namespace,
@@ -26,27 +30,27 @@ class TestGetReservation:
         assert result is None
 
     def test_by_namespace(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
         result = get_reservation(mock_client, namespace="ephemeral-abc123")
         assert result["metadata"]["name"] == "test-reservation"
 
     def test_by_namespace_not_found(self, mock_client):
-        mock_client.list_reservations.return_value = []
+        mock_client.iter_reservations.return_value = []
         result = get_reservation(mock_client, namespace="nonexistent")
         assert result is None
 
     def test_by_requester_single(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
         result = get_reservation(mock_client, requester="test-user")
         assert result is not None
 
     def test_by_requester_multiple(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation, sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation, sample_reservation]
         result = get_reservation(mock_client, requester="test-user")
         assert result is None
 
     def test_by_requester_none(self, mock_client):
-        mock_client.list_reservations.return_value = []
+        mock_client.iter_reservations.return_value = []
         result = get_reservation(mock_client, requester="test-user")
         assert result is None
 
@@ -80,37 +84,159 @@ class TestListReservations:
 
 
 class TestWaitOnReservation:
+    def test_namespace_already_set(self, mock_client, sample_reservation):
+        mock_client.list_resources.return_value = ([sample_reservation], "1")
+        assert wait_on_reservation(mock_client, "test-reservation") == "ephemeral-abc123"
+        mock_client.list_resources.assert_called_once_with(
+            "cloud.redhat.com/v1alpha1",
+            "NamespaceReservation",
+            namespace=None,
+            label_selector=None,
+            field_selector="metadata.name=test-reservation",
+        )
+        mock_client.watch_resources.assert_not_called()
+
     def test_returns_when_namespace_set(self, mock_client):
+        mock_client.list_resources.return_value = ([{"status": {}}], "1")
+        mock_client.watch_resources.return_value = iter(
+            [
+                ("MODIFIED", {"metadata": {"resourceVersion": "2"}, "status": {}}),
+                (
+                    "MODIFIED",
+                    {
+                        "metadata": {"resourceVersion": "3"},
+                        "status": {"namespace": "ephemeral-xyz"},
+                    },
+                ),
+            ]
+        )
+        result = wait_on_reservation(mock_client, "test-res", timeout=600)
+        assert result == "ephemeral-xyz"
+        assert mock_client.watch_resources.call_args.kwargs["resource_version"] == "1"
+        assert mock_client.watch_resources.call_args.kwargs["field_selector"] == (
+            "metadata.name=test-res"
+        )
+
+    def test_relists_when_watch_expires(self, mock_client):
+        mock_client.list_resources.side_effect = [
+            ([{"status": {}}], "1"),
+            ([{"status": {"namespace": "ephemeral-xyz"}}], "5"),
+        ]
+        mock_client.watch_resources.side_effect = ApiException(status=410)
+        assert wait_on_reservation(mock_client, "test-res", timeout=600) == "ephemeral-xyz"
+
+    def test_relists_when_watch_stalls(self, mock_client):
+        mock_client.list_resources.side_effect = [
+            ([{"status": {}}], "1"),
+            ([{"status": {"namespace": "ephemeral-xyz"}}], "5"),
+        ]
+        mock_client.watch_resources.side_effect = urllib3.exceptions.ReadTimeoutError(
+            None, None, "read timed out"
+        )
+        assert wait_on_reservation(mock_client, "test-res", timeout=600) == "ephemeral-xyz"
+
+    def test_timeout_raises(self, mock_client):
+        mock_client.list_resources.return_value = ([{"status": {}}], "1")
+        with pytest.raises(TimeoutError, match="timed out"):
+            wait_on_reservation(mock_client, "test-res", timeout=0)
+
+    @patch("bonfire_lib.status.time.sleep")
+    def test_polls_when_watch_forbidden(self, mock_sleep, mock_client):
+        mock_client.list_resources.side_effect = ApiException(status=403)
         mock_client.get_reservation.side_effect = [
+            {"status": {}},
             {"status": {}},
             {"status": {"namespace": "ephemeral-xyz"}},
         ]
-        result = wait_on_reservation(mock_client, "test-res", timeout=600)
-        assert result == "ephemeral-xyz"
+        assert wait_on_reservation(mock_client, "test-res", timeout=600) == "ephemeral-xyz"
+        # backoff between polls
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
 
-    @patch("bonfire_lib.status.time")
-    def test_timeout_raises(self, mock_time, mock_client):
-        mock_client.get_reservation.return_value = {"status": {}}
-        mock_time.time.side_effect = [0, 0, 100, 200]
-        mock_time.sleep = lambda x: None
+    def test_other_api_errors_raised(self, mock_client):
+        mock_client.list_resources.side_effect = ApiException(status=500)
+        with pytest.raises(ApiException):
+            wait_on_reservation(mock_client, "test-res", timeout=600)
 
-        with pytest.raises(TimeoutError, match="timed out"):
-            wait_on_reservation(mock_client, "test-res", timeout=1)
+
+def _assigned(name, namespace=None):
+    status = {"namespace": namespace} if namespace else {}
+    return {"metadata": {"name": name, "resourceVersion": "2"}, "status": status}
+
+
+class TestWaitOnReservations:
+    def test_one_watch_for_all(self, mock_client):
+        mock_client.list_resources.return_value = ([_assigned("res-1", "ns-1")], "1")
+        mock_client.watch_resources.return_value = iter(
+            [
+                ("ADDED", _assigned("res-2")),
+                ("MODIFIED", _assigned("other", "ns-9")),
+                ("MODIFIED", _assigned("res-2", "ns-2")),
+            ]
+        )
+
+        result = wait_on_reservations(mock_client, ["res-1", "res-2"], requester="test-user")
+
+        assert {name: res["status"]["namespace"] for name, res in result.items()} == {
+            "res-1": "ns-1",
+            "res-2": "ns-2",
+        }
+        mock_client.list_resources.assert_called_once_with(
+            "cloud.redhat.com/v1alpha1",
+            "NamespaceReservation",
+            namespace=None,
+            label_selector="requester=test-user",
+            field_selector=None,
+        )
+        mock_client.watch_resources.assert_called_once()
+
+    def test_timeout_names_pending(self, mock_client):
+        mock_client.list_resources.return_value = ([_assigned("res-1", "ns-1")], "1")
+
+        with pytest.raises(TimeoutError, match="res-2"):
+            wait_on_reservations(mock_client, ["res-1", "res-2"], timeout=0)
+
+    @patch("bonfire_lib.status.time.sleep")
+    def test_polls_pending_when_watch_forbidden(self, mock_sleep, mock_client):
+        mock_client.list_resources.side_effect = ApiException(status=403)
+        mock_client.get_reservation.side_effect = [
+            _assigned("res-1", "ns-1"),
+            _assigned("res-2"),
+            _assigned("res-2", "ns-2"),
+        ]
+
+        result = wait_on_reservations(mock_client, ["res-1", "res-2"])
+
+        assert sorted(result) == ["res-1", "res-2"]
+        assert [c.args[0] for c in mock_client.get_reservation.call_args_list] == [
+            "res-1",
+            "res-2",
+            "res-2",
+        ]
 
 
 class TestCheckForExistingReservation:
     def test_has_active_reservation(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
         mock_client.get_namespace.return_value = {"metadata": {"name": "ephemeral-abc123"}}
 
         assert check_for_existing_reservation(mock_client, "test-user") is True
 
+    def test_lists_by_requester_label(self, mock_client):
+        mock_client.iter_reservations.return_value = []
+        check_for_existing_reservation(mock_client, "test-user")
+        mock_client.iter_reservations.assert_called_once_with(label_selector="requester=test-user")
+
+    def test_scans_all_for_non_label_requester(self, mock_client):
+        mock_client.iter_reservations.return_value = []
+        check_for_existing_reservation(mock_client, "user@example.com")
+        mock_client.iter_reservations.assert_called_once_with(label_selector=None)
+
     def test_no_active_reservation(self, mock_client):
-        mock_client.list_reservations.return_value = []
+        mock_client.iter_reservations.return_value = []
         assert check_for_existing_reservation(mock_client, "test-user") is False
 
     def test_reservation_but_ns_gone(self, mock_client, sample_reservation):
-        mock_client.list_reservations.return_value = [sample_reservation]
+        mock_client.iter_reservations.return_value = [sample_reservation]
         mock_client.get_namespace.return_value = None
 
         assert check_for_existing_reservation(mock_client, "test-user") is False
@@ -134,16 +260,31 @@ class TestGetConsoleUrl:
         result = get_console_url(mock_client)
         assert result is None
 
+    def test_memoized_per_client(self, mock_client):
+        mock_client.get_configmap.return_value = {
+            "data": {"consoleURL": "https://console.example.com"}
+        }
+        get_console_url(mock_client)
+        assert get_console_url(mock_client) == "https://console.example.com"
+        mock_client.get_configmap.assert_called_once()
+
+    def test_failure_not_memoized(self, mock_client):
+        mock_client.get_configmap.side_effect = [Exception("connection error"), None]
+        get_console_url(mock_client)
+        get_console_url(mock_client)
+        assert mock_client.get_configmap.call_count == 2
+
 
 class TestDescribeNamespace:
     def test_comprehensive_output(self, mock_client):
         mock_client.get_namespace.return_value = {
             "metadata": {"name": "ephemeral-test", "labels": {"operator-ns": "true"}}
         }
-        mock_client.list_crds.side_effect = [
-            [{"metadata": {"name": "app1"}}, {"metadata": {"name": "app2"}}],  # ClowdApps
-            [{"metadata": {"name": "fe1"}}],  # Frontends
-        ]
+        crds = {
+            "ClowdApp": [{"metadata": {"name": "app1"}}, {"metadata": {"name": "app2"}}],
+            "Frontend": [{"metadata": {"name": "fe1"}}],
+        }
+        mock_client.list_crds.side_effect = lambda kind, namespace=None: crds[kind]
         mock_client.get_crd.return_value = {
             "spec": {"hostname": "test.example.com", "sso": "https://keycloak.example.com"}
         }
@@ -172,6 +313,25 @@ class TestDescribeNamespace:
         assert result["keycloak_admin_route"] == "https://keycloak.example.com"
         assert "console.example.com" in result["console_namespace_route"]
 
+    def test_lookups_run_concurrently(self, mock_client):
+        # every lookup blocks until all of them have started
+        barrier = threading.Barrier(6, timeout=5)
+
+        def _call(*args, **kwargs):
+            barrier.wait()
+
+        mock_client.get_namespace.return_value = {
+            "metadata": {"name": "ephemeral-test", "labels": {"operator-ns": "true"}}
+        }
+        for method in ("list_crds", "get_crd", "get_secret", "get_configmap"):
+            getattr(mock_client, method).side_effect = _call
+        mock_client.list_crds.side_effect = lambda *a, **kw: _call() or []
+
+        result = describe_namespace(mock_client, "ephemeral-test")
+
+        assert result["clowdapps_deployed"] == 0
+        assert result["has_cluster"] is False
+
     def test_namespace_not_found(self, mock_client):
         mock_client.get_namespace.return_value = None
         with pytest.raises(FatalError, match="not found"):
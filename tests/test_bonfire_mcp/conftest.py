@@ -6,6 +6,7 @@ import pytest
 
 from bonfire_lib.config import Settings
 from bonfire_lib.k8s_client import EphemeralK8sClient
+from bonfire_mcp.cache import ResponseCache
 
 
 @pytest.fixture
@@ -22,3 +23,11 @@ def mock_client():
 def settings():
     """Default settings for testing."""
     return Settings()
+
+
+@pytest.fixture(autouse=True)
+def response_cache(monkeypatch):
+    """A fresh server response cache per test so cached results don't leak between tests."""
+    cache = ResponseCache()
+    monkeypatch.setattr("bonfire_mcp.server._response_cache", cache)
+    return cache
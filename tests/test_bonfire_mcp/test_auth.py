@@ -1,11 +1,13 @@
 """Tests for bonfire_mcp.auth module."""
 
+import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 from kubernetes.client import ApiException
 
-from bonfire_mcp.auth import load_k8s_client, _preflight_check
+from bonfire_mcp.auth import ClientPool, load_k8s_client, load_token_client, _preflight_check
 
 
 def _make_api_exception(status: int, reason: str = "") -> ApiException:
@@ -103,50 +105,150 @@ class TestLoadK8sClient:
 class TestPreflightCheck:
     def test_success(self):
         client = MagicMock()
-        client.list_pools.return_value = []
-        client.list_reservations.return_value = []
+        client.iter_pools.return_value = iter([])
+        client.iter_reservations.return_value = iter([])
         _preflight_check(client)
 
     def test_crd_not_found_404(self):
         client = MagicMock()
-        client.list_pools.side_effect = _make_api_exception(404, "Not Found")
+        client.iter_pools.side_effect = _make_api_exception(404, "Not Found")
         with pytest.raises(RuntimeError, match="CRD not found.*404"):
             _preflight_check(client)
 
     def test_auth_failure_401(self):
         client = MagicMock()
-        client.list_pools.side_effect = _make_api_exception(401, "Unauthorized")
+        client.iter_pools.side_effect = _make_api_exception(401, "Unauthorized")
         with pytest.raises(RuntimeError, match="authentication failed.*401"):
             _preflight_check(client)
 
     def test_forbidden_403_warns_but_continues(self):
         client = MagicMock()
-        client.list_pools.side_effect = _make_api_exception(403, "Forbidden")
-        client.list_reservations.side_effect = _make_api_exception(403, "Forbidden")
+        client.iter_pools.side_effect = _make_api_exception(403, "Forbidden")
+        client.iter_reservations.side_effect = _make_api_exception(403, "Forbidden")
         _preflight_check(client)
 
     def test_forbidden_403_on_pools_still_checks_reservations(self):
         client = MagicMock()
-        client.list_pools.side_effect = _make_api_exception(403, "Forbidden")
-        client.list_reservations.return_value = []
+        client.iter_pools.side_effect = _make_api_exception(403, "Forbidden")
+        client.iter_reservations.return_value = iter([])
         _preflight_check(client)
-        client.list_reservations.assert_called_once()
+        client.iter_reservations.assert_called_once()
 
     def test_reservation_crd_not_found(self):
         client = MagicMock()
-        client.list_pools.return_value = []
-        client.list_reservations.side_effect = _make_api_exception(404, "Not Found")
+        client.iter_pools.return_value = iter([])
+        client.iter_reservations.side_effect = _make_api_exception(404, "Not Found")
         with pytest.raises(RuntimeError, match="NamespaceReservation CRD not found"):
             _preflight_check(client)
 
     def test_connection_failure(self):
         client = MagicMock()
-        client.list_pools.side_effect = ConnectionError("Connection refused")
+        client.iter_pools.side_effect = ConnectionError("Connection refused")
         with pytest.raises(RuntimeError, match="Failed to connect"):
             _preflight_check(client)
 
     def test_unexpected_api_error(self):
         client = MagicMock()
-        client.list_pools.side_effect = _make_api_exception(500, "Internal Server Error")
+        client.iter_pools.side_effect = _make_api_exception(500, "Internal Server Error")
         with pytest.raises(RuntimeError, match="Unexpected error.*500"):
             _preflight_check(client)
+
+
+class TestLoadTokenClient:
+    @patch("bonfire_mcp.auth._preflight_check")
+    @patch("bonfire_mcp.auth.EphemeralK8sClient")
+    def test_uses_configured_server(self, mock_cls, mock_preflight, monkeypatch):
+        monkeypatch.setenv("K8S_SERVER", "https://api.example.com:6443")
+        monkeypatch.setenv("K8S_TOKEN", "server-token")
+        monkeypatch.delenv("K8S_CA_DATA", raising=False)
+        monkeypatch.delenv("K8S_SKIP_TLS_VERIFY", raising=False)
+
+        client = load_token_client("caller-token")
+        mock_cls.assert_called_once_with(
+            server="https://api.example.com:6443",
+            token="caller-token",
+            ca_data=None,
+            skip_tls=False,
+        )
+        mock_preflight.assert_called_once_with(client)
+
+    def test_requires_server(self, monkeypatch):
+        monkeypatch.delenv("K8S_SERVER", raising=False)
+        with pytest.raises(RuntimeError, match="K8S_SERVER"):
+            load_token_client("caller-token")
+
+
+class TestClientPool:
+    @pytest.mark.asyncio
+    async def test_one_client_per_token(self):
+        loader = MagicMock(side_effect=lambda token: MagicMock(token=token))
+        pool = ClientPool(loader=loader)
+
+        first = await pool.get("token-a")
+        assert await pool.get("token-a") is first
+        assert (await pool.get("token-b")).client.token == "token-b"
+        assert loader.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_logins_share_one_load(self):
+        release = threading.Event()
+
+        def loader(token):
+            release.wait(timeout=5)
+            return MagicMock()
+
+        pool = ClientPool(loader=MagicMock(side_effect=loader))
+        pending = [asyncio.ensure_future(pool.get("token-a")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+
+        clients = await asyncio.gather(*pending)
+        assert clients[0] is clients[1] is clients[2]
+        assert pool._loader.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        pool = ClientPool(max_clients=2, loader=lambda token: MagicMock())
+        # each tool call gets its client in its own task
+        a = await asyncio.ensure_future(pool.get("token-a"))
+        b = await asyncio.ensure_future(pool.get("token-b"))
+        await asyncio.ensure_future(pool.get("token-a"))
+        await asyncio.ensure_future(pool.get("token-c"))
+        await asyncio.sleep(0)
+
+        assert await pool.get("token-a") is a
+        assert len(pool._clients) == 2
+        assert b._executor._shutdown
+
+    @pytest.mark.asyncio
+    async def test_evicted_client_open_until_call_finishes(self):
+        pool = ClientPool(max_clients=1, loader=lambda token: MagicMock())
+        evicted = asyncio.Event()
+
+        async def tool_call():
+            client = await pool.get("token-a")
+            await client.run(lambda c: None)
+            await evicted.wait()
+            # e.g. ephemeral_reserve's reserve() after choose_pool()
+            await client.run(lambda c: None)
+            return client
+
+        call = asyncio.ensure_future(tool_call())
+        await asyncio.sleep(0.05)
+        await asyncio.ensure_future(pool.get("token-b"))
+        evicted.set()
+
+        a = await call
+        await asyncio.sleep(0)
+        assert len(pool._clients) == 1
+        assert a._executor._shutdown
+
+    @pytest.mark.asyncio
+    async def test_failed_login_not_cached(self):
+        loader = MagicMock(side_effect=[RuntimeError("401 Unauthorized"), MagicMock()])
+        pool = ClientPool(loader=loader)
+
+        with pytest.raises(RuntimeError, match="401"):
+            await pool.get("token-a")
+        await pool.get("token-a")
+        assert loader.call_count == 2
@@ -0,0 +1,145 @@
+"""Tests for bonfire_mcp.cache — single-flight and TTL response cache."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from bonfire_mcp.cache import ResponseCache
+
+
+def _counting_call(result="ok", event=None):
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if event:
+            await event.wait()
+        return result
+
+    return call, calls
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self):
+        cache = ResponseCache({"tool": 0})
+        release = asyncio.Event()
+        call, calls = _counting_call(event=release)
+
+        pending = [asyncio.ensure_future(cache.get("tool", {"a": 1}, call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*pending) == ["ok"] * 3
+        assert len(calls) == 1
+        assert cache.stats() == {"tool": {"hits": 0, "misses": 1, "coalesced": 2}}
+
+    @pytest.mark.asyncio
+    async def test_ttl(self):
+        cache = ResponseCache({"tool": 10})
+        call, calls = _counting_call()
+
+        with patch("bonfire_mcp.cache.time.monotonic", return_value=100):
+            await cache.get("tool", {"a": 1}, call)
+            await cache.get("tool", {"a": 1}, call)
+            await cache.get("tool", {"a": 2}, call)
+        with patch("bonfire_mcp.cache.time.monotonic", return_value=111):
+            await cache.get("tool", {"a": 1}, call)
+
+        assert len(calls) == 3
+        assert cache.stats()["tool"] == {"hits": 1, "misses": 3, "coalesced": 0}
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_dropped(self):
+        cache = ResponseCache({"tool": 10})
+        call, _ = _counting_call()
+
+        with patch("bonfire_mcp.cache.time.monotonic", return_value=100):
+            await cache.get("tool", {"namespace": "ns-1"}, call, scope="token-a")
+        with patch("bonfire_mcp.cache.time.monotonic", return_value=111):
+            await cache.get("tool", {"namespace": "ns-2"}, call, scope="token-b")
+
+        assert [key[1:] for key in cache._entries] == [('{"namespace": "ns-2"}', "token-b")]
+
+    @pytest.mark.asyncio
+    async def test_argument_order_ignored(self):
+        cache = ResponseCache({"tool": 10})
+        call, calls = _counting_call()
+
+        await cache.get("tool", {"a": 1, "b": 2}, call)
+        await cache.get("tool", {"b": 2, "a": 1}, call)
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        cache = ResponseCache({"tool": 10})
+        call, calls = _counting_call()
+
+        await cache.get("tool", {}, call)
+        cache.invalidate()
+        await cache.get("tool", {}, call)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_result_fetched_across_invalidation_not_stored(self):
+        cache = ResponseCache({"tool": 10})
+        release = asyncio.Event()
+        call, calls = _counting_call(event=release)
+
+        pending = asyncio.ensure_future(cache.get("tool", {}, call))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        release.set()
+        await pending
+        await cache.get("tool", {}, call)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_call_in_flight_at_invalidation_not_joined(self):
+        cache = ResponseCache({"tool": 0})
+        release = asyncio.Event()
+        call, calls = _counting_call(event=release)
+
+        before = asyncio.ensure_future(cache.get("tool", {}, call))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        after = asyncio.ensure_future(cache.get("tool", {}, call))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(before, after)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_result_predicate(self):
+        cache = ResponseCache({"tool": 10})
+        call, calls = _counting_call(result="error")
+
+        await cache.get("tool", {}, call, cache_result=lambda r: r != "error")
+        await cache.get("tool", {}, call, cache_result=lambda r: r != "error")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        cache = ResponseCache({"tool": 0})
+        release = asyncio.Event()
+        call, calls = _counting_call(event=release)
+
+        first = asyncio.ensure_future(cache.get("tool", {}, call))
+        second = asyncio.ensure_future(cache.get("tool", {}, call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "ok"
+        assert len(calls) == 1
+
+    def test_ttl_env_override(self, monkeypatch):
+        monkeypatch.setenv("BONFIRE_MCP_CACHE_TTL", "0")
+
+        assert set(ResponseCache().ttls.values()) == {0.0}
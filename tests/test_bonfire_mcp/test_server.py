@@ -1,10 +1,18 @@
 """Tests for bonfire_mcp.server module — tool definitions and dispatch."""
 
+import asyncio
+import threading
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from bonfire_mcp.server import call_tool, list_tools, TOOLS
-from mcp.types import CallToolResult
+from bonfire_lib.async_client import AsyncEphemeralK8sClient
+from bonfire_lib.utils import FatalError
+import bonfire_mcp.server as server
+from bonfire_mcp.server import _send_progress, call_tool, list_tools, TOOLS
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import CallToolResult, RequestParams
 
 
 class TestToolDefinitions:
@@ -21,6 +29,7 @@ class TestToolDefinitions:
             "ephemeral_list_reservations",
             "ephemeral_describe",
             "ephemeral_get_kubeconfig",
+            "ephemeral_wait_for_cluster",
         }
 
     @pytest.mark.asyncio
@@ -55,7 +64,8 @@ class TestNamespaceToolDispatch:
     @pytest.fixture(autouse=True)
     def setup_mock_client(self):
         self.mock_client = MagicMock()
-        with patch("bonfire_mcp.server._get_client", return_value=self.mock_client):
+        async_client = AsyncEphemeralK8sClient(self.mock_client)
+        with patch("bonfire_mcp.server._get_client", AsyncMock(return_value=async_client)):
             yield
 
     @pytest.mark.asyncio
@@ -78,19 +88,75 @@ class TestNamespaceToolDispatch:
     @pytest.mark.asyncio
     async def test_list_pools_all(self):
         with patch("bonfire_mcp.server.pools") as mock_pools:
-            mock_pools.list_pools.return_value = [
-                {
-                    "name": "default",
-                    "ready": 3,
-                    "creating": 0,
-                    "reserved": 1,
-                    "size": 5,
-                    "size_limit": 10,
-                }
-            ]
-            mock_pools.list_cluster_pools.return_value = []
-            result = await call_tool("ephemeral_list_pools", {})
+            mock_pools.list_all_pools.return_value = {
+                "namespace_pools": [
+                    {
+                        "name": "default",
+                        "ready": 3,
+                        "creating": 0,
+                        "reserved": 1,
+                        "size": 5,
+                        "size_limit": 10,
+                    }
+                ],
+                "cluster_pools": [],
+            }
+            result = await call_tool("ephemeral_list_pools", {"type": "all"})
             assert "default" in result[0].text
+            mock_pools.list_all_pools.assert_called_once_with(self.mock_client)
+            mock_pools.list_pools.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_run_concurrently(self):
+        # describe blocks until list_pools runs, which deadlocks if calls are serialized
+        pools_listed = threading.Event()
+
+        def _describe(client, namespace):
+            assert pools_listed.wait(timeout=5)
+            return {"namespace": namespace}
+
+        def _list_pools(client):
+            pools_listed.set()
+            return []
+
+        with (
+            patch("bonfire_mcp.server.status") as mock_status,
+            patch("bonfire_mcp.server.pools") as mock_pools,
+            patch("bonfire_mcp.server.format_describe", side_effect=lambda r: r["namespace"]),
+        ):
+            mock_status.describe_namespace.side_effect = _describe
+            mock_pools.list_pools.side_effect = _list_pools
+            described, listed = await asyncio.gather(
+                call_tool("ephemeral_describe", {"namespace": "ephemeral-abc"}),
+                call_tool("ephemeral_list_pools", {"type": "namespace"}),
+            )
+        assert described[0].text == "ephemeral-abc"
+        assert "No namespace pools" in listed[0].text
+
+    @pytest.mark.asyncio
+    async def test_list_reservations_all(self):
+        with patch("bonfire_mcp.server.clusters") as mock_clusters:
+            mock_clusters.list_all_reservations.return_value = {
+                "namespace_reservations": [
+                    {
+                        "name": "bonfire-reservation-abc",
+                        "namespace": "ephemeral-abc",
+                        "state": "active",
+                        "expiration": "",
+                        "requester": "alice",
+                        "pool": "default",
+                        "duration": "1h",
+                    }
+                ],
+                "cluster_reservations": [],
+            }
+            result = await call_tool(
+                "ephemeral_list_reservations", {"type": "all", "requester": "alice"}
+            )
+            assert "ephemeral-abc" in result[0].text
+            mock_clusters.list_all_reservations.assert_called_once_with(
+                self.mock_client, requester="alice"
+            )
 
     @pytest.mark.asyncio
     async def test_reserve_namespace(self):
@@ -107,6 +173,46 @@ class TestNamespaceToolDispatch:
             assert "my-res" in result[0].text
             assert "ephemeral-xyz" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_reserve_namespace_count(self):
+        with patch("bonfire_mcp.server.reservations") as mock_res:
+            mock_res.reserve_many.return_value = [
+                {"name": f"res-{i}", "namespace": f"ephemeral-{i}", "state": "active"}
+                for i in range(2)
+            ]
+            result = await call_tool("ephemeral_reserve", {"count": 2})
+            assert "ephemeral-0" in result[0].text
+            assert "ephemeral-1" in result[0].text
+            assert mock_res.reserve_many.call_args.args == (self.mock_client, 2)
+            mock_res.reserve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reserve_routed_to_chosen_pool(self):
+        with (
+            patch("bonfire_mcp.server.reservations") as mock_res,
+            patch("bonfire_mcp.server.pools") as mock_pools,
+        ):
+            mock_pools.choose_pool.return_value = {
+                "name": "minimal",
+                "ready": 2,
+                "creating": 0,
+                "expected_wait": 10.0,
+            }
+            mock_res.reserve.return_value = {"name": "my-res", "namespace": "ephemeral-xyz"}
+            result = await call_tool("ephemeral_reserve", {"pools": ["default", "minimal"]})
+            assert "Routed to pool 'minimal'" in result[0].text
+            assert "expected wait: ~10s" in result[0].text
+            mock_pools.choose_pool.assert_called_once_with(
+                self.mock_client, ["default", "minimal"], count=1
+            )
+            assert mock_res.reserve.call_args.kwargs["pool"] == "minimal"
+
+    @pytest.mark.asyncio
+    async def test_reserve_count_with_name_rejected(self):
+        result = await call_tool("ephemeral_reserve", {"name": "my-res", "count": 2})
+        assert result.isError is True
+        assert "cannot be combined" in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_reserve_invalid_name(self):
         result = await call_tool("ephemeral_reserve", {"name": "INVALID_NAME"})
@@ -205,7 +311,8 @@ class TestClusterToolDispatch:
     @pytest.fixture(autouse=True)
     def setup_mock_client(self):
         self.mock_client = MagicMock()
-        with patch("bonfire_mcp.server._get_client", return_value=self.mock_client):
+        async_client = AsyncEphemeralK8sClient(self.mock_client)
+        with patch("bonfire_mcp.server._get_client", AsyncMock(return_value=async_client)):
             yield
 
     @pytest.mark.asyncio
@@ -343,6 +450,51 @@ class TestClusterToolDispatch:
             assert "apiVersion: v1" in result[0].text
             assert "my-rosa" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_wait_for_cluster(self):
+        updates = [
+            {"name": "my-rosa", "state": "provisioning", "kubeconfig_ready": False},
+            {
+                "name": "my-rosa",
+                "state": "active",
+                "cluster_name": "rosa-abc123",
+                "kubeconfig_ready": False,
+            },
+            {
+                "name": "my-rosa",
+                "state": "active",
+                "cluster_name": "rosa-abc123",
+                "kubeconfig_ready": True,
+            },
+        ]
+        with (
+            patch("bonfire_mcp.server.clusters") as mock_cl,
+            patch("bonfire_mcp.server._send_progress") as mock_progress,
+        ):
+            mock_cl.wait_for_cluster.return_value = iter(updates)
+            result = await call_tool(
+                "ephemeral_wait_for_cluster", {"name": "my-rosa", "timeout": 60}
+            )
+            mock_cl.wait_for_cluster.assert_called_once_with(
+                self.mock_client, "my-rosa", timeout=60
+            )
+            assert "rosa-abc123" in result[0].text
+            assert "Kubeconfig: ready" in result[0].text
+            assert [c.args[0] for c in mock_progress.call_args_list] == [1, 2, 3]
+            assert "provisioning" in mock_progress.call_args_list[0].args[1]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_cluster_timeout(self):
+        def _updates():
+            yield {"name": "my-rosa", "state": "waiting", "kubeconfig_ready": False}
+            raise TimeoutError("timed out after 60s waiting for cluster reservation 'my-rosa'")
+
+        with patch("bonfire_mcp.server.clusters") as mock_cl:
+            mock_cl.wait_for_cluster.return_value = _updates()
+            result = await call_tool("ephemeral_wait_for_cluster", {"name": "my-rosa"})
+            assert result.isError is True
+            assert "Timeout" in result.content[0].text
+
     @pytest.mark.asyncio
     async def test_list_pools_cluster(self):
         with patch("bonfire_mcp.server.pools") as mock_pools:
@@ -359,3 +511,196 @@ class TestClusterToolDispatch:
             result = await call_tool("ephemeral_list_pools", {"type": "cluster"})
             assert "rosa-default" in result[0].text
             assert "Cluster Pools" in result[0].text
+
+
+class TestSendProgress:
+    @pytest.mark.asyncio
+    async def test_sends_when_progress_token_given(self):
+        session = MagicMock()
+        session.send_progress_notification = AsyncMock()
+        ctx = RequestContext(
+            request_id=7,
+            meta=RequestParams.Meta(progressToken="tok"),
+            session=session,
+            lifespan_context=None,
+        )
+        token = request_ctx.set(ctx)
+        try:
+            await _send_progress(2, "provisioning")
+        finally:
+            request_ctx.reset(token)
+        session.send_progress_notification.assert_awaited_once_with(
+            "tok", 2, message="provisioning", related_request_id=7
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_progress_token(self):
+        session = MagicMock()
+        session.send_progress_notification = AsyncMock()
+        ctx = RequestContext(request_id=7, meta=None, session=session, lifespan_context=None)
+        token = request_ctx.set(ctx)
+        try:
+            await _send_progress(1, "waiting")
+        finally:
+            request_ctx.reset(token)
+        session.send_progress_notification.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_outside_request(self):
+        await _send_progress(1, "waiting")
+
+
+class TestLoadClient:
+    def test_informer_cache_disabled_by_default(self):
+        base = MagicMock()
+        with patch("bonfire_mcp.server.load_k8s_client", return_value=base):
+            assert server._load_client() is base
+
+    def test_informer_cache(self):
+        base = MagicMock()
+        with (
+            patch("bonfire_mcp.server.INFORMER_CACHE", True),
+            patch("bonfire_mcp.server.load_k8s_client", return_value=base),
+            patch("bonfire_mcp.server.CachedK8sClient") as cached_cls,
+        ):
+            client = server._load_client()
+
+        cached_cls.assert_called_once_with(base)
+        assert client is cached_cls.return_value.start.return_value
+
+    def test_informer_cache_failure_falls_back(self):
+        base = MagicMock()
+        with (
+            patch("bonfire_mcp.server.INFORMER_CACHE", True),
+            patch("bonfire_mcp.server.load_k8s_client", return_value=base),
+            patch("bonfire_mcp.server.CachedK8sClient") as cached_cls,
+        ):
+            cached_cls.return_value.start.side_effect = FatalError("unable to list")
+            assert server._load_client() is base
+
+
+class TestResponseCaching:
+    @pytest.fixture(autouse=True)
+    def setup_mock_client(self):
+        self.mock_client = MagicMock()
+        async_client = AsyncEphemeralK8sClient(self.mock_client)
+        with patch("bonfire_mcp.server._get_client", AsyncMock(return_value=async_client)):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_read_tool_cached(self, response_cache):
+        with patch("bonfire_mcp.server.pools") as mock_pools:
+            mock_pools.list_pools.return_value = []
+            await call_tool("ephemeral_list_pools", {"type": "namespace"})
+            await call_tool("ephemeral_list_pools", {"type": "namespace"})
+
+        mock_pools.list_pools.assert_called_once()
+        assert response_cache.stats()["ephemeral_list_pools"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mutating_tool_invalidates(self):
+        with (
+            patch("bonfire_mcp.server.pools") as mock_pools,
+            patch("bonfire_mcp.server.reservations") as mock_res,
+            patch("bonfire_mcp.server.format_release", return_value="released"),
+        ):
+            mock_pools.list_pools.return_value = []
+            await call_tool("ephemeral_list_pools", {"type": "namespace"})
+            await call_tool("ephemeral_release", {"namespace": "ephemeral-abc"})
+            await call_tool("ephemeral_list_pools", {"type": "namespace"})
+
+        mock_res.release.assert_called_once()
+        assert mock_pools.list_pools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_scoped_per_token(self):
+        with (
+            patch("bonfire_mcp.server.pools") as mock_pools,
+            patch("bonfire_mcp.server._request_token", side_effect=[None, "token-a", "token-a"]),
+        ):
+            mock_pools.list_pools.return_value = []
+            for _ in range(3):
+                await call_tool("ephemeral_list_pools", {"type": "namespace"})
+
+        assert mock_pools.list_pools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        with patch("bonfire_mcp.server.status") as mock_status:
+            mock_status.describe_namespace.side_effect = FatalError("boom")
+            first = await call_tool("ephemeral_describe", {"namespace": "ephemeral-abc"})
+            await call_tool("ephemeral_describe", {"namespace": "ephemeral-abc"})
+
+        assert first.isError
+        assert mock_status.describe_namespace.call_count == 2
+
+
+class TestHttpTransport:
+    HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+    def _initialize(self, http):
+        response = http.post(
+            "/mcp/",
+            headers=self.HEADERS,
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "test", "version": "1"},
+                },
+            },
+        )
+        assert response.status_code == 200
+        headers = dict(
+            self.HEADERS,
+            **{
+                "mcp-session-id": response.headers["mcp-session-id"],
+                "mcp-protocol-version": "2025-06-18",
+            },
+        )
+        http.post(
+            "/mcp/", headers=headers, json={"jsonrpc": "2.0", "method": "notifications/initialized"}
+        )
+        return headers
+
+    def _list_pools(self, http, headers):
+        with patch("bonfire_mcp.server.pools") as mock_pools:
+            mock_pools.list_pools.return_value = []
+            return http.post(
+                "/mcp/",
+                headers=headers,
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 2,
+                    "method": "tools/call",
+                    "params": {"name": "ephemeral_list_pools", "arguments": {"type": "namespace"}},
+                },
+            )
+
+    def test_bearer_token_uses_client_pool(self):
+        from starlette.testclient import TestClient
+
+        pool = MagicMock()
+        pool.get = AsyncMock(return_value=AsyncEphemeralK8sClient(MagicMock()))
+        with patch("bonfire_mcp.server._client_pool", pool), TestClient(server._http_app()) as http:
+            headers = self._initialize(http)
+            headers["Authorization"] = "Bearer caller-token"
+            response = self._list_pools(http, headers)
+
+        assert "No namespace pools found." in response.text
+        pool.get.assert_awaited_once_with("caller-token")
+
+    def test_token_required(self):
+        from starlette.testclient import TestClient
+
+        with (
+            patch("bonfire_mcp.server.REQUIRE_TOKEN", True),
+            TestClient(server._http_app()) as http,
+        ):
+            response = self._list_pools(http, self._initialize(http))
+
+        assert "Authorization: Bearer" in response.text
+        assert '"isError":true' in response.text
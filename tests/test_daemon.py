@@ -0,0 +1,199 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+from bonfire.daemon import (
+    DaemonServer,
+    _is_daemon_command,
+    daemon_key,
+    daemon_status,
+    run_in_daemon,
+    socket_path,
+    stop_daemon,
+)
+
+
+def _write_kubeconfig(path, context):
+    path.write_text(f"apiVersion: v1\nkind: Config\ncurrent-context: {context}\n")
+
+
+@pytest.fixture
+def daemon_env(monkeypatch, tmp_path):
+    # unix socket paths are limited to ~100 chars, tmp_path can be longer
+    runtime_dir = tempfile.mkdtemp(prefix="bf-")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", runtime_dir)
+    kubeconfig = tmp_path / "kubeconfig"
+    _write_kubeconfig(kubeconfig, "cluster-a")
+    monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+    monkeypatch.delenv("BONFIRE_USE_DAEMON", raising=False)
+    yield kubeconfig
+    shutil.rmtree(runtime_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def start_daemon(daemon_env):
+    servers = []
+
+    def _start(run):
+        server = DaemonServer(socket_path(), run, idle_timeout=10)
+        thread = threading.Thread(target=server.serve, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not daemon_status() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        servers.append(thread)
+        return server
+
+    yield _start
+    stop_daemon()
+    for thread in servers:
+        thread.join(timeout=5)
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (["daemon", "start"], True),
+        (["-n", "ns-1", "daemon", "stop"], True),
+        (["--debug", "daemon", "status"], True),
+        (["namespace", "list"], False),
+        (["-n", "daemon", "version"], False),
+        ([], False),
+    ],
+)
+def test_is_daemon_command(args, expected):
+    assert _is_daemon_command(args) is expected
+
+
+def test_no_daemon_runs_in_process(daemon_env):
+    assert run_in_daemon(["version"]) is None
+    assert daemon_status() is None
+    assert stop_daemon() is False
+
+
+def test_socket_isolated_by_context_and_config(daemon_env, monkeypatch):
+    path = socket_path()
+
+    _write_kubeconfig(daemon_env, "cluster-b")
+    assert socket_path() != path
+
+    _write_kubeconfig(daemon_env, "cluster-a")
+    monkeypatch.setenv("BONFIRE_NS_REQUESTER", "someone-else")
+    assert socket_path() != path
+
+    monkeypatch.delenv("BONFIRE_NS_REQUESTER")
+    monkeypatch.setenv("BONFIRE_USE_DAEMON", "true")
+    assert socket_path() == path
+    assert daemon_key()["context"] == "cluster-a"
+
+
+def test_run_in_daemon(start_daemon, capfd, monkeypatch, tmp_path):
+    calls = []
+
+    def run():
+        calls.append((list(sys.argv), os.getcwd(), os.environ.get("CALLER_VAR")))
+        print("output from daemon")
+        sys.exit(3)
+
+    start_daemon(run)
+    monkeypatch.setenv("CALLER_VAR", "from-caller")
+    monkeypatch.chdir(tmp_path)
+
+    assert run_in_daemon(["namespace", "list"]) == 3
+    assert calls == [(["bonfire", "namespace", "list"], str(tmp_path), "from-caller")]
+    assert "output from daemon" in capfd.readouterr().out
+    assert daemon_status()["commands"] == 1
+
+
+def test_daemon_commands_not_delegated(start_daemon):
+    start_daemon(lambda: None)
+
+    assert run_in_daemon(["daemon", "status"]) is None
+
+
+def test_disabled(start_daemon, monkeypatch):
+    start_daemon(lambda: None)
+    monkeypatch.setenv("BONFIRE_USE_DAEMON", "false")
+
+    assert run_in_daemon(["version"]) is None
+
+
+def test_unhandled_error_exit_code(start_daemon, capfd):
+    def run():
+        raise RuntimeError("boom")
+
+    start_daemon(run)
+
+    assert run_in_daemon(["version"]) == 1
+    assert "RuntimeError: boom" in capfd.readouterr().err
+
+
+def test_kubeconfig_change_resets_cluster_state(start_daemon, daemon_env, mocker):
+    reset = mocker.patch("bonfire.daemon._reset_cluster_state")
+    start_daemon(lambda: None)
+
+    run_in_daemon(["version"])
+    reset.assert_not_called()
+
+    # e.g. 'oc login' refreshing the token of the same context
+    _write_kubeconfig(daemon_env, "cluster-a")
+    os.utime(daemon_env, ns=(0, time.time_ns() + 10**9))
+    run_in_daemon(["version"])
+    reset.assert_called_once_with()
+
+
+def test_stop(start_daemon):
+    server = start_daemon(lambda: None)
+
+    assert stop_daemon() is True
+    deadline = time.monotonic() + 5
+    while server.path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not server.path.exists()
+    assert run_in_daemon(["version"]) is None
+
+
+def test_connection_checks_not_reused_across_commands(start_daemon, mocker, monkeypatch):
+    import requests
+
+    from bonfire import utils
+
+    head = mocker.patch("requests.Session").return_value.head
+    head.side_effect = requests.exceptions.Timeout("timed out!")
+
+    def run():
+        utils.preflight_url_connections(["https://flaky.com"])
+        try:
+            utils.check_url_connection("https://flaky.com")
+        except utils.FatalError:
+            sys.exit(1)
+
+    start_daemon(run)
+
+    assert run_in_daemon(["deploy"]) == 1
+    # a transient failure is not re-raised by the next command
+    head.side_effect = None
+    assert run_in_daemon(["deploy"]) == 0
+    assert head.call_count == 2
+
+    # successes are re-read from disk, so the TTL applies
+    monkeypatch.setattr(utils, "CONN_CHECK_TIME", 0)
+    assert run_in_daemon(["deploy"]) == 0
+    assert head.call_count == 3
+
+
+def test_pool_list_not_cached_across_commands(start_daemon, mocker):
+    from bonfire import openshift
+
+    get_json = mocker.patch("bonfire.openshift.get_json", return_value={"items": []})
+    start_daemon(openshift.get_namespace_pools)
+
+    run_in_daemon(["pool", "list"])
+    run_in_daemon(["pool", "list"])
+    openshift.get_namespace_pools.cache_clear()
+    assert get_json.call_count == 2
@@ -0,0 +1,153 @@
+import json
+import logging
+import threading
+from datetime import timedelta
+
+import pytest
+
+import bonfire.config as conf
+from bonfire.elastic_logging import AsyncElasticsearchHandler, ElasticLogger
+
+ES_URL = "https://es.example.com/search-bonfire/_bulk"
+
+
+@pytest.fixture
+def telemetry_enabled(monkeypatch):
+    monkeypatch.setattr(conf, "ENABLE_TELEMETRY", True)
+    monkeypatch.setattr(conf, "ELASTICSEARCH_APIKEY", "ApiKey secret")
+    monkeypatch.setattr(conf, "ELASTICSEARCH_HOST", "https://es.example.com/")
+    monkeypatch.setattr(conf, "TELEMETRY_FLUSH_TIMEOUT", 2)
+
+
+@pytest.fixture
+def session(mocker, telemetry_enabled):
+    session = mocker.patch("requests.Session").return_value
+    session.post.return_value.json.side_effect = lambda: {
+        "items": [{"index": {"status": 201}}] * _sent_count(session)
+    }
+    return session
+
+
+def _sent_count(session):
+    return len(_sent_docs(session.post.call_args))
+
+
+def _sent_docs(post_call):
+    lines = post_call.kwargs["data"].splitlines()
+    assert lines[::2] == ['{"index":{}}'] * (len(lines) // 2)
+    return [json.loads(line) for line in lines[1::2]]
+
+
+def _record(msg):
+    return logging.LogRecord("elasicsearch", logging.INFO, __file__, 1, msg, None, None)
+
+
+def test_records_sent_in_one_bulk_request(session, mocker):
+    handler = AsyncElasticsearchHandler(ES_URL)
+    # hold the worker until all records are queued
+    release = threading.Event()
+    mocker.patch("bonfire.elastic_logging.use_truststore", side_effect=release.wait)
+
+    for i in range(3):
+        handler.emit(_record(f"message {i}"))
+    release.set()
+    handler.close()
+
+    session.post.assert_called_once()
+    assert session.post.call_args.args == (ES_URL,)
+    assert [doc["log"] for doc in _sent_docs(session.post.call_args)] == [
+        "message 0",
+        "message 1",
+        "message 2",
+    ]
+    assert session.headers.update.call_args.args[0]["Authorization"] == "ApiKey secret"
+    assert handler.dropped == 0
+
+
+def test_metadata_snapshot(session):
+    handler = AsyncElasticsearchHandler(ES_URL)
+    handler.set_success_status(False)
+
+    handler.emit(_record("failed"))
+    handler.set_success_status(True)
+    handler.close()
+
+    metadata = _sent_docs(session.post.call_args)[0]["metadata"]
+    assert metadata["succeeded"] is False
+    assert metadata["dropped_records"] == 0
+    assert metadata["uuid"] == handler.metadata["uuid"]
+
+
+def test_full_queue_drops(session, mocker):
+    mocker.patch("bonfire.elastic_logging.QUEUE_SIZE", 2)
+    handler = AsyncElasticsearchHandler(ES_URL)
+    release = threading.Event()
+    mocker.patch("bonfire.elastic_logging.use_truststore", side_effect=release.wait)
+
+    for i in range(5):
+        handler.emit(_record(f"message {i}"))
+    release.set()
+    handler.close()
+
+    assert handler.dropped == 3
+    assert _sent_count(session) == 2
+
+
+def test_close_gives_up_at_deadline(session, monkeypatch):
+    monkeypatch.setattr(conf, "TELEMETRY_FLUSH_TIMEOUT", 0.1)
+    release = threading.Event()
+    session.post.side_effect = lambda *args, **kwargs: release.wait()
+    handler = AsyncElasticsearchHandler(ES_URL)
+
+    handler.emit(_record("stuck"))
+    handler.emit(_record("queued"))
+    handler.close()
+    release.set()
+
+    assert handler.dropped == 2
+    # emitted after close
+    handler.emit(_record("late"))
+    assert handler.dropped == 3
+
+
+def test_failed_and_rejected_records_counted(session):
+    session.post.return_value.json.side_effect = None
+    session.post.return_value.json.return_value = {
+        "errors": True,
+        "items": [{"index": {"status": 201}}, {"index": {"status": 400}}],
+    }
+    handler = AsyncElasticsearchHandler(ES_URL)
+
+    handler.send_to_es(session, [{"log": "a"}, {"log": "b"}])
+    assert handler.dropped == 1
+
+    session.post.side_effect = ConnectionError("unreachable")
+    handler.send_to_es(session, [{"log": "c"}, {"log": "d"}])
+    assert handler.dropped == 3
+
+
+def test_disabled_sends_nothing(session, monkeypatch):
+    monkeypatch.setattr(conf, "ENABLE_TELEMETRY", False)
+    handler = AsyncElasticsearchHandler(ES_URL)
+
+    handler.emit(_record("ignored"))
+    handler.close()
+
+    session.post.assert_not_called()
+    assert handler._worker is None
+
+
+def test_elapsed_time_counts_from_logger_creation(session):
+    es_logger = ElasticLogger()
+    es_logger.start_time -= timedelta(seconds=5)
+
+    es_logger.send_telemetry("done")
+    es_logger.es_handler.close()
+    assert _sent_docs(session.post.call_args)[0]["metadata"]["elapsed_sec"] >= 5
+
+    # a daemon restarts the clock for every command
+    es_logger.reset()
+    es_logger.send_telemetry("done")
+    es_logger.es_handler.close()
+    assert _sent_docs(session.post.call_args)[0]["metadata"]["elapsed_sec"] < 5
+    es_logger.reset()
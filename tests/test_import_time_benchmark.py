@@ -0,0 +1,107 @@
+"""Import time and cold start budgets for the bonfire CLI.
+
+Each measurement runs in a fresh interpreter so nothing is already in sys.modules. Budgets
+are in milliseconds and can be raised on slow machines with BONFIRE_IMPORT_BUDGET_MS and
+BONFIRE_COLD_START_BUDGET_MS.
+
+Deselected by default, run with: pytest -m benchmark -s tests/test_import_time_benchmark.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+IMPORT_BUDGET_MS = float(os.getenv("BONFIRE_IMPORT_BUDGET_MS", "400"))
+COLD_START_BUDGET_MS = float(os.getenv("BONFIRE_COLD_START_BUDGET_MS", "800"))
+REPEAT = 3
+
+# only loaded by the commands that talk to a cluster, app-interface or the network
+HEAVY_MODULES = ["ocviapy", "sh", "kubernetes", "bonfire_lib", "gql", "requests", "wait_for"]
+
+# commands that need none of HEAVY_MODULES
+LIGHT_COMMANDS = [
+    ["version"],
+    ["config", "list-aliases"],
+    ["--help"],
+]
+
+_RUN_CLI = """
+import json, sys
+args, modules = json.loads(sys.argv[1]), json.loads(sys.argv[2])
+sys.argv = ["bonfire"] + args
+from bonfire.bonfire import main_with_handler
+try:
+    main_with_handler()
+finally:
+    heavy = [m for m in modules if m in sys.modules]
+    sys.stderr.write("HEAVY_MODULES=" + json.dumps(heavy) + "\\n")
+"""
+
+
+@pytest.fixture
+def cli_env(tmp_path):
+    """Environment with a fresh version check so no command reaches out to pypi."""
+    config_dir = tmp_path / "config" / "bonfire"
+    config_dir.mkdir(parents=True)
+    config_dir.joinpath("lastvercheck").write_text(str(time.time()))
+    return {
+        **os.environ,
+        "XDG_CONFIG_HOME": str(tmp_path / "config"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        "BONFIRE_NS_REQUESTER": "benchmark",
+    }
+
+
+def _import_time_us(module, env):
+    """Cumulative import time of 'module' reported by 'python -X importtime'."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = [field.strip() for field in line.split(":", 1)[-1].split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise AssertionError(f"'{module}' missing from -X importtime output:\n{proc.stderr}")
+
+
+def _cold_start(args, env):
+    """Run the CLI in a new interpreter, returns (wall time in ms, heavy modules loaded)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _RUN_CLI, json.dumps(args), json.dumps(HEAVY_MODULES)],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    assert proc.returncode == 0, proc.stderr
+    marker = next(line for line in proc.stderr.splitlines() if line.startswith("HEAVY_MODULES="))
+    return elapsed_ms, json.loads(marker.split("=", 1)[1])
+
+
+def test_import_time(cli_env):
+    import_ms = min(_import_time_us("bonfire.bonfire", cli_env) for _ in range(REPEAT)) / 1000
+    print(f"\nimport bonfire.bonfire: {import_ms:.1f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)")
+    assert import_ms < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize("args", LIGHT_COMMANDS, ids=" ".join)
+def test_cold_start(cli_env, args):
+    runs = [_cold_start(args, cli_env) for _ in range(REPEAT)]
+    cold_start_ms = min(elapsed_ms for elapsed_ms, _ in runs)
+    print(
+        f"\nbonfire {' '.join(args)}: {cold_start_ms:.1f}ms (budget {COLD_START_BUDGET_MS:.0f}ms)"
+    )
+    assert runs[0][1] == [], f"'bonfire {' '.join(args)}' imported {runs[0][1]}"
+    assert cold_start_ms < COLD_START_BUDGET_MS
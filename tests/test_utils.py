@@ -85,7 +85,7 @@ def test_url_connection_raises_on_invalid_url():
 
 
 def test_url_connection_checks_hostname(mocker):
-    session_mock = mocker.patch("bonfire.utils.requests.Session")
+    session_mock = mocker.patch("requests.Session")
     head_mock = mocker.MagicMock()
     session_mock.return_value.head = head_mock
     check_url_connection("https://validhost.com")
@@ -95,7 +95,7 @@ def test_url_connection_checks_hostname(mocker):
 def test_url_connection_timeout_handling(mocker):
     import requests as req
 
-    session_mock = mocker.patch("bonfire.utils.requests.Session")
+    session_mock = mocker.patch("requests.Session")
     head_mock = mocker.MagicMock()
     head_mock.side_effect = req.exceptions.Timeout("timed out!")
     session_mock.return_value.head = head_mock
@@ -114,6 +114,78 @@ def test_url_connection_dns_lookup_fails():
         check_url_connection("https://baddomain.invalid")
 
 
+def test_url_connection_check_reused_from_disk(mocker):
+    import bonfire.utils
+
+    session_mock = mocker.patch("requests.Session")
+    check_url_connection("https://validhost.com")
+    assert session_mock.return_value.head.call_count == 1
+
+    # simulate a new bonfire invocation, the result should be loaded from disk
+    mocker.patch("bonfire.utils._connection_check_cache", set())
+    mocker.patch.object(bonfire.utils, "_connection_check_cache_loaded", False)
+    check_url_connection("https://validhost.com")
+    assert session_mock.return_value.head.call_count == 1
+
+
+def test_url_connection_check_on_disk_expires(mocker):
+    import bonfire.utils
+
+    session_mock = mocker.patch("requests.Session")
+    check_url_connection("https://validhost.com")
+
+    mocker.patch("bonfire.utils._connection_check_cache", set())
+    mocker.patch.object(bonfire.utils, "_connection_check_cache_loaded", False)
+    mocker.patch("bonfire.utils.CONN_CHECK_TIME", 0)
+    check_url_connection("https://validhost.com")
+    assert session_mock.return_value.head.call_count == 2
+
+
+def test_preflight_url_connections_checks_hosts_once(mocker):
+    from bonfire.utils import preflight_url_connections
+
+    session_mock = mocker.patch("requests.Session")
+    preflight_url_connections(
+        ["https://hosta.com/some/path", "https://hosta.com/other", "https://hostb.com:8443"]
+    )
+    check_url_connection("https://hosta.com")
+    check_url_connection("https://hostb.com:8443")
+
+    called_urls = sorted(c.args[0] for c in session_mock.return_value.head.call_args_list)
+    assert called_urls == ["http://hostb.com:8443", "https://hosta.com:443"]
+
+
+def test_preflight_url_connections_error_raised_on_use(mocker):
+    import requests as req
+    from bonfire.utils import preflight_url_connections
+
+    session_mock = mocker.patch("requests.Session")
+    session_mock.return_value.head.side_effect = req.exceptions.Timeout("timed out!")
+
+    # failures are not raised by the preflight itself
+    preflight_url_connections(["https://timingout.com"])
+
+    with pytest.raises(FatalError, match=r"Connect to.*failed after.*sec.*is VPN needed.*"):
+        check_url_connection("https://timingout.com")
+
+
+def test_preflight_url_connections_failure_not_cached(mocker):
+    import requests as req
+    from bonfire.utils import preflight_url_connections
+
+    session_mock = mocker.patch("requests.Session")
+    session_mock.return_value.head.side_effect = req.exceptions.Timeout("timed out!")
+    preflight_url_connections(["https://flaky.com"])
+    with pytest.raises(FatalError):
+        check_url_connection("https://flaky.com")
+
+    # the host recovered, neither a new preflight nor a direct check re-raise the old error
+    session_mock.return_value.head.side_effect = None
+    preflight_url_connections(["https://flaky.com"])
+    check_url_connection("https://flaky.com")
+    assert session_mock.return_value.head.call_count == 2
+
+
 def test_check_version_when_there_is_a_new_update(requests_mock, mocker):
     mocker.patch("bonfire.utils.Path").exists.return_value = False
     log_mock = mocker.patch("bonfire.utils.log")